@@ -69,6 +69,20 @@ from . import decorators, utils
 # Now overwriting
 from ._plot import *
 from .decorators import mpl_decorator, MatplotlibDecorator
+from ._triangulation import (
+    triangulation,
+    register_triangulation,
+    SharedTriangulation,
+)
+from ._graph import FigureGraph, render
+from ._instrument import (
+    instrumentation,
+    start_instrumentation,
+    stop_instrumentation,
+    call_stats,
+    reset_call_stats,
+    export_call_stats,
+)
 
 # explicitly import here
 from ._figure import (
@@ -98,6 +112,14 @@ from ._figure import (
     close,
     closefig,
     save_and_close,
+    rasterize_heavy,
+    set_rasterize_policy,
+    get_rasterize_policy,
+    MultipagePDF,
+    set_figure_limits,
+    get_figure_limits,
+    leaked_figures,
+    report_leaks,
 )
 
 
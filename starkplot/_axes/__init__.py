@@ -39,3 +39,10 @@ from ._axes_properties import (
     get_yscale,
     set_yscale,
 )
+
+from ._legend import (
+    LegendRegistry,
+    DeferredLegend,
+    legend_registry,
+    register_legend_handles,
+)
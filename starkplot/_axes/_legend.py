@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _legend
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""incremental, axes-level legend registry
+
+ax.get_legend_handles_labels walks every artist on the axes, so
+rebuilding the legend after each of N plot calls costs O(N^2).
+Instead, the registry only looks at the artists added since it was
+last updated, and the axes gets a DeferredLegend, a matplotlib Legend
+whose entries are remade when the figure is drawn (or saved), and only
+if more handles were registered since.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "LegendRegistry",
+    "DeferredLegend",
+    "legend_registry",
+    "register_legend_handles",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+
+# matplotlib
+from matplotlib.legend import Legend
+
+
+##############################################################################
+### Info
+
+# attribute under which an axes stores its LegendRegistry
+_registry_attr = "_starkplot_legend_registry"
+
+# where an axes keeps its legend handles, in matplotlib's order
+_handle_lists = ("lines", "patches", "collections", "containers")
+
+
+##############################################################################
+### Registry
+
+
+class LegendRegistry(object):
+    """the labeled handles of an axes, in the order they were plotted
+
+    Parameters
+    ----------
+    ax : Axes
+    """
+
+    __slots__ = ("ax", "handles", "labels", "kw", "dirty", "_seen", "_ids")
+
+    def __init__(self, ax):
+        self.ax = ax
+        self.handles = []
+        self.labels = []
+        self.kw = {}
+        self.dirty = False
+
+        # (number, last) of each list's artists already looked at
+        self._seen = ((0, None),) * len(_handle_lists)
+        self._ids = set()
+
+    # /def
+
+    def update(self):
+        """register the labeled artists added to the axes since last time
+
+        Returns
+        -------
+        n : int
+            the number of newly registered handles
+        """
+        handler_map = Legend.get_default_handler_map()
+        seen = []
+        n = 0
+        for name, (start, last) in zip(_handle_lists, self._seen):
+            artists = getattr(self.ax, name)
+            if start and (
+                len(artists) < start or artists[start - 1] is not last
+            ):  # some were removed, so rescan
+                self._prune()
+                start = 0
+            seen.append((len(artists), artists[-1] if artists else None))
+
+            for artist in artists[start:]:
+                if id(artist) in self._ids:
+                    continue
+                label = artist.get_label()
+                if not label or label.startswith("_"):
+                    continue
+                if Legend.get_legend_handler(handler_map, artist) is None:
+                    continue
+                self.handles.append(artist)
+                self.labels.append(label)
+                self._ids.add(id(artist))
+                n += 1
+
+        self._seen = tuple(seen)
+        self.dirty |= n > 0
+
+        return n
+
+    # /def
+
+    def _on_axes(self):
+        """the ids of the artists on the axes, which may be handles
+
+        removed artists may keep their axes (ex: after ax.cla), so are
+        found by the axes' lists
+        """
+        return {
+            id(artist)
+            for name in _handle_lists
+            for artist in getattr(self.ax, name)
+        }
+
+    # /def
+
+    def _prune(self):
+        """forget handles which were removed from the axes"""
+        on_axes = self._on_axes()
+        keep = [
+            i
+            for i, handle in enumerate(self.handles)
+            if id(handle) in on_axes
+        ]
+        self._ids = {id(self.handles[i]) for i in keep}
+        self.handles = [self.handles[i] for i in keep]
+        self.labels = [self.labels[i] for i in keep]
+        self.dirty = True
+
+    # /def
+
+    def handles_labels(self):
+        """the registered handles still on the axes, and their labels"""
+        on_axes = self._on_axes()
+        handles, labels = [], []
+        for handle, label in zip(self.handles, self.labels):
+            if id(handle) not in on_axes:  # removed
+                continue
+            handles.append(handle)
+            labels.append(label)
+        return handles, labels
+
+    # /def
+
+# /class
+
+
+# --------------------------------------------------------------------------
+
+
+class DeferredLegend(Legend):
+    """an axes legend of the handles of a LegendRegistry
+
+    A matplotlib Legend, whose entries are remade when it is drawn or
+    measured, or its texts, lines, patches or children are got, if
+    handles were registered since. Its own settings, as the title,
+    frame & location, are kept.
+
+    Parameters
+    ----------
+    registry : LegendRegistry
+    **kw : Legend arguments
+    """
+
+    def __init__(self, registry, **kw):
+        handles, labels = registry.handles_labels()
+        registry.dirty = False
+        self._registry = registry
+        self._markerfirst = kw.get("markerfirst", True)
+        super().__init__(registry.ax, handles, labels, **kw)
+
+    # /def
+
+    def _update_entries(self):
+        """remake the entries, if handles were registered since"""
+        if not self._registry.dirty:
+            return
+        handles, labels = self._registry.handles_labels()
+        self._registry.dirty = False
+
+        title, default = self.get_title(), self._loc_used_default
+        self._init_legend_box(handles, labels, self._markerfirst)
+        self._set_loc(self._loc)  # places the new entries
+        self._loc_used_default = default
+        self.set_title(title.get_text())
+        self.get_title().update_from(title)
+        if self._draggable is not None:
+            self._draggable.offsetbox = self._legend_box
+
+    # /def
+
+    def draw(self, renderer):
+        self._update_entries()
+        super().draw(renderer)
+
+    # /def
+
+    def get_window_extent(self, renderer=None):
+        self._update_entries()
+        return super().get_window_extent(renderer)
+
+    # /def
+
+    def get_tightbbox(self, renderer):
+        self._update_entries()
+        return super().get_tightbbox(renderer)
+
+    # /def
+
+    def get_children(self):
+        self._update_entries()
+        return super().get_children()
+
+    # /def
+
+    def get_texts(self):
+        self._update_entries()
+        return super().get_texts()
+
+    # /def
+
+    def get_lines(self):
+        self._update_entries()
+        return super().get_lines()
+
+    # /def
+
+    def get_patches(self):
+        self._update_entries()
+        return super().get_patches()
+
+    # /def
+
+
+# /class
+
+
+##############################################################################
+### Functions
+
+
+def _differ(old, new):
+    """whether two legend arguments differ, arrays by identity"""
+    try:
+        return bool(old != new)
+    except ValueError:  # arrays
+        return old is not new
+
+
+# /def
+
+
+def legend_registry(ax):
+    """get (or make) the LegendRegistry of an axes"""
+    registry = getattr(ax, _registry_attr, None)
+    if registry is None:
+        registry = LegendRegistry(ax)
+        setattr(ax, _registry_attr, registry)
+    return registry
+
+
+# /def
+
+
+def register_legend_handles(ax, **kw):
+    """register the artists added to an axes since the last registration
+
+    the axes' legend becomes a DeferredLegend of all registered handles,
+    made again only if the arguments change
+
+    Parameters
+    ----------
+    ax : Axes
+    **kw : ax.legend arguments
+        update those of earlier calls
+
+    Returns
+    -------
+    legend : DeferredLegend, None
+        None if there are no registered handles
+    """
+    registry = legend_registry(ax)
+    registry.update()
+
+    changed = any(
+        k not in registry.kw or _differ(registry.kw[k], v)
+        for k, v in kw.items()
+    )
+    registry.kw.update(kw)
+
+    if not registry.handles:
+        return None
+
+    legend = ax.legend_
+    if (
+        changed
+        or not isinstance(legend, DeferredLegend)
+        or legend._registry is not registry
+    ):
+        ax.legend_ = DeferredLegend(registry, **registry.kw)
+        ax.legend_._remove_method = ax._remove_legend
+    ax.stale = True
+
+    return ax.legend_
+
+
+# /def
+
+##############################################################################
+# END
@@ -0,0 +1,602 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _datafile
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""chunked, column-projected data files, for plotfile
+
+matplotlib's plotfile parses the whole CSV file, every column, into a
+record array before plotting. Instead, a DataFile reads only the
+plotted columns, a chunk of rows at a time: CSV (and .gz) files are
+parsed in blocks of lines, .npy files are memory-mapped, and .npz
+files only load the plotted arrays. The chunks are reduced as they are
+read, so no column is held whole:
+
+    lines : to the min & max point of each of about *width* runs of
+        rows, the envelope the line would be drawn with
+    hist : binned by the histogram engine
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = ["DataFile", "EnvelopeReducer", "plotfile", "use_engine"]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import csv
+import gzip
+import math
+import os
+from itertools import islice
+from numbers import Number
+
+import numpy as np
+
+# matplotlib
+from matplotlib import pyplot
+
+## Project-Specific
+from . import _histogram
+
+
+##############################################################################
+### Info
+
+# CSV lines parsed per chunk
+_chunklines = 2 ** 16
+
+# rows of binary files per chunk
+_chunksize = 2 ** 20
+
+# CSV files of at least this many bytes use the engine by default
+_engine_threshold = 2 ** 26
+
+# plot functions whose columns are reduced to their envelope
+_line_funcs = ("plot", "semilogx", "semilogy", "loglog", "step")
+
+# header characters removed by matplotlib's CSV reader
+_delete = set(r"""~!@#$%^&*()-=+~\|}[]{';: /?.>,<"""'"')
+
+# header names clashing with builtins, as matplotlib's CSV reader
+_renamed = {"return": "return_", "file": "file_", "print": "print_"}
+
+
+##############################################################################
+### Reader
+
+
+def _header_names(headers):
+    """column names from a header row, as matplotlib's CSV reader"""
+    names, seen = [], {}
+    for i, item in enumerate(headers):
+        item = item.strip().lower().replace(" ", "_")
+        item = "".join(c for c in item if c not in _delete)
+        item = _renamed.get(item, item or f"column{i}")
+        cnt = seen.get(item, 0)
+        names.append(item + f"_{cnt}" if cnt else item)
+        seen[item] = cnt + 1
+    return names
+
+
+# /def
+
+
+def _float(s):
+    """a CSV field as a float, missing fields as NaN"""
+    s = s.strip()
+    return float(s) if s else np.nan
+
+
+# /def
+
+
+class DataFile(object):
+    """the columns of a CSV, .npy or .npz file, read a chunk at a time
+
+    Parameters
+    ----------
+    fname : str or path-like
+        .npy and .npz files are binary, others are CSV (.gz for gzipped)
+    comments, skiprows, delimiter, names :
+        for CSV files, see plotfile. *names* are also used to name the
+        columns of unstructured 2D .npy arrays
+    chunksize : int, None
+        rows per chunk, default for the file type
+
+    Raises
+    ------
+    ValueError
+        if a CSV file has no header or data
+    """
+
+    def __init__(
+        self,
+        fname,
+        comments="#",
+        skiprows=0,
+        delimiter=",",
+        names=None,
+        chunksize=None,
+    ):
+        self.fname = os.fspath(fname)
+        self.comments = comments
+        self.skiprows = skiprows
+        self.delimiter = None if str(delimiter) == " " else str(delimiter)
+        self.kind = os.path.splitext(self.fname)[1].lower()
+        self.nrows = None
+
+        if isinstance(names, str):
+            names = [n.strip() for n in names.split(",")]
+
+        if self.kind == ".npy":
+            self._data = np.load(self.fname, mmap_mode="r")
+            self.nrows = len(self._data)
+            if self._data.dtype.names is not None:
+                names = list(self._data.dtype.names)
+            elif names is None:
+                ncols = 1 if self._data.ndim == 1 else self._data.shape[1]
+                names = [f"column{i}" for i in range(ncols)]
+        elif self.kind == ".npz":
+            self._data = np.load(self.fname)
+            names = list(self._data.files)
+        else:
+            self.kind = ".csv"
+            self._data = None
+            self._header = names is None
+            if names is None:
+                with self._open() as fh:
+                    header = next(self._rows(fh), None)
+                if header is None:
+                    raise ValueError("Could not find a header in CSV file")
+                if self.delimiter is None:
+                    header = header.split()
+                else:
+                    reader = csv.reader([header], delimiter=self.delimiter)
+                    header = next(reader)
+                names = _header_names(header)
+
+        self.names = list(names)
+        self.chunksize = chunksize or (
+            _chunklines if self.kind == ".csv" else _chunksize
+        )
+
+    # /def
+
+    def _open(self):
+        if self.fname.endswith(".gz"):
+            return gzip.open(self.fname, "rt")
+        return open(self.fname, "r")
+
+    # /def
+
+    def _rows(self, fh):
+        """the non-comment, non-empty lines after *skiprows*"""
+        comments = self.comments
+        for line in islice(fh, self.skiprows, None):
+            if not line.strip():
+                continue
+            if comments is not None and line.lstrip().startswith(comments):
+                continue
+            yield line
+
+    # /def
+
+    def column(self, identifier):
+        """the (name, index) of a column, by name or index"""
+        if isinstance(identifier, str):
+            if identifier not in self.names:
+                raise KeyError(f"no column {identifier!r} in {self.fname}")
+            return identifier, self.names.index(identifier)
+        elif isinstance(identifier, Number):
+            index = int(identifier)
+            return self.names[index], index
+        raise TypeError("identifier must be a string or integer")
+
+    # /def
+
+    def chunks(self, cols):
+        """chunks of the columns
+
+        Parameters
+        ----------
+        cols : sequence of str or int
+            names or indices
+
+        Yields
+        ------
+        chunk : tuple of ndarray
+            one array per column
+        """
+        names, idx = zip(*(self.column(c) for c in cols))
+
+        if self.kind == ".csv":
+            yield from self._csv_chunks(idx)
+            return
+
+        if self.kind == ".npz":
+            arrs = [np.ravel(self._data[name]) for name in names]
+        elif self._data.dtype.names is not None:
+            arrs = [self._data[name] for name in names]
+        elif self._data.ndim == 1:
+            arrs = [self._data for _ in idx]
+        else:
+            arrs = [self._data[:, i] for i in idx]
+
+        n = len(arrs[0])
+        for i in range(0, n, self.chunksize):
+            yield tuple(np.asarray(a[i : i + self.chunksize]) for a in arrs)
+
+    # /def
+
+    def _csv_chunks(self, idx):
+        """parse blocks of lines, only the columns at *idx*"""
+        usecols = sorted(set(idx))
+        order = [usecols.index(i) for i in idx]
+        converters = {i: _float for i in usecols}
+
+        with self._open() as fh:
+            rows = self._rows(fh)
+            if self._header:
+                next(rows, None)
+
+            while True:
+                lines = list(islice(rows, self.chunksize))
+                if not lines:
+                    break
+                try:  # fast path, no missing values
+                    block = np.loadtxt(
+                        lines,
+                        delimiter=self.delimiter,
+                        usecols=usecols,
+                        ndmin=2,
+                        comments=None,
+                    )
+                except ValueError:
+                    block = np.loadtxt(
+                        lines,
+                        delimiter=self.delimiter,
+                        usecols=usecols,
+                        ndmin=2,
+                        comments=None,
+                        converters=converters,
+                    )
+                yield tuple(block[:, i] for i in order)
+
+    # /def
+
+    def read(self, cols):
+        """the whole columns, see chunks"""
+        chunks = list(self.chunks(cols))
+        if not chunks:
+            return tuple(np.array([]) for _ in cols)
+        return tuple(np.concatenate(c) for c in zip(*chunks))
+
+    # /def
+
+    def check(self, cols):
+        """parse the first chunk of the columns, raising any errors"""
+        next(self.chunks(cols), None)
+
+    # /def
+
+
+# /class
+
+
+##############################################################################
+### Reduction
+
+
+def _run_extrema(y, group):
+    """per run of *group* rows: the indices of the first, min, max & last"""
+    nan = np.isnan(y)
+    n = len(y) // group * group
+    starts = np.arange(0, len(y), group)
+
+    res = [starts]
+    for arg, fill in ((np.argmin, np.inf), (np.argmax, -np.inf)):
+        yy = np.where(nan, fill, y)
+        idx = [arg(yy[:n].reshape(-1, group), axis=1)] if n else []
+        if n < len(y):  # a shorter last run
+            idx.append([arg(yy[n:])])
+        idx = np.concatenate(idx) if idx else np.array([], dtype=int)
+        res.append(starts + idx)
+    res.append(np.minimum(starts + group, len(y)) - 1)
+
+    return res
+
+
+# /def
+
+
+class EnvelopeReducer(object):
+    """a line, reduced to the first, min, max & last points of runs of rows
+
+    Drawing the kept points in order looks the same as the whole line,
+    when a run is no wider than a pixel. If there are more than 2 *
+    *width* runs, adjacent runs are merged, so memory is bounded for data
+    of unknown length.
+
+    Parameters
+    ----------
+    width : int
+        the number of runs to reduce to
+    nrows : int, None
+        the number of rows, if known, so runs need not be merged
+    """
+
+    _keys = ("first", "min", "max", "last")
+
+    def __init__(self, width, nrows=None):
+        self.width = max(int(width), 1)
+        self.group = 1 if nrows is None else math.ceil(nrows / self.width)
+        self.group = max(self.group, 1)
+        # per key: lists of the (x, y, row) of each run
+        self._runs = {k: ([], [], []) for k in self._keys}
+        self._nruns = 0
+        self._offset = 0
+
+    # /def
+
+    def add(self, x, y):
+        """reduce a chunk of the line"""
+        for key, idx in zip(self._keys, _run_extrema(y, self.group)):
+            for store, value in zip(
+                self._runs[key], (x[idx], y[idx], idx + self._offset)
+            ):
+                store.append(value)
+            nruns = len(idx)
+        self._nruns += nruns
+        self._offset += len(y)
+
+        while self._nruns > 2 * self.width:
+            self._merge()
+
+    # /def
+
+    def _arrays(self):
+        return {
+            k: tuple(np.concatenate(s) for s in stores)
+            for k, stores in self._runs.items()
+        }
+
+    # /def
+
+    def _merge(self):
+        """merge pairs of runs, doubling the run length"""
+        runs = self._arrays()
+        n = self._nruns // 2 * 2
+
+        ymin, ymax = runs["min"][1], runs["max"][1]
+        lo = np.fmin(ymin[:n:2], ymin[1:n:2]) == ymin[:n:2]
+        hi = np.fmax(ymax[:n:2], ymax[1:n:2]) == ymax[:n:2]
+        take_first = {"first": True, "min": lo, "max": hi, "last": False}
+
+        for key, values in runs.items():
+            self._runs[key] = tuple(
+                [np.r_[np.where(take_first[key], v[:n:2], v[1:n:2]), v[n:]]]
+                for v in values
+            )
+        self._nruns = len(runs["first"][0][:n:2]) + self._nruns - n
+        self.group *= 2
+
+    # /def
+
+    def result(self):
+        """the kept points, (x, y), in row order"""
+        if not self._nruns:
+            return np.array([]), np.array([])
+        runs = self._arrays()
+        x, y, rows = (
+            np.concatenate([runs[k][i] for k in self._keys]) for i in range(3)
+        )
+        rows, idx = np.unique(rows, return_index=True)  # sorted
+        return x[idx], y[idx]
+
+    # /def
+
+
+# /class
+
+
+##############################################################################
+### Plotting
+
+
+def use_engine(fname, engine=None):
+    """whether plotfile should use the DataFile engine
+
+    Parameters
+    ----------
+    fname : str or path-like, or file handle
+    engine : bool, None
+        None: for .npy & .npz files, and CSV files above a size threshold
+
+    Returns
+    -------
+    bool
+    """
+    if not isinstance(fname, (str, os.PathLike)):
+        return False
+    if engine is not None:
+        return bool(engine)
+    fname = os.fspath(fname)
+    if fname.lower().endswith((".npy", ".npz")):
+        return True
+    try:
+        return os.path.getsize(fname) >= _engine_threshold
+    except OSError:
+        return False
+
+
+# /def
+
+
+def _width(ax):
+    return max(int(math.ceil(ax.get_window_extent().width)), 1)
+
+
+# /def
+
+
+def plotfile(
+    fname,
+    cols=(0,),
+    plotfuncs=None,
+    comments="#",
+    skiprows=0,
+    checkrows=0,
+    delimiter=",",
+    names=None,
+    subplots=True,
+    newfig=True,
+    width=None,
+    chunksize=None,
+    **kwargs
+):
+    """pyplot.plotfile, reading only the plotted columns, in chunks
+
+    The columns of line plots (plot, semilogx, semilogy, loglog, step)
+    are reduced to their envelope at *width*, and single-column hists
+    are binned by the histogram engine. Other plot functions get the
+    whole columns. CSV columns must be numeric.
+
+    Parameters
+    ----------
+    width : int, None
+        the number of runs of rows each line is reduced to.
+        default: the width of the axes, in pixels
+    chunksize : int, None
+        rows per chunk, see DataFile
+    checkrows :
+        unused, all rows are parsed as floats
+    others :
+        see pyplot.plotfile
+
+    Raises
+    ------
+    ValueError
+        if a column cannot be parsed, before anything is drawn
+    """
+    if len(cols) < 1:
+        raise ValueError("must have at least one column of data")
+    if plotfuncs is None:
+        plotfuncs = {}
+
+    data = DataFile(
+        fname,
+        comments=comments,
+        skiprows=skiprows,
+        delimiter=delimiter,
+        names=names,
+        chunksize=chunksize,
+    )
+    data.check(cols)
+
+    fig = pyplot.figure() if newfig else pyplot.gcf()
+    xname = data.column(cols[0])[0]
+
+    if len(cols) == 1:
+        ax = fig.add_subplot(1, 1, 1)
+        funcname = plotfuncs.get(cols[0], "plot")
+        func = getattr(ax, funcname)
+
+        if funcname in _line_funcs:
+            reducer = EnvelopeReducer(width or _width(ax), data.nrows)
+            n = 0
+            for (x,) in data.chunks(cols):
+                reducer.add(np.arange(n, n + len(x)), x)
+                n += len(x)
+            func(*reducer.result(), **kwargs)
+        elif funcname == "hist":
+            x = data._data if data.kind == ".npy" else None
+            if x is None or x.dtype.names is not None or x.ndim != 1:
+                x = (c[0] for c in data.chunks(cols))
+                if np.ndim(kwargs.get("bins", 10)) == 0:
+                    kwargs.setdefault("range", _range(data, cols))
+            _histogram.hist(ax, x, **kwargs)
+        else:
+            func(*data.read(cols), **kwargs)
+        ax.set_ylabel(xname)
+
+    else:
+        N = len(cols)
+        axes, funcs = [], []
+        for i in range(1, N):
+            if subplots:
+                if i == 1:
+                    ax = ax1 = fig.add_subplot(N - 1, 1, i)
+                else:
+                    ax = fig.add_subplot(N - 1, 1, i, sharex=ax1)
+            elif i == 1:
+                ax = fig.add_subplot(1, 1, 1)
+            axes.append(ax)
+            funcs.append(plotfuncs.get(cols[i], "plot"))
+
+        # one pass over the file, for all columns
+        reducers = [
+            EnvelopeReducer(width or _width(ax), data.nrows)
+            if funcname in _line_funcs
+            else None
+            for ax, funcname in zip(axes, funcs)
+        ]
+        whole = [[] for _ in reducers]
+        for x, *ys in data.chunks(cols):
+            for y, reducer, parts in zip(ys, reducers, whole):
+                if reducer is not None:
+                    reducer.add(x, y)
+                else:
+                    parts.append((x, y))
+
+        ynamelist = []
+        for i, (ax, funcname, reducer, parts) in enumerate(
+            zip(axes, funcs, reducers, whole), start=1
+        ):
+            yname = data.column(cols[i])[0]
+            ynamelist.append(yname)
+
+            if reducer is not None:
+                x, y = reducer.result()
+            elif parts:
+                x, y = (np.concatenate(p) for p in zip(*parts))
+            else:
+                x, y = np.array([]), np.array([])
+            getattr(ax, funcname)(x, y, **kwargs)
+
+            if subplots:
+                ax.set_ylabel(yname)
+            if ax.is_last_row():
+                ax.set_xlabel(xname)
+            else:
+                ax.set_xlabel("")
+
+        if not subplots:
+            ax.legend(ynamelist)
+
+    if xname == "date":
+        fig.autofmt_xdate()
+
+
+# /def
+
+
+def _range(data, cols):
+    """the finite (min, max) of a column, for binning chunks"""
+    lims = _histogram._finite_range(c[:1] for c in data.chunks(cols))
+    return lims[0] if lims else (0.0, 1.0)
+
+
+# /def
+
+##############################################################################
+# END
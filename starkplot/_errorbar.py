@@ -0,0 +1,437 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _errorbar
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""fast errorbars for many points
+
+matplotlib's errorbar builds its segments and caps point by point, in
+Python lists. Here the segments are one (N, 2, 2) array per direction,
+each in one LineCollection, and the caps one Line2D per direction.
+
+Points which fall in the same output pixel (consecutive points, if they
+are joined by a line) are merged first: one point, with an error bar
+spanning all of theirs. So the drawn artists scale with the axes size,
+not the data. The pixels are those of the axes' view when plotted.
+
+The y errors can instead be drawn as a band, with fill_between,
+optionally binned in x.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "errorbar",
+    "error_bounds",
+    "use_fast",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import math
+
+import numpy as np
+
+# matplotlib
+from matplotlib import rcParams, cbook
+from matplotlib import lines as mlines
+from matplotlib.axes._base import _process_plot_format
+from matplotlib.collections import LineCollection
+from matplotlib.container import ErrorbarContainer
+
+
+##############################################################################
+### Info
+
+# the number of points above which errorbars are fast by default
+_fast_threshold = 10000
+
+# the opacity of error bands
+_band_alpha = 0.3
+
+# linestyles which don't join the points
+_no_lines = ("None", "none", " ", "")
+
+# errorbar limit arguments, which the fast errorbars don't support
+_limits = ("lolims", "uplims", "xlolims", "xuplims")
+
+
+##############################################################################
+### Errors
+
+
+def _filled(values):
+    """values as a float array, with masked values as NaN"""
+    return np.ma.filled(np.ma.asarray(values, dtype=float), np.nan)
+
+
+# /def
+
+
+def error_bounds(values, err):
+    """the lower & upper bounds of values +/- errors
+
+    Parameters
+    ----------
+    values : ndarray
+        (N,)
+    err : float or array-like
+        scalar, (N,), or (2, N) for asymmetric (lower, upper) errors.
+        masked errors are NaN
+
+    Returns
+    -------
+    lower, upper : ndarray
+
+    Raises
+    ------
+    ValueError
+        if *err* is not a scalar, (N,) or (2, N)
+    """
+    err = _filled(err)
+    if err.ndim <= 1:
+        lo = hi = err
+    elif err.ndim == 2 and err.shape[0] == 2:
+        lo, hi = err
+    else:
+        raise ValueError("err must be a scalar or a 1D or (2, n) array-like")
+
+    if np.ndim(lo) and len(lo) != len(values):
+        raise ValueError(
+            f"The lengths of the data ({len(values)}) and the "
+            f"error {len(lo)} do not match"
+        )
+
+    return values - lo, values + hi
+
+
+# /def
+
+
+def use_fast(kw, fast=None):
+    """whether to draw errorbars with the fast errorbars
+
+    Parameters
+    ----------
+    kw : dict
+        the errorbar arguments, by name. Not fast if any aren't supported
+    fast : bool, None
+        None: for many points
+    """
+    if (
+        fast is False
+        or any(np.any(kw.get(k, False)) for k in _limits)
+        or kw.get("errorevery", 1) != 1
+    ):
+        return False
+    return bool(fast) or np.size(kw["x"]) >= _fast_threshold
+
+
+# /def
+
+
+##############################################################################
+### Reduction
+
+
+def _merge_pixels(ax, x, y, bounds, connected):
+    """merge the points in the same pixel of the axes' view
+
+    Parameters
+    ----------
+    ax : Axes
+    x, y : ndarray
+    bounds : list
+        the (lower, upper) error bounds, or None, for x then y
+    connected : bool
+        whether only consecutive points are merged
+
+    Returns
+    -------
+    x, y : ndarray
+    bounds : list
+        the lower bounds are the minima, the upper the maxima, of the
+        merged points'
+    """
+    pix = ax.transData.transform(np.column_stack((x, y)))
+    finite = np.isfinite(pix).all(axis=1)
+    pix = np.floor(pix[finite]).astype(np.int64)
+    pix -= pix.min(axis=0) if len(pix) else 0
+    # non-finite points are each their own pixel
+    key = -1 - np.arange(len(x))
+    if len(pix):
+        key[finite] = pix[:, 0] * (pix[:, 1].max() + 1) + pix[:, 1]
+
+    if connected:  # runs of consecutive points in the same pixel
+        order = np.arange(len(x))
+    else:
+        order = np.argsort(key, kind="stable")
+    skey = key[order]
+    first = np.flatnonzero(np.r_[True, skey[1:] != skey[:-1]])
+    keep = order[first]
+
+    merged = [
+        None
+        if pair is None
+        else (
+            np.fmin.reduceat(pair[0][order], first),
+            np.fmax.reduceat(pair[1][order], first),
+        )
+        for pair in bounds
+    ]
+
+    if not connected:  # back in the original order
+        resort = np.argsort(keep)
+        keep = keep[resort]
+        merged = [
+            None if pair is None else (pair[0][resort], pair[1][resort])
+            for pair in merged
+        ]
+
+    return x[keep], y[keep], merged
+
+
+# /def
+
+
+def _binned_band(x, lower, upper, bins):
+    """the mean bounds of the points in bins of x
+
+    Returns
+    -------
+    x, lower, upper : ndarray
+        the bin means, for non-empty bins
+    """
+    finite = np.isfinite(x) & np.isfinite(lower) & np.isfinite(upper)
+    x, lower, upper = x[finite], lower[finite], upper[finite]
+    if len(x) <= bins:
+        order = np.argsort(x, kind="stable")
+        return x[order], lower[order], upper[order]
+
+    edges = np.linspace(x.min(), x.max(), bins + 1)
+    index = np.clip(np.searchsorted(edges, x, side="right") - 1, 0, bins - 1)
+    counts = np.bincount(index, minlength=bins)
+    full = counts > 0
+
+    def mean(v):
+        return np.bincount(index, v, minlength=bins)[full] / counts[full]
+
+    return mean(x), mean(lower), mean(upper)
+
+
+# /def
+
+
+##############################################################################
+### Plotting
+
+
+def _axes_width(ax):
+    return max(int(math.ceil(ax.get_window_extent().width)), 1)
+
+
+# /def
+
+
+def _styles(ax, fmt, ecolor, elinewidth, capsize, capthick, barsabove, kw):
+    """the data line, error bar & cap styles, as Axes.errorbar"""
+    kw = cbook.normalize_kwargs(kw, mlines.Line2D._alias_map)
+    kw = {k: v for k, v in kw.items() if v is not None}
+    kw.setdefault("zorder", 2)
+    label = kw.pop("label", None)
+
+    if fmt == "":
+        fmt_style = {}
+    else:
+        fmt_style = {
+            k: v
+            for k, v in zip(
+                ("linestyle", "marker", "color"), _process_plot_format(fmt)
+            )
+            if v is not None
+        }
+    if fmt == "none":
+        fmt_style.pop("color", None)
+
+    if "color" in kw or "color" in fmt_style or ecolor is not None:
+        base = {}
+        if "color" in kw:
+            base["color"] = kw.pop("color")
+    else:
+        base = dict(next(ax._get_lines.prop_cycler))
+    base["label"] = "_nolegend_"
+    base.update(fmt_style)
+    base.setdefault("color", "C0")
+    if ecolor is None:
+        ecolor = base["color"]
+
+    line = {
+        **base,
+        **kw,
+        "zorder": kw["zorder"] - 0.1 if barsabove else kw["zorder"] + 0.1,
+    }
+
+    bars = dict(base)
+    for key in (
+        "marker",
+        "linestyle",
+        "markerfacecolor",
+        "markeredgewidth",
+        "markeredgecolor",
+    ):
+        bars.pop(key, None)
+    bars["color"] = ecolor
+    if elinewidth:
+        bars["linewidth"] = elinewidth
+    elif "linewidth" in kw:
+        bars["linewidth"] = kw["linewidth"]
+    for key in ("transform", "alpha", "zorder", "rasterized"):
+        if key in kw:
+            bars[key] = kw[key]
+
+    caps = dict(base)
+    caps.pop("marker", None)
+    caps.pop("ls", None)
+    caps["linestyle"] = "none"
+    if capsize is None:
+        capsize = rcParams["errorbar.capsize"]
+    if capsize > 0:
+        caps["markersize"] = 2.0 * capsize
+    if capthick is not None:
+        caps["markeredgewidth"] = capthick
+    for key in ("markeredgewidth", "transform", "alpha", "zorder"):
+        if key in kw:
+            caps[key] = kw[key]
+    caps["color"] = ecolor
+
+    return line, bars, caps, capsize, label
+
+
+# /def
+
+
+def errorbar(
+    ax,
+    x,
+    y,
+    yerr=None,
+    xerr=None,
+    fmt="",
+    ecolor=None,
+    elinewidth=None,
+    capsize=None,
+    barsabove=False,
+    capthick=None,
+    merge=True,
+    bands=False,
+    **kwargs,
+):
+    """Axes.errorbar, with vectorized segments & pixel merging
+
+    Parameters
+    ----------
+    ax : Axes
+    x, y : array-like
+    yerr, xerr : float or array-like, optional
+        scalar, (N,), or (2, N)
+    merge : bool
+        whether to merge the points in the same pixel
+    bands : bool or int
+        whether to draw the y errors as a band, with fill_between.
+        an int is the number of bins in x over which the band is averaged
+        (by default, the axes width in pixels)
+    others
+        see Axes.errorbar
+
+    Returns
+    -------
+    container : ErrorbarContainer
+    """
+    line, bars, caps, capsize, label = _styles(
+        ax, fmt, ecolor, elinewidth, capsize, capthick, barsabove, kwargs
+    )
+
+    x = np.atleast_1d(_filled(x)).ravel()  # masked points aren't drawn
+    y = np.atleast_1d(_filled(y)).ravel()
+    if len(x) != len(y):
+        raise ValueError("x and y must have the same length")
+    xb = None if xerr is None else error_bounds(x, xerr)
+    yb = None if yerr is None else error_bounds(y, yerr)
+
+    # the full extent, so the view (and pixels) are those of all the data
+    extent = [(x, y)]
+    if xb is not None:
+        extent += [(xb[0], y), (xb[1], y)]
+    if yb is not None:
+        extent += [(x, yb[0]), (x, yb[1])]
+    extent = np.concatenate([np.column_stack(xy) for xy in extent])
+    ax.update_datalim(extent[np.isfinite(extent).all(axis=1)])
+    ax.autoscale_view()
+
+    if merge and len(x):
+        linestyle = line.get("linestyle", rcParams["lines.linestyle"])
+        connected = fmt.lower() != "none" and linestyle not in _no_lines
+        x, y, (xb, yb) = _merge_pixels(ax, x, y, [xb, yb], connected)
+
+    data_line = None
+    if fmt.lower() != "none":
+        data_line = mlines.Line2D(x, y, **line)
+        ax.add_line(data_line)
+
+    barcols, caplines = [], []
+
+    if yb is not None and bands:
+        nbins = _axes_width(ax) if bands is True else int(bands)
+        bx, blo, bhi = _binned_band(x, yb[0], yb[1], nbins)
+        band = dict(bars, alpha=bars.get("alpha", _band_alpha))
+        band.pop("linewidth", None)
+        barcols.append(ax.fill_between(bx, blo, bhi, linewidth=0, **band))
+        yb = None
+
+    # one segment array, collection & cap line per direction
+    for bounds, vertical in ((xb, False), (yb, True)):
+        if bounds is None:
+            continue
+        at = x if vertical else y
+        lo = np.column_stack((at, bounds[0]))
+        hi = np.column_stack((at, bounds[1]))
+        if not vertical:
+            lo, hi = lo[:, ::-1], hi[:, ::-1]
+        segs = np.stack((lo, hi), axis=1)
+        barcols.append(ax.add_collection(LineCollection(segs, **bars)))
+
+        if capsize > 0:
+            ends = np.concatenate((lo, hi))
+            cap = mlines.Line2D(
+                ends[:, 0], ends[:, 1], marker="_" if vertical else "|", **caps
+            )
+            ax.add_line(cap)
+            caplines.append(cap)
+
+    ax.autoscale_view()
+
+    container = ErrorbarContainer(
+        (data_line, tuple(caplines), tuple(barcols)),
+        has_xerr=xerr is not None,
+        has_yerr=yerr is not None,
+        label=label,
+    )
+    ax.containers.append(container)
+
+    return container
+
+
+# /def
+
+##############################################################################
+# END
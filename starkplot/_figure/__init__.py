@@ -60,4 +60,31 @@ from ._save_or_close import (
     save_and_close,
 )
 
+from ._multipage import MultipagePDF
+
+from ._lifecycle import (
+    FigureRecord,
+    figure_memory,
+    set_figure_limits,
+    get_figure_limits,
+    enforce_figure_limits,
+    leaked_figures,
+    report_leaks,
+)
+
+from ._tight_layout import (
+    cached_tight_layout,
+    layout_signature,
+    clear_layout_cache,
+)
+
+from ._rasterize import (
+    artist_size,
+    rasterize_heavy,
+    set_rasterize_policy,
+    get_rasterize_policy,
+)
+
+from ._shared_colorbar import SharedNorm, shared_norm, shared_colorbar
+
 from .decorators import GetFigArg, SetFigArg
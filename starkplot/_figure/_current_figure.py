@@ -32,6 +32,9 @@ import numpy as np
 from matplotlib import pyplot as _pyplot
 from matplotlib.pyplot import figure, Figure
 
+## Project-Specific
+from ._lifecycle import track_figure, touch_figure
+
 
 ##############################################################################
 # gcf & scf
@@ -60,17 +63,22 @@ def scf(fig=None):
 
     # make figure current
     if fig is None:
+        made = not _pyplot.get_fignums()
         fig = _pyplot.gcf()
+        if made:
+            track_figure(fig)
         return fig
 
     elif isinstance(fig, Figure):
         fig = _pyplot.figure(fig.number)
+        touch_figure(fig)
         return fig
 
     elif isinstance(fig, (int, np.integer)):
         if not _pyplot.fignum_exists(fig):
             raise ValueError(f"fig #{fig} does not exist")
         fig = _pyplot.figure(fig)
+        touch_figure(fig)
         return fig
 
     else:
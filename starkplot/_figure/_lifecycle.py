@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _lifecycle
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""figure lifecycle management
+
+pyplot holds every figure until it's closed, so long-running processes
+which forget to close figures leak them. The figures starkplot makes are
+tracked, with the stack which made them, when they were last used and
+whether they've been saved since last used.
+
+With limits on the number of open figures, or their memory (see
+set_figure_limits), the least-recently-used saved figures are closed
+when a figure is made. Unsaved figures are never closed: if they exceed
+the limits, a RuntimeWarning reports them, with where they were made.
+leaked_figures & report_leaks find figures still open.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "FigureRecord",
+    "track_figure",
+    "touch_figure",
+    "mark_saved",
+    "figure_memory",
+    "set_figure_limits",
+    "get_figure_limits",
+    "enforce_figure_limits",
+    "leaked_figures",
+    "report_leaks",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import itertools
+import threading
+import time
+import traceback
+import weakref
+from warnings import warn
+
+import numpy as np
+
+# matplotlib
+from matplotlib import pyplot
+from matplotlib._pylab_helpers import Gcf
+
+
+##############################################################################
+### Info
+
+# the limits on open figures: None is unlimited
+_limits = {"max_figures": None, "max_memory": None}
+
+# the records of tracked figures, dropped with the figures
+_records = weakref.WeakKeyDictionary()
+_lock = threading.RLock()
+
+# orders uses, as clocks can tie
+_ticks = itertools.count()
+
+# the number of stack frames recorded
+_stack_depth = 24
+
+
+##############################################################################
+### Records
+
+
+class FigureRecord(object):
+    """the lifecycle of a tracked figure
+
+    Attributes
+    ----------
+    figure : Figure or None
+        None once the figure is garbage collected
+    number : int
+    stack : list of FrameSummary
+        where the figure was made
+    created, last_used : float
+        times, from time.time
+    saved : bool
+        whether saved since last used
+    """
+
+    __slots__ = (
+        "_figure",
+        "number",
+        "stack",
+        "created",
+        "last_used",
+        "saved",
+        "_tick",
+    )
+
+    def __init__(self, fig, stack):
+        self._figure = weakref.ref(fig)
+        self.number = fig.number
+        self.stack = stack
+        self.created = self.last_used = time.time()
+        self.saved = False
+        self._tick = next(_ticks)
+
+    # /def
+
+    @property
+    def figure(self):
+        return self._figure()
+
+    # /def
+
+    def touch(self):
+        self.last_used = time.time()
+        self._tick = next(_ticks)
+
+    # /def
+
+    def format(self):
+        """the record, with the stack which made the figure"""
+        age = time.time() - self.created
+        state = "saved" if self.saved else "unsaved"
+        return (
+            f"figure {self.number} ({state}, made {age:.0f}s ago) at:\n"
+            + "".join(traceback.format_list(self.stack))
+        )
+
+    # /def
+
+    def __repr__(self):
+        return f"<FigureRecord {self.number}, saved={self.saved}>"
+
+    # /def
+
+
+# /class
+
+
+def track_figure(fig, stack=None):
+    """track a figure starkplot made, or mark it used if tracked
+
+    Parameters
+    ----------
+    fig : Figure
+    stack : list of FrameSummary, optional
+        where the figure was made. default: the caller's stack
+
+    Returns
+    -------
+    record : FigureRecord
+    """
+    with _lock:
+        record = _records.get(fig)
+        if record is not None:
+            record.touch()
+            return record
+
+        if stack is None:
+            stack = traceback.extract_stack(limit=_stack_depth)[:-1]
+        record = _records[fig] = FigureRecord(fig, stack)
+
+    enforce_figure_limits(exclude=fig)
+    return record
+
+
+# /def
+
+
+def touch_figure(fig):
+    """mark a tracked figure as used, so unsaved until saved again"""
+    with _lock:
+        record = _records.get(fig)
+        if record is not None:
+            record.saved = False
+            record.touch()
+
+
+# /def
+
+
+def mark_saved(fig):
+    """mark a tracked figure as saved, so it may be closed"""
+    with _lock:
+        record = _records.get(fig)
+        if record is not None:
+            record.saved = True
+            record.touch()
+
+
+# /def
+
+
+def _open_records():
+    """the records of the tracked figures which pyplot holds open"""
+    opened = {id(m.canvas.figure) for m in Gcf.get_all_fig_managers()}
+    with _lock:
+        return [
+            (fig, record)
+            for fig, record in list(_records.items())
+            if id(fig) in opened
+        ]
+
+
+# /def
+
+
+##############################################################################
+### Memory
+
+
+def _nbytes(arr):
+    return getattr(arr, "nbytes", 0) if arr is not None else 0
+
+
+# /def
+
+
+def figure_memory(fig):
+    """an estimate of the memory of a figure, in bytes
+
+    the canvas buffer, and the data of the lines, collections & images
+    """
+    width, height = fig.canvas.get_width_height()
+    size = 4 * width * height
+
+    for ax in fig.axes:
+        for line in ax.lines:
+            size += _nbytes(getattr(line, "_xy", None))
+            size += _nbytes(np.asanyarray(line.get_xdata(orig=True)))
+            size += _nbytes(np.asanyarray(line.get_ydata(orig=True)))
+        for coll in ax.collections:
+            size += _nbytes(coll.get_offsets())
+            paths = coll.get_paths()
+            if len(paths):  # as all the first path
+                size += len(paths) * _nbytes(paths[0].vertices)
+            size += _nbytes(coll.get_array())
+        for image in ax.images:
+            size += _nbytes(image.get_array())
+
+    return size
+
+
+# /def
+
+
+##############################################################################
+### Limits
+
+
+def set_figure_limits(max_figures=None, max_memory=None):
+    """limit the open figures starkplot makes
+
+    when exceeded, the least-recently-used saved figures are closed
+
+    Parameters
+    ----------
+    max_figures : int, None
+        the number of open tracked figures. None: unlimited
+    max_memory : int, None
+        their memory, in bytes, see figure_memory. None: unlimited
+
+    Returns
+    -------
+    limits : dict
+        the previous limits
+    """
+    old = dict(_limits)
+    _limits.update(max_figures=max_figures, max_memory=max_memory)
+    return old
+
+
+# /def
+
+
+def get_figure_limits():
+    """the limits on open figures, as a dict"""
+    return dict(_limits)
+
+
+# /def
+
+
+def enforce_figure_limits(exclude=None):
+    """close least-recently-used saved figures, to meet the limits
+
+    Parameters
+    ----------
+    exclude : Figure, optional
+        a figure not to close, ex: the one just made
+
+    Returns
+    -------
+    closed : list of int
+        the numbers of the closed figures
+
+    Warns
+    -----
+    RuntimeWarning
+        if the unsaved figures exceed the limits
+    """
+    max_figures, max_memory = _limits["max_figures"], _limits["max_memory"]
+    if max_figures is None and max_memory is None:
+        return []
+
+    records = _open_records()
+    count = len(records)
+    memory = (
+        sum(figure_memory(fig) for fig, _ in records)
+        if max_memory is not None
+        else 0
+    )
+
+    def over():
+        return (max_figures is not None and count > max_figures) or (
+            max_memory is not None and memory > max_memory
+        )
+
+    closed = []
+    lru = sorted(records, key=lambda fr: fr[1]._tick)
+    for fig, record in lru:
+        if not over():
+            break
+        if not record.saved or fig is exclude:
+            continue
+        if max_memory is not None:
+            memory -= figure_memory(fig)
+        pyplot.close(fig)
+        count -= 1
+        closed.append(record.number)
+
+    if over():
+        warn(
+            "open figures exceed the limits "
+            f"({count} figures, {memory / 2**20:.1f} MB), and are unsaved.\n"
+            + report_leaks(saved=False),
+            RuntimeWarning,
+        )
+
+    return closed
+
+
+# /def
+
+
+##############################################################################
+### Leaks
+
+
+def leaked_figures(min_age=0, saved=None):
+    """the tracked figures still open
+
+    Parameters
+    ----------
+    min_age : float
+        only figures last used at least this long ago, in seconds
+    saved : bool, None
+        only figures saved (True) or unsaved (False). None: all
+
+    Returns
+    -------
+    records : list of FigureRecord
+        oldest first
+    """
+    now = time.time()
+    records = [
+        record
+        for _, record in _open_records()
+        if now - record.last_used >= min_age
+        and (saved is None or record.saved == saved)
+    ]
+    return sorted(records, key=lambda record: record.created)
+
+
+# /def
+
+
+def report_leaks(min_age=0, saved=None):
+    """a report of the tracked figures still open, see leaked_figures
+
+    Returns
+    -------
+    report : str
+        each figure, with the stack which made it
+    """
+    records = leaked_figures(min_age=min_age, saved=saved)
+    return f"{len(records)} open figures\n" + "\n".join(
+        record.format() for record in records
+    )
+
+
+# /def
+
+##############################################################################
+# END
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _multipage
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""stream figures into one multipage PDF
+
+A MultipagePDF is a savefig target: figures saved to it, by savefig,
+save_figure, save_and_close or the decorator's savefig option, are
+appended as pages through one open writer, and closed once appended.
+So batch runs write one file, with flat memory.
+
+Example
+-------
+>>> with MultipagePDF("runs.pdf") as pdf:
+...     for run in runs:
+...         plot(run.x, run.y, title=run.name, savefig=pdf)
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = ["MultipagePDF"]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+from matplotlib import pyplot
+from matplotlib.backends.backend_pdf import PdfPages
+
+## Project-Specific
+from ._current_figure import scf
+from ._lifecycle import mark_saved
+
+
+##############################################################################
+### MultipagePDF
+
+
+class MultipagePDF(object):
+    """a savefig target appending figures to one multipage PDF
+
+    Parameters
+    ----------
+    filename : str, path-like or file-like
+    close : bool  (default True)
+        whether to close each figure once appended
+    keep_empty : bool  (default True)
+        whether to write a file without pages
+    metadata : dict, optional
+        the PDF info, see PdfPages
+
+    Notes
+    -----
+    use as a context manager, or call close when done.
+    pages are written as they're appended, though the PDF backend keeps
+    embedded images (ex: rasterized artists) until the file is closed
+    """
+
+    format = "pdf"
+
+    def __init__(self, filename, close=True, keep_empty=True, metadata=None):
+        self.filename = filename
+        self.close_figures = close
+        self._pagecount = 0
+        self._pages = PdfPages(
+            filename, keep_empty=keep_empty, metadata=metadata
+        )
+
+    # /def
+
+    def __enter__(self):
+        return self
+
+    # /def
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # /def
+
+    def __repr__(self):
+        return f"<MultipagePDF {self.filename!r}>"
+
+    # /def
+
+    def savefig(self, fig=None, close=None, **kw):
+        """append a figure as a page
+
+        Parameters
+        ----------
+        fig : Figure, int, None
+            None: the current figure
+        close : bool, None
+            whether to close the figure. None: as set for the target
+        kw
+            savefig kwargs. The format is PDF
+        """
+        fig = scf(fig)
+        kw.pop("format", None)
+        self._pages.savefig(fig, **kw)
+        self._pagecount += 1
+        mark_saved(fig)
+        if self.close_figures if close is None else close:
+            pyplot.close(fig)
+
+    # /def
+
+    def get_pagecount(self):
+        """the number of pages appended"""
+        return self._pagecount
+
+    # /def
+
+    def close(self):
+        """finish writing the PDF"""
+        if self._pages is not None:
+            self._pages.close()
+            self._pages = None
+
+    # /def
+
+
+# /class
+
+##############################################################################
+# END
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _rasterize
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""rasterize heavy artists in vector outputs
+
+Large scatters, meshes and lines make PDF / SVG files of 100s of MB,
+slow to write and to open. Artists with more elements (points, paths,
+cells or vertices) than a threshold are marked rasterized, so in vector
+outputs they are embedded as images while text, axes and small artists
+stay vector. Vector files are then saved at a dpi suited to the images.
+
+The threshold is given per call (rasterize_above=N), or by a global
+policy, see set_rasterize_policy.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "artist_size",
+    "rasterize_heavy",
+    "set_rasterize_policy",
+    "get_rasterize_policy",
+    "raster_savefig_kw",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import os
+
+# matplotlib
+from matplotlib import rcParams
+from matplotlib.collections import Collection, QuadMesh
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+
+## Project-Specific
+from ._current_figure import scf
+from ._multipage import MultipagePDF
+
+
+##############################################################################
+### Info
+
+# the global policy: threshold None is off
+_policy = {"threshold": None, "dpi": 300}
+
+# the threshold of rasterize_above=True, when the policy is off
+_default_threshold = 10000
+
+# formats whose rasterized artists are embedded images
+_vector_formats = ("pdf", "svg", "svgz", "eps", "ps", "pgf")
+
+
+##############################################################################
+### Policy
+
+
+def set_rasterize_policy(threshold=None, dpi=None):
+    """set the global auto-rasterization policy
+
+    Parameters
+    ----------
+    threshold : int, None
+        artists with more elements are rasterized. None is off
+    dpi : float, None
+        the dpi of vector outputs with rasterized artists,
+        unless given when saving. None leaves it unchanged
+
+    Returns
+    -------
+    policy : dict
+        the previous policy
+    """
+    old = dict(_policy)
+    _policy["threshold"] = threshold
+    if dpi is not None:
+        _policy["dpi"] = dpi
+    return old
+
+
+# /def
+
+
+def get_rasterize_policy():
+    """the global auto-rasterization policy, as a dict"""
+    return dict(_policy)
+
+
+# /def
+
+
+def _threshold(rasterize_above):
+    """the threshold, from the policy if None or True. None if off"""
+    if rasterize_above is None:
+        return _policy["threshold"]
+    if rasterize_above is False:
+        return None
+    if rasterize_above is True:
+        threshold = _policy["threshold"]
+        return _default_threshold if threshold is None else threshold
+    return rasterize_above
+
+
+# /def
+
+
+##############################################################################
+### Rasterizing
+
+
+def artist_size(artist, limit=None):
+    """the number of elements drawn by an artist
+
+    points for lines, cells for meshes, offsets or paths for other
+    collections (or vertices, without offsets), and vertices for patches.
+
+    Parameters
+    ----------
+    artist : Artist
+    limit : int, None
+        counting may stop once the size exceeds the limit
+
+    Returns
+    -------
+    size : int
+    """
+    if isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+    elif isinstance(artist, QuadMesh):
+        return artist._meshWidth * artist._meshHeight
+    elif isinstance(artist, Collection):
+        paths = artist.get_paths()
+        size = max(len(artist.get_offsets()), len(paths))
+        if len(artist.get_offsets()) > 1 or (limit and size > limit):
+            return size  # the paths are markers, or already too many
+        return max(size, sum(len(p.vertices) for p in paths))
+    elif isinstance(artist, Patch):
+        return len(artist.get_path().vertices)
+    return 0
+
+
+# /def
+
+
+def rasterize_heavy(fig=None, rasterize_above=None):
+    """mark the heavy artists of a figure as rasterized
+
+    Parameters
+    ----------
+    fig : Figure, None
+        None: the current figure
+    rasterize_above : int, bool, None
+        artists with more elements are rasterized.
+        None: the global policy. False: none. True: the policy's
+        threshold, or 10000 if the policy is off
+
+    Returns
+    -------
+    rasterized : list of Artist
+        the artists marked rasterized
+    """
+    threshold = _threshold(rasterize_above)
+    if threshold is None:
+        return []
+
+    fig = scf(fig)
+    rasterized = []
+    for ax in fig.axes:
+        for artist in (*ax.lines, *ax.collections, *ax.patches):
+            if artist_size(artist, threshold) > threshold:
+                artist.set_rasterized(True)
+                rasterized.append(artist)
+
+    return rasterized
+
+
+# /def
+
+
+def raster_savefig_kw(fname, fig=None, rasterize_above=None, **kw):
+    """savefig kwargs, rasterizing heavy artists for vector outputs
+
+    heavy artists are marked rasterized, and, if any are, vector formats
+    default to the policy's dpi
+
+    Parameters
+    ----------
+    fname : str, file-like or MultipagePDF
+    fig : Figure, None
+    rasterize_above : int, bool, None
+        see rasterize_heavy
+    kw
+        savefig kwargs
+
+    Returns
+    -------
+    kw : dict
+    """
+    fig = scf(fig)
+    kw = dict(kw)
+    if not rasterize_heavy(fig, rasterize_above):
+        return kw
+
+    fmt = kw.get("format")
+    if isinstance(fname, MultipagePDF):
+        fmt = MultipagePDF.format
+    elif fmt is None and isinstance(fname, (str, os.PathLike)):
+        fmt = os.path.splitext(os.fspath(fname))[1][1:] or None
+    if fmt is None:
+        fmt = rcParams["savefig.format"]
+
+    if fmt.lower() in _vector_formats and kw.get("dpi") in (None, "figure"):
+        kw["dpi"] = _policy["dpi"]
+
+    return kw
+
+
+# /def
+
+##############################################################################
+# END
@@ -31,6 +31,10 @@ from matplotlib.pyplot import figure
 ## Project-Specific
 from ._info import _savefigk
 from ._figure_properties import scf
+from ._rasterize import raster_savefig_kw
+from ._multipage import MultipagePDF
+from ._lifecycle import mark_saved
+from .._graph import render
 
 from .decorators import GetFigArg, SetFigArg
 from ..decorators import docstring
@@ -42,27 +46,42 @@ from .._util import _parsexkwandopts, _parsestrandopts
 ### Saving & Closing
 
 # TODO docstring
-def savefig(*fnames, fig=None, **kw):
+def savefig(*fnames, fig=None, rasterize_above=None, **kw):
     """save figure
 
     Parameters
     ----------
-    fnames : str(s)
+    fnames : str(s), MultipagePDF
         filename or list of filenames, which is(are) the location(s) to 
-        save the figure
+        save the figure. a MultipagePDF appends the figure as a page,
+        and closes it once all are saved, if set to
     fig: Figure, int, None  (default None)
         figure to save
         passed to *scf*, see documentation
         None -> current figure
+    rasterize_above: int, bool, None  (default None)
+        artists with more elements are rasterized, see rasterize_heavy
+        None -> the global policy
     **kw : savefig arguments
 
     Exceptions
     ----------
     raised by scf for invalid arguments, see documentation
     """
+    render()  # deferred figure graphs
     fig = scf(fig)
+    close = False
     for fname in fnames:
-        pyplot.savefig(fname, **kw)
+        sfgkw = raster_savefig_kw(fname, fig, rasterize_above, **kw)
+        if isinstance(fname, MultipagePDF):  # closed after all targets
+            fname.savefig(fig, close=False, **sfgkw)
+            close |= fname.close_figures
+        else:
+            fig.savefig(fname, **sfgkw)
+        mark_saved(fig)
+
+    if close:
+        pyplot.close(fig)
 
 
 # /def
@@ -71,7 +90,7 @@ def savefig(*fnames, fig=None, **kw):
 # -------------------------------------------------------------------------
 
 
-def save_figure(*fnames, fig=None, **kw):
+def save_figure(*fnames, fig=None, rasterize_above=None, **kw):
     r"""save figure
 
     # TODO explanantion of _parsexkwandopts
@@ -79,19 +98,29 @@ def save_figure(*fnames, fig=None, **kw):
 
     Parameters
     ----------
-    fnames: str or file-like object
+    fnames: str or file-like object, MultipagePDF
+        a MultipagePDF appends the figure as a page, and closes it once
+        all are saved, if set to
     fig: Figure, None
         figure to save
         None -> current figure
+    rasterize_above: int, bool, None
+        artists with more elements are rasterized, see rasterize_heavy
+        None -> the global policy
 
     Exceptions
     ----------
     raised by scf for invalid arguments, see documentation
     """
+    render()  # deferred figure graphs
     fig = scf(fig)
 
+    close = False
     for fname in fnames:
 
+        if isinstance(fname, MultipagePDF):  # not (fname, opts)
+            fname = (fname, {})
+
         fname, sfgkw = _parsexkwandopts(
             fname, kw, "savefig", _savefigk, _parsestrandopts
         )
@@ -99,7 +128,16 @@ def save_figure(*fnames, fig=None, **kw):
         if fname is None:
             fname = "plot" + str(fig.number)
 
-        fig.savefig(fname, **sfgkw)
+        sfgkw = raster_savefig_kw(fname, fig, rasterize_above, **sfgkw)
+        if isinstance(fname, MultipagePDF):  # closed after all targets
+            fname.savefig(fig, close=False, **sfgkw)
+            close |= fname.close_figures
+        else:
+            fig.savefig(fname, **sfgkw)
+        mark_saved(fig)
+
+    if close:
+        pyplot.close(fig)
 
 
 # /def
@@ -122,7 +160,10 @@ def save_and_close(filename, fig=None, **kw):
     """
     fig = scf(fig)  # set fig to current
 
-    fig.savefig(filename, **kw)
+    if isinstance(filename, MultipagePDF):
+        filename.savefig(fig, **kw)
+    else:
+        fig.savefig(filename, **kw)
     pyplot.close(fig)
 
 
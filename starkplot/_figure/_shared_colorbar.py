@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _shared_colorbar
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""figure-level shared color normalization & colorbars
+
+Panels registered in the same group share one SharedNorm, whose limits
+are accumulated over the panels' data as they are plotted, and one
+colorbar, whose options are given only once. Unless placed, the colorbar
+takes its space from all the group's axes, so it's remade when the group
+spans a new axes.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = ["SharedNorm", "shared_norm", "shared_colorbar"]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+
+# matplotlib
+from matplotlib.colors import Normalize
+
+## Project-Specific
+from ._current_figure import scf
+from .._quantile import QuantileSketch, quantile_sketch, parse_auto_limits
+
+
+##############################################################################
+### Info
+
+# attribute under which a figure stores its colorbar groups
+_groups_attr = "_starkplot_colorbar_groups"
+
+
+##############################################################################
+### SharedNorm
+
+
+class SharedNorm(Normalize):
+    """Normalize with limits accumulated over many arrays
+
+    Parameters
+    ----------
+    vmin, vmax : float, None
+        fixed limits. None accumulates the limit from the data
+    clip : bool
+        see Normalize
+    percentile : (float, float), None
+        if not None, the limits are these percentiles of the data
+        rather than the min / max. Percentiles are estimated from a
+        streaming QuantileSketch, cached per array.
+    """
+
+    def __init__(self, vmin=None, vmax=None, clip=False, percentile=None):
+        super().__init__(vmin=vmin, vmax=vmax, clip=clip)
+        self._fixed = (vmin, vmax)
+        self.percentile = percentile
+
+        self._lo, self._hi = np.inf, -np.inf
+        self._sketch = QuantileSketch()
+
+    # /def
+
+    @classmethod
+    def from_data(cls, arrays, **kw):
+        """a SharedNorm with limits from one pass over the arrays"""
+        self = cls(**kw)
+        for arr in arrays:
+            self.update(arr)
+        return self
+
+    # /def
+
+    def update(self, arr):
+        """include an array in the limits
+
+        Returns
+        -------
+        changed : bool
+            whether vmin or vmax changed
+        """
+        if arr is None:
+            return False
+
+        if self.percentile is None:
+            arr = np.asarray(np.ma.getdata(arr), dtype=float).ravel()
+            arr = arr[np.isfinite(arr)]
+            if arr.size == 0:
+                return False
+            self._lo = min(self._lo, arr.min())
+            self._hi = max(self._hi, arr.max())
+            lo, hi = self._lo, self._hi
+        else:
+            self._sketch.merge(quantile_sketch(np.ma.getdata(arr)))
+            if self._sketch.n == 0:
+                return False
+            lo, hi = self._sketch.percentile(self.percentile)
+
+        old = (self.vmin, self.vmax)
+        if self._fixed[0] is None:
+            self.vmin = lo
+        if self._fixed[1] is None:
+            self.vmax = hi
+
+        return old != (self.vmin, self.vmax)
+
+    # /def
+
+
+# /class
+
+
+##############################################################################
+### Colorbar Groups
+
+
+class _ColorbarGroup(object):
+    """the norm, mappables & colorbar of one colorbar group"""
+
+    __slots__ = (
+        "norm",
+        "mappables",
+        "colorbar",
+        "kw",
+        "clabel",
+        "positions",
+    )
+
+    def __init__(self, norm):
+        self.norm = norm
+        self.mappables = []
+        self.colorbar = None
+        self.kw = {}
+        self.clabel = None
+        self.positions = {}  # of the axes, before the colorbar took space
+
+    @property
+    def axes(self):
+        """the axes of the mappables, in order"""
+        axes = []
+        for m in self.mappables:
+            if m.axes is not None and m.axes not in axes:
+                axes.append(m.axes)
+        return axes
+
+
+# /class
+
+
+def _get_groups(fig):
+    groups = getattr(fig, _groups_attr, None)
+    if groups is None:
+        groups = {}
+        setattr(fig, _groups_attr, groups)
+    return groups
+
+
+# /def
+
+
+def shared_norm(group="default", fig=None, **kw):
+    """get (or make) the SharedNorm of a figure's colorbar group
+
+    Parameters
+    ----------
+    group : hashable
+        the colorbar group
+    fig : Figure, int, None
+        passed to *scf*, see documentation
+    **kw : SharedNorm arguments
+        only used when making the group
+
+    Returns
+    -------
+    norm : SharedNorm
+    """
+    fig = scf(fig)
+    groups = _get_groups(fig)
+
+    if group not in groups:
+        groups[group] = _ColorbarGroup(SharedNorm(**kw))
+
+    return groups[group].norm
+
+
+# /def
+
+
+def shared_colorbar(
+    mappable, group="default", fig=None, clim=None, clabel=None, **kw
+):
+    """add a mappable to a colorbar group
+
+    The mappable is given the group's SharedNorm, the group's limits are
+    updated from the mappable's data, and the colorbar is only made for
+    the first mappable of the group, so the colorbar options are only
+    applied once.
+
+    Parameters
+    ----------
+    mappable : ScalarMappable
+    group : hashable
+        the colorbar group
+    fig : Figure, int, None
+        passed to *scf*, see documentation
+    clim : tuple, str, None
+        only used when making the group
+        tuple: fixed limits for the group
+        str: 'auto:P' percentile limits, see parse_auto_limits
+    clabel : str, None
+        colorbar label. only used when making the colorbar
+    **kw : fig.colorbar arguments, ex: ax, cax, orientation
+        only used when making the group. without ax or cax, the
+        colorbar takes its space from all the group's axes
+
+    Returns
+    -------
+    cbar : Colorbar
+        the group's colorbar
+    """
+    fig = scf(fig)
+    groups = _get_groups(fig)
+
+    if group not in groups:
+        if clim is None:
+            norm = SharedNorm()
+        elif isinstance(clim, str):
+            norm = SharedNorm(percentile=parse_auto_limits(clim))
+        else:
+            norm = SharedNorm(vmin=clim[0], vmax=clim[1])
+        groups[group] = _ColorbarGroup(norm)
+    grp = groups[group]
+
+    mappable.set_norm(grp.norm)
+    changed = grp.norm.update(mappable.get_array())
+    grp.mappables.append(mappable)
+
+    if grp.colorbar is None:
+        grp.kw, grp.clabel = kw, clabel
+        _make_colorbar(fig, grp)
+    elif (
+        "ax" not in grp.kw
+        and "cax" not in grp.kw
+        and mappable.axes not in grp.positions
+    ):  # the group spans a new axes
+        _make_colorbar(fig, grp)
+    elif changed:  # limits moved, so redraw the group
+        for m in grp.mappables:
+            m.changed()
+        grp.colorbar.update_normal(grp.colorbar.mappable)
+
+    return grp.colorbar
+
+
+# /def
+
+
+def _make_colorbar(fig, grp):
+    """(re)make a group's colorbar, from all its axes unless placed"""
+    kw = dict(grp.kw)
+    if "ax" not in kw and "cax" not in kw:
+        if grp.colorbar is not None:  # give back the space it took
+            old = grp.colorbar.mappable
+            old.callbacksSM.disconnect(old.colorbar_cid)
+            grp.colorbar.ax.remove()
+            for ax, position in grp.positions.items():
+                ax.set_position(position)
+        axes = grp.axes
+        grp.positions = {ax: ax.get_position(original=True) for ax in axes}
+        kw["ax"] = axes
+
+    grp.colorbar = fig.colorbar(grp.mappables[0], **kw)
+    if grp.clabel is not None:
+        grp.colorbar.set_label(grp.clabel)
+    for m in grp.mappables:
+        m.changed()
+
+
+# /def
+
+##############################################################################
+# END
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _tight_layout
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""tight_layout with cached layout solutions
+
+Solving a tight layout measures the extents of every tick label, axis
+label and title. The solution (the subplot parameters) only depends on
+the figure's structure, so it is cached by a layout signature: figsize,
+dpi, padding, and per axes the grid geometry, tick label strings,
+label & title texts, and their font properties. Figures with the same
+signature reuse the solution without measuring any text.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = ["cached_tight_layout", "layout_signature", "clear_layout_cache"]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import copy
+from collections import OrderedDict
+
+import numpy as np
+
+# matplotlib
+from matplotlib import rcParams
+
+## Project-Specific
+from ._current_figure import scf
+
+
+##############################################################################
+### Info
+
+# number of cached layout solutions
+_layout_cache_size = 256
+
+# {signature: subplots_adjust kwargs}, least recently used first
+_layout_cache = OrderedDict()
+
+# rcParams which change text extents without being stored on the Texts
+_layout_rcparams = ("text.usetex", "mathtext.fontset", "axes.titlepad")
+
+# the subplot parameters, set by a layout solution
+_subplot_params = ("left", "bottom", "right", "top", "wspace", "hspace")
+
+
+##############################################################################
+### Signature
+
+
+def _text_signature(text):
+    """what sets the extent of a Text"""
+    if not text.get_visible() or not text.get_text():
+        return None
+    return (
+        text.get_text(),
+        hash(text.get_fontproperties()),
+        text.get_rotation(),
+        text.get_position(),
+    )
+
+
+# /def
+
+
+def _axis_signature(axis):
+    """what sets the extent of an axis: tick labels, label & offset text"""
+    if not axis.get_visible():
+        return None
+
+    tick = axis.get_major_ticks(1)[0]
+
+    # the tick label strings, from the locator & a copy of the formatter,
+    # so the axis' isn't changed, un-drawn
+    lo, hi = sorted(axis.get_view_interval())
+    locs = [loc for loc in axis.get_majorticklocs() if lo <= loc <= hi]
+    formatter = copy.copy(axis.get_major_formatter())
+    formatter.set_locs(locs)
+    labels = tuple(formatter(loc, i) for i, loc in enumerate(locs))
+
+    return (
+        axis.get_scale(),
+        labels,
+        formatter.get_offset(),
+        tick.label1.get_visible(),
+        tick.label2.get_visible(),
+        hash(tick.label1.get_fontproperties()),
+        tick.label1.get_rotation(),
+        tick.get_pad(),
+        tick._size,
+        tuple(sorted((k, repr(v)) for k, v in axis._major_tick_kw.items())),
+        _text_signature(axis.label),
+        axis.label_position,
+    )
+
+
+# /def
+
+
+def _axes_signature(ax):
+    """what sets the tight bbox of an Axes"""
+    if not ax.get_visible():
+        return None
+
+    ss = ax.get_subplotspec() if hasattr(ax, "get_subplotspec") else None
+    if ss is None:
+        geometry = tuple(np.round(ax.get_position().bounds, 6))
+    else:
+        gs = ss.get_gridspec()
+        geometry = (
+            ss.get_geometry(),
+            tuple(gs.get_width_ratios() or ()),
+            tuple(gs.get_height_ratios() or ()),
+        )
+
+    axes = tuple(
+        _axis_signature(axis)
+        for axis in (ax.xaxis, ax.yaxis, getattr(ax, "zaxis", None))
+        if axis is not None
+    )
+
+    # other artists in the layout: texts & legends
+    titles = (ax.title, ax._left_title, ax._right_title)
+    texts = [t for t in ax.texts if t.get_in_layout()]
+    legend = ax.get_legend()
+    if legend is not None and legend.get_in_layout():
+        texts.extend(legend.get_texts())
+        legend = (legend._loc, legend.get_title().get_text())
+    else:
+        legend = None
+
+    return (
+        type(ax).__name__,
+        geometry,
+        ax.axison,
+        ax.get_aspect(),
+        axes,
+        tuple(_text_signature(t) for t in titles + tuple(texts)),
+        legend,
+    )
+
+
+# /def
+
+
+def layout_signature(fig, pad=1.08, h_pad=None, w_pad=None, rect=None):
+    """the layout signature of a figure, see cached_tight_layout
+
+    Returns
+    -------
+    signature : tuple
+        hashable
+    """
+    return (
+        tuple(np.round(fig.get_size_inches(), 6)),
+        fig.dpi,
+        pad,
+        h_pad,
+        w_pad,
+        None if rect is None else tuple(rect),
+        tuple(rcParams[k] for k in _layout_rcparams),
+        tuple(_axes_signature(ax) for ax in fig.axes),
+    )
+
+
+# /def
+
+
+##############################################################################
+### Layout
+
+
+def cached_tight_layout(
+    fig=None,
+    renderer=None,
+    pad=1.08,
+    h_pad=None,
+    w_pad=None,
+    rect=None,
+    cache=True,
+):
+    """fig.tight_layout, reusing solutions of identically structured figures
+
+    Parameters
+    ----------
+    fig : Figure, int, None
+        passed to *scf*, see documentation
+    renderer : RendererBase, optional
+        defaults to the renderer for the figure
+    pad, h_pad, w_pad, rect :
+        see Figure.tight_layout
+    cache : bool
+        whether to look up & store the solution by layout signature
+
+    Returns
+    -------
+    kwargs : dict
+        the subplots_adjust arguments
+    """
+    fig = scf(fig)
+
+    if cache:
+        sig = layout_signature(
+            fig, pad=pad, h_pad=h_pad, w_pad=w_pad, rect=rect
+        )
+        kwargs = _layout_cache.get(sig)
+        if kwargs is not None:
+            _layout_cache.move_to_end(sig)
+            if kwargs:
+                fig.subplots_adjust(**kwargs)
+            return kwargs
+
+    # solved by the figure, and read from its subplot parameters
+    rkw = {} if renderer is None else {"renderer": renderer}
+    fig.tight_layout(pad=pad, h_pad=h_pad, w_pad=w_pad, rect=rect, **rkw)
+    kwargs = {k: getattr(fig.subplotpars, k) for k in _subplot_params}
+
+    if cache:
+        _layout_cache[sig] = kwargs
+        while len(_layout_cache) > _layout_cache_size:
+            _layout_cache.popitem(last=False)
+
+    return kwargs
+
+
+# /def
+
+
+def clear_layout_cache():
+    """clear the cached layout solutions"""
+    _layout_cache.clear()
+
+
+# /def
+
+##############################################################################
+# END
@@ -0,0 +1,566 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _graph
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""deferred figure graphs
+
+Within a FigureGraph, decorated calls aren't plotted. They are recorded,
+with their data held by reference (so data changed before rendering is
+plotted changed), and the graph is plotted when rendered, by
+FigureGraph.render, render, or on saving with savefig / save_figure.
+
+When rendering, the graph is optimized:
+
+    - the axes & figure settings (title, labels, limits, scales, aspect,
+      legend, suptitle, tight_layout, savefig, ...) of the calls are
+      merged, the last set value winning, and applied once per axes
+    - fully hidden artists (visible=False, alpha=0 or without data,
+      with an explicit color, so the color cycle is unchanged) are
+      dropped
+    - consecutive plot calls of lines with the same explicit style are
+      drawn as one LineCollection
+
+Calls with a *fig* option, or which preclip, keep their settings.
+
+Example
+-------
+>>> with FigureGraph() as graph:
+...     for x, y in curves:
+...         plot(x, y, color="k", title="curves", xlim=(0, 1))
+>>> fig = graph.render()
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "FigureGraph",
+    "GraphNode",
+    "current_graph",
+    "render",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import threading
+
+import numpy as np
+
+# matplotlib
+from matplotlib import pyplot, rcParams, cbook
+from matplotlib.axes._base import _process_plot_format
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+
+##############################################################################
+### Info
+
+# per thread, the graphs recording the current calls (None: plotting),
+# and the graphs with calls yet to be rendered
+_local = threading.local()
+
+# the decorator's axes settings, and their values which set nothing
+_axes_settings = {
+    "title": None,
+    "xlabel": None,
+    "ylabel": None,
+    "zlabel": None,
+    "unit_labels": False,
+    "xlim": None,
+    "ylim": None,
+    "zlim": None,
+    "invert_axis": None,
+    "xscale": None,
+    "yscale": None,
+    "zscale": None,
+    "aspect": "auto",
+    "legend": False,
+}
+
+# the decorator's figure settings, and their values which set nothing
+_figure_settings = {
+    "figsize": None,
+    "suptitle": None,
+    "tight_layout": False,
+    "rasterize_above": None,
+    "savefig": False,
+    "closefig": False,
+}
+
+_settings = {**_axes_settings, **_figure_settings}
+
+# the function whose lines are merged, by (module, name)
+_line_function = ("starkplot._plot", "plot")
+
+# the line styles a merged plot call may set
+_line_style = ("color", "linestyle", "linewidth", "alpha", "zorder", "label")
+
+
+##############################################################################
+### Nodes
+
+
+class GraphNode(object):
+    """a recorded decorated call
+
+    Attributes
+    ----------
+    decorator : decorator instance
+        which wrapped the function, so can wrap others alike
+    func : function
+        the decorated function
+    target : function
+        the undecorated function
+    args, kwargs : tuple, dict
+        the function arguments, by reference
+    options : dict
+        the decorator options
+    result
+        the result of the call, once rendered.
+        merged lines share one LineCollection. dropped calls are None
+    """
+
+    __slots__ = (
+        "decorator",
+        "func",
+        "target",
+        "args",
+        "kwargs",
+        "options",
+        "result",
+    )
+
+    def __init__(self, decorator, func, target, args, kwargs, options):
+        self.decorator = decorator
+        self.func = func
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs
+        self.options = options
+        self.result = None
+
+    # /def
+
+    def __repr__(self):
+        return f"<GraphNode {self.target.__name__}>"
+
+    # /def
+
+    @property
+    def deferred(self):
+        """whether the settings are deferred to the end of the graph"""
+        return self.options["fig"] is None and not self.options["preclip"]
+
+    # /def
+
+    @property
+    def axes_key(self):
+        """the target axes, by the *ax* option"""
+        ax = self.options["ax"]
+        if ax is None or isinstance(ax, (int, str, tuple)):
+            return ax
+        if isinstance(ax, list):
+            return tuple(ax)
+        return id(ax)
+
+    # /def
+
+    def call_options(self):
+        """the options to execute the call, without deferred settings"""
+        if not self.deferred:
+            return self.options
+        return {**self.options, **_settings}
+
+    # /def
+
+
+# /class
+
+
+def _set(value, neutral):
+    """whether a setting *value* sets something"""
+    if value is neutral:
+        return False
+    if isinstance(value, (str, bool, dict)) and type(value) is type(neutral):
+        return value != neutral
+    return True
+
+
+# /def
+
+
+def _same(a, b):
+    """whether option values are the same, for merging calls"""
+    if a is b:
+        return True
+    if type(a) is not type(b) or not isinstance(
+        a, (str, int, float, tuple)
+    ):
+        return False
+    try:
+        return bool(a == b)
+    except ValueError:
+        return False
+
+
+# /def
+
+
+##############################################################################
+### Optimizations
+
+
+def _explicit_color(node):
+    kw = node.kwargs
+    if any(k in kw for k in ("color", "c", "facecolor", "fc")):
+        return True
+    fmt = [a for a in node.args if isinstance(a, str)]
+    try:
+        return any(_process_plot_format(f)[2] is not None for f in fmt)
+    except ValueError:
+        return False
+
+
+# /def
+
+
+def _hidden(node):
+    """whether a call draws nothing, and can be dropped"""
+    kw = node.kwargs
+    label = str(kw.get("label", "_"))
+    if not label.startswith("_") or not _explicit_color(node):
+        return False
+    if kw.get("visible", True) is False or np.all(
+        np.asarray(kw.get("alpha", 1)) == 0
+    ):
+        return True
+    data = [a for a in node.args if not isinstance(a, str)]
+    return bool(data) and all(np.size(a) == 0 for a in data)
+
+
+# /def
+
+
+def _line_layer(node):
+    """the (style, x, y) of a single-line plot call, or None
+
+    the style must set the color & no markers
+    """
+    if (node.target.__module__, node.target.__name__) != _line_function:
+        return None
+    args, kw = list(node.args), dict(node.kwargs)
+    if kw.pop("pltype", "plot") != "plot":
+        return None
+
+    fmt = args.pop(-1) if args and isinstance(args[-1], str) else ""
+    if len(args) not in (1, 2) or any(hasattr(a, "unit") for a in args):
+        return None
+    try:
+        linestyle, marker, color = (
+            _process_plot_format(fmt) if fmt else (None, None, None)
+        )
+    except ValueError:
+        return None
+
+    style = cbook.normalize_kwargs(kw, Line2D._alias_map)
+    if marker not in (None, "None") or set(style) - set(_line_style):
+        return None
+    if linestyle is not None:
+        style.setdefault("linestyle", linestyle)
+    if color is not None:
+        style.setdefault("color", color)
+    if "color" not in style:
+        return None
+
+    arrs = [np.ma.asarray(a) for a in args]
+    if any(a.ndim != 1 or a.dtype.kind not in "biuf" for a in arrs):
+        return None
+    y = arrs[-1]
+    x = arrs[0] if len(arrs) == 2 else np.arange(len(y))
+    if len(x) != len(y):
+        return None
+
+    return style, x, y
+
+
+# /def
+
+
+def _same_layer(a, b):
+    """whether two line layers can be merged"""
+    (sa, na), (sb, nb) = a, b
+    return (
+        sa.keys() == sb.keys()
+        and all(_same(sa[k], sb[k]) for k in sa)
+        and na.options.keys() == nb.options.keys()
+        and all(
+            _same(na.options[k], nb.options[k])
+            for k in na.options
+            if k not in _settings or not na.deferred
+        )
+    )
+
+
+# /def
+
+
+def _draw_lines(segments, style):
+    """draw line segments in a LineCollection, styled as Line2D"""
+    ax = pyplot.gca()
+    style = dict(style)
+    linestyle = style.pop("linestyle", rcParams["lines.linestyle"])
+    solid = linestyle in ("-", "solid")
+    lines = LineCollection(
+        segments,
+        colors=style.pop("color"),
+        linestyles=linestyle,
+        linewidths=style.pop("linewidth", rcParams["lines.linewidth"]),
+        capstyle=rcParams[
+            "lines.solid_capstyle" if solid else "lines.dash_capstyle"
+        ],
+        joinstyle=rcParams[
+            "lines.solid_joinstyle" if solid else "lines.dash_joinstyle"
+        ],
+        zorder=style.pop("zorder", 2),
+        **style,
+    )
+
+    points = np.concatenate(segments)
+    ax.update_datalim(points[np.isfinite(points).all(axis=1)])
+    ax.add_collection(lines, autolim=False)
+    ax.autoscale_view()
+    return lines
+
+
+# /def
+
+
+def _plan(nodes):
+    """the steps to render nodes: (nodes, line layers or None)
+
+    hidden calls are dropped, and consecutive mergeable lines grouped
+    """
+    steps = []
+    for node in nodes:
+        if _hidden(node):
+            continue
+        layer = _line_layer(node)
+        if layer is not None and steps and steps[-1][1] is not None:
+            last = steps[-1]
+            if _same_layer((last[1][0][0], last[0][0]), (layer[0], node)):
+                last[0].append(node)
+                last[1].append(layer)
+                continue
+        steps.append(([node], None if layer is None else [layer]))
+    return steps
+
+
+# /def
+
+
+##############################################################################
+### Graph
+
+
+def _graphs():
+    """the stack of figure graphs of this thread"""
+    if not hasattr(_local, "graphs"):
+        _local.graphs = []
+    return _local.graphs
+
+
+# /def
+
+
+def _pending():
+    """the figure graphs of this thread with calls yet to be rendered"""
+    if not hasattr(_local, "pending"):
+        _local.pending = []
+    return _local.pending
+
+
+# /def
+
+
+def current_graph():
+    """the figure graph recording the decorated calls, or None"""
+    graphs = _graphs()
+    return graphs[-1] if graphs else None
+
+
+# /def
+
+
+class FigureGraph(object):
+    """record decorated calls, to plot them optimized when rendered
+
+    Parameters
+    ----------
+    fig : Figure, int, None
+        the figure the calls are rendered on.
+        None: the current figure, when rendered
+
+    Notes
+    -----
+    use as a context manager. see the module docstring
+    """
+
+    def __init__(self, fig=None):
+        self.fig = fig
+        self.nodes = []
+
+    # /def
+
+    def __enter__(self):
+        _graphs().append(self)
+        return self
+
+    # /def
+
+    def __exit__(self, *exc):
+        _graphs().pop()
+
+    # /def
+
+    def __len__(self):
+        return len(self.nodes)
+
+    # /def
+
+    def record(self, decorator, func, target, args, kwargs, options):
+        """record a decorated call
+
+        Returns
+        -------
+        node : GraphNode
+        """
+        node = GraphNode(decorator, func, target, args, kwargs, options)
+        self.nodes.append(node)
+        if self not in _pending():
+            _pending().append(self)
+        return node
+
+    # /def
+
+    def settings(self):
+        """the merged settings of the deferred calls
+
+        Returns
+        -------
+        settings : list of (GraphNode, dict)
+            per axes, in order of first use: the last call on the axes,
+            & its merged axes settings. The last also has the merged
+            figure settings
+        """
+        axes, figure = {}, {}
+        for node in self.nodes:
+            if not node.deferred:
+                continue
+            last, merged = axes.get(node.axes_key, (node, {}))
+            for key, neutral in _axes_settings.items():
+                if _set(node.options[key], neutral):
+                    merged[key] = node.options[key]
+            axes[node.axes_key] = (node, merged)
+            for key, neutral in _figure_settings.items():
+                if _set(node.options[key], neutral):
+                    figure[key] = node.options[key]
+
+        settings = list(axes.values())
+        if settings:
+            settings[-1] = (settings[-1][0], {**settings[-1][1], **figure})
+        return settings
+
+    # /def
+
+    def render(self):
+        """plot the recorded calls, optimized, and clear them
+
+        Returns
+        -------
+        fig : Figure
+        """
+        if self.fig is not None:
+            pyplot.figure(getattr(self.fig, "number", self.fig))
+        fig = pyplot.gcf()
+
+        nodes, settings = self.nodes, self.settings()
+        self.nodes = []
+        if self in _pending():
+            _pending().remove(self)
+
+        graphs = _graphs()
+        graphs.append(None)  # the calls are plotted
+        try:
+            for group, layers in _plan(nodes):
+                first = group[0]
+                if layers is None or len(group) == 1:
+                    first.result = first.func(
+                        *first.args, **first.kwargs, **first.call_options()
+                    )
+                    continue
+
+                segments = [
+                    np.ma.column_stack(np.ma.asarray(l[1:], dtype=float))
+                    for l in layers
+                ]
+                segments = [np.ma.filled(s, np.nan) for s in segments]
+                draw = first.decorator(_draw_lines)
+                lines = draw(segments, layers[0][0], **first.call_options())
+                for node in group:
+                    node.result = lines
+
+            # the merged settings, once per axes
+            for node, merged in settings:
+                apply = node.decorator(_apply_settings)
+                apply(
+                    ax=node.options["ax"],
+                    stylesheet=node.options["stylesheet"],
+                    xkw=node.options["xkw"],
+                    colorbar=False,
+                    sidehists=False,
+                    **{**_settings, **merged},
+                )
+        finally:
+            graphs.pop()
+
+        return fig
+
+    # /def
+
+
+# /class
+
+
+def _apply_settings():
+    """apply decorator settings, plotting nothing"""
+    return None
+
+
+# /def
+
+
+def render():
+    """render this thread's figure graphs with calls yet to be rendered
+
+    Returns
+    -------
+    figs : list of Figure
+    """
+    return [graph.render() for graph in list(_pending())]
+
+
+# /def
+
+##############################################################################
+# END
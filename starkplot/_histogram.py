@@ -0,0 +1,527 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _histogram
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""chunked, multithreaded histogram engine
+
+The data are binned in chunks across a thread pool (numpy releases the
+GIL while binning) into fixed edges, and the partial counts are summed.
+Memory-mapped arrays are only read a chunk at a time, and iterators of
+chunks are supported. The finished counts are then drawn by matplotlib,
+which re-bins only one point per bin:
+
+    hist : the bin edges, weighted by the counts
+    hist2d : the bin centers, weighted by the counts
+    hexbin : the hexagon centers, with C = the counts & reduce by sum
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "histogram",
+    "histogram2d",
+    "hexbin_counts",
+    "hist",
+    "hist2d",
+    "hexbin",
+    "use_engine",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import math
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# matplotlib
+from matplotlib import rcParams
+from matplotlib.transforms import nonsingular
+
+
+##############################################################################
+### Info
+
+# elements binned per task
+_chunksize = 2 ** 20
+
+# arrays with at least this many elements use the engine by default
+_engine_threshold = 2 ** 22
+
+
+##############################################################################
+### Chunking
+
+
+def _is_array(data):
+    """whether data is array-like, not an iterator of chunks"""
+    return not isinstance(data, Iterator)
+
+
+# /def
+
+
+def _chunks(*arrs, chunksize=_chunksize):
+    """aligned chunks of same-length arrays (or Nones)"""
+    n = len(next(a for a in arrs if a is not None))
+    for i in range(0, n, chunksize):
+        yield tuple(
+            None if a is None else np.asarray(a[i : i + chunksize])
+            for a in arrs
+        )
+
+
+# /def
+
+
+def _map_chunks(func, chunks, max_workers=None):
+    """func mapped over chunks in a thread pool"""
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda c: func(*c), chunks))
+
+
+# /def
+
+
+def _finite_range(chunks, max_workers=None):
+    """(min, max) of each array over the chunks, where all are finite"""
+
+    def _minmax(*arrs):
+        if not len(arrs[0]):
+            return None
+        lims = [(a.min(), a.max()) for a in arrs]
+        if np.isfinite(lims).all():  # no need to mask
+            return lims
+
+        good = np.ones(len(arrs[0]), dtype=bool)
+        for a in arrs:
+            good &= np.isfinite(a)
+        if not good.any():
+            return None
+        return [(a[good].min(), a[good].max()) for a in arrs]
+
+    parts = [p for p in _map_chunks(_minmax, chunks, max_workers) if p]
+    if not parts:
+        return None
+
+    return [
+        (min(p[i][0] for p in parts), max(p[i][1] for p in parts))
+        for i in range(len(parts[0]))
+    ]
+
+
+# /def
+
+
+##############################################################################
+### Counting
+
+
+def histogram(
+    data,
+    bins=10,
+    range=None,
+    weights=None,
+    chunksize=_chunksize,
+    max_workers=None,
+):
+    """chunked, multithreaded np.histogram
+
+    Parameters
+    ----------
+    data : array-like or iterator of arrays
+        arrays (including memory-mapped) are binned a chunk at a time
+    bins : int or array
+        number of bins or the bin edges
+    range : (float, float), None
+        required for iterators when *bins* is an int.
+        default: the finite min & max of the data
+    weights : array, None
+        same shape as data. not supported for iterators
+    chunksize : int
+        elements binned per task
+    max_workers : int, None
+        threads, see ThreadPoolExecutor
+
+    Returns
+    -------
+    counts : ndarray
+    edges : ndarray
+    """
+    edges = None if np.ndim(bins) == 0 else np.asarray(bins, dtype=float)
+
+    if _is_array(data):
+        data = np.ravel(data)  # a view for contiguous & memory-mapped
+        if weights is not None:
+            weights = np.ravel(weights)
+        chunks = lambda: _chunks(data, weights, chunksize=chunksize)
+    else:
+        if weights is not None:
+            raise ValueError("weights are not supported for iterators")
+        if edges is None and range is None:
+            raise ValueError("range is required for iterators")
+        chunks = lambda: ((np.ravel(c), None) for c in data)
+
+    if edges is None and range is None:
+        lims = _finite_range((c[:1] for c in chunks()), max_workers)
+        range = lims[0] if lims else (0.0, 1.0)
+
+    if edges is None:  # uniform bins, numpy's fast path
+        kw = dict(bins=int(bins), range=range)
+        edges = np.histogram([], **kw)[1]
+    else:
+        kw = dict(bins=edges)
+
+    def _count(x, w):
+        return np.histogram(x, weights=w, **kw)[0]
+
+    counts = sum(_map_chunks(_count, chunks(), max_workers))
+    if np.ndim(counts) == 0:  # no chunks
+        counts = np.zeros(len(edges) - 1)
+
+    return counts, edges
+
+
+# /def
+
+
+def histogram2d(
+    x,
+    y=None,
+    bins=10,
+    range=None,
+    weights=None,
+    chunksize=_chunksize,
+    max_workers=None,
+):
+    """chunked, multithreaded np.histogram2d
+
+    Parameters
+    ----------
+    x, y : arrays, or (iterator of (x, y) chunks, None)
+    bins : int, array, [int, int], or [array, array]
+    range : [[xmin, xmax], [ymin, ymax]], None
+        required for iterators when *bins* are ints
+    weights : array, None
+        not supported for iterators
+    chunksize, max_workers :
+        see histogram
+
+    Returns
+    -------
+    counts : ndarray
+        shape (nx, ny)
+    xedges, yedges : ndarray
+    """
+    if np.isscalar(bins):
+        xbins = ybins = bins
+    elif len(bins) == 2:  # as numpy, [nx, ny] or [xedges, yedges]
+        xbins, ybins = bins
+    else:  # one array of edges for both
+        xbins = ybins = bins
+
+    if y is not None:
+        x, y = np.ravel(x), np.ravel(y)
+        if weights is not None:
+            weights = np.ravel(weights)
+        chunks = lambda: _chunks(x, y, weights, chunksize=chunksize)
+    else:
+        if weights is not None:
+            raise ValueError("weights are not supported for iterators")
+        chunks = lambda: ((np.ravel(a), np.ravel(b), None) for a, b in x)
+
+    edges = []
+    missing = [np.ndim(b) == 0 for b in (xbins, ybins)]
+    if any(missing) and range is None:
+        if y is None:
+            raise ValueError("range is required for iterators")
+        lims = _finite_range((c[:2] for c in chunks()), max_workers)
+        range = lims if lims else [(0.0, 1.0), (0.0, 1.0)]
+    for b, r in zip((xbins, ybins), range or (None, None)):
+        if np.ndim(b) == 0:
+            b = np.histogram([], bins=int(b), range=r)[1]
+        edges.append(np.asarray(b, dtype=float))
+
+    def _count(x, y, w):
+        return np.histogram2d(x, y, bins=edges, weights=w)[0]
+
+    counts = sum(_map_chunks(_count, chunks(), max_workers))
+    if np.ndim(counts) == 0:  # no chunks
+        counts = np.zeros((len(edges[0]) - 1, len(edges[1]) - 1))
+
+    return counts, edges[0], edges[1]
+
+
+# /def
+
+
+def hexbin_counts(
+    x, y, gridsize=100, extent=None, chunksize=_chunksize, max_workers=None
+):
+    """chunked, multithreaded counts on matplotlib's hexbin lattice
+
+    Parameters
+    ----------
+    x, y : arrays
+    gridsize : int or (int, int)
+        see Axes.hexbin
+    extent : (xmin, xmax, ymin, ymax), None
+        default: the finite data limits, made nonsingular, as hexbin
+
+    Returns
+    -------
+    lattice1 : ndarray
+        counts, shape (nx + 1, ny + 1)
+    lattice2 : ndarray
+        counts, shape (nx, ny)
+    extent : tuple
+        to pass to hexbin, so it makes the same lattice
+    """
+    x, y = np.ravel(x), np.ravel(y)
+    chunks = lambda: _chunks(x, y, chunksize=chunksize)
+
+    if np.iterable(gridsize):
+        nx, ny = gridsize
+    else:
+        nx = gridsize
+        ny = int(nx / math.sqrt(3))
+
+    if extent is None:
+        lims = _finite_range(chunks(), max_workers)
+        (xmin, xmax), (ymin, ymax) = lims or [(0, 1), (0, 1)]
+        xmin, xmax = nonsingular(xmin, xmax, expander=0.1)
+        ymin, ymax = nonsingular(ymin, ymax, expander=0.1)
+        extent = (xmin, xmax, ymin, ymax)
+    xmin, xmax, ymin, ymax = extent
+
+    # the lattice, as in Axes.hexbin
+    padding = 1.0e-9 * (xmax - xmin)
+    xmin -= padding
+    xmax += padding
+    sx = (xmax - xmin) / nx
+    sy = (ymax - ymin) / ny
+    nx1, ny1 = nx + 1, ny + 1
+
+    def _count(x, y):
+        good = np.isfinite(x) & np.isfinite(y)
+        x = (x[good] - xmin) / sx
+        y = (y[good] - ymin) / sy
+        ix1 = np.round(x).astype(int)
+        iy1 = np.round(y).astype(int)
+        ix2 = np.floor(x).astype(int)
+        iy2 = np.floor(y).astype(int)
+
+        d1 = (x - ix1) ** 2 + 3.0 * (y - iy1) ** 2
+        d2 = (x - ix2 - 0.5) ** 2 + 3.0 * (y - iy2 - 0.5) ** 2
+        bdist = d1 < d2
+
+        cond1 = (0 <= ix1) & (ix1 < nx1) & (0 <= iy1) & (iy1 < ny1) & bdist
+        cond2 = (0 <= ix2) & (ix2 < nx) & (0 <= iy2) & (iy2 < ny) & ~bdist
+
+        lattice1 = np.bincount(
+            ix1[cond1] * ny1 + iy1[cond1], minlength=nx1 * ny1
+        )
+        lattice2 = np.bincount(
+            ix2[cond2] * ny + iy2[cond2], minlength=nx * ny
+        )
+        return lattice1, lattice2
+
+    parts = _map_chunks(_count, chunks(), max_workers)
+    lattice1 = sum(p[0] for p in parts) + np.zeros(nx1 * ny1)
+    lattice2 = sum(p[1] for p in parts) + np.zeros(nx * ny)
+
+    return (
+        lattice1.reshape(nx1, ny1),
+        lattice2.reshape(nx, ny),
+        tuple(float(e) for e in extent),
+    )
+
+
+# /def
+
+
+##############################################################################
+### Drawing
+
+
+def use_engine(*arrs, engine=None):
+    """whether to use the histogram engine
+
+    Parameters
+    ----------
+    *arrs : the data arguments
+    engine : bool, None
+        None: for iterators of chunks, and array-likes above the size
+        threshold
+
+    Returns
+    -------
+    bool
+    """
+    if engine is not None:
+        return bool(engine)
+    if not all(_is_array(a) for a in arrs):  # iterators are opted in
+        return True
+    return np.size(np.asanyarray(arrs[0])) >= _engine_threshold
+
+
+# /def
+
+
+def hist(
+    ax,
+    x,
+    bins=None,
+    range=None,
+    weights=None,
+    chunksize=_chunksize,
+    max_workers=None,
+    **kw
+):
+    """Axes.hist, binned by the histogram engine
+
+    *x* is one array, or an iterator of chunks. Other arguments are as
+    for Axes.hist, except that *bins* cannot be a string.
+
+    Returns
+    -------
+    n, bins, patches : see Axes.hist
+    """
+    if bins is None:
+        bins = rcParams["hist.bins"]
+    counts, edges = histogram(
+        x,
+        bins=bins,
+        range=range,
+        weights=weights,
+        chunksize=chunksize,
+        max_workers=max_workers,
+    )
+    return ax.hist(edges[:-1], bins=edges, weights=counts, **kw)
+
+
+# /def
+
+
+def hist2d(
+    ax,
+    x,
+    y=None,
+    bins=10,
+    range=None,
+    weights=None,
+    chunksize=_chunksize,
+    max_workers=None,
+    **kw
+):
+    """Axes.hist2d, binned by the histogram engine
+
+    *x*, *y* are arrays, or *x* is an iterator of (x, y) chunks and *y*
+    is None. Other arguments are as for Axes.hist2d.
+
+    Returns
+    -------
+    h, xedges, yedges, image : see Axes.hist2d
+    """
+    counts, xedges, yedges = histogram2d(
+        x,
+        y,
+        bins=bins,
+        range=range,
+        weights=weights,
+        chunksize=chunksize,
+        max_workers=max_workers,
+    )
+    xc = 0.5 * (xedges[1:] + xedges[:-1])
+    yc = 0.5 * (yedges[1:] + yedges[:-1])
+    xc, yc = np.meshgrid(xc, yc, indexing="ij")
+
+    return ax.hist2d(
+        xc.ravel(),
+        yc.ravel(),
+        bins=[xedges, yedges],
+        weights=counts.ravel(),
+        **kw
+    )
+
+
+# /def
+
+
+def hexbin(
+    ax,
+    x,
+    y,
+    gridsize=100,
+    extent=None,
+    mincnt=None,
+    chunksize=_chunksize,
+    max_workers=None,
+    **kw
+):
+    """Axes.hexbin of counts, binned by the histogram engine
+
+    Only for linear scales, without *C* or *marginals*. Other arguments
+    are as for Axes.hexbin.
+
+    Returns
+    -------
+    PolyCollection : see Axes.hexbin
+    """
+    lattice1, lattice2, extent = hexbin_counts(
+        x,
+        y,
+        gridsize=gridsize,
+        extent=extent,
+        chunksize=chunksize,
+        max_workers=max_workers,
+    )
+    nx1, ny1 = lattice1.shape
+    nx, ny = lattice2.shape
+
+    # the hexagon centers, as in Axes.hexbin
+    xmin, xmax, ymin, ymax = extent
+    padding = 1.0e-9 * (xmax - xmin)
+    sx = (xmax - xmin + 2 * padding) / nx
+    sy = (ymax - ymin) / ny
+    x0 = xmin - padding
+
+    ix1, iy1 = np.meshgrid(np.arange(nx1), np.arange(ny1), indexing="ij")
+    ix2, iy2 = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+    xc = np.concatenate((ix1.ravel() * sx, (ix2.ravel() + 0.5) * sx)) + x0
+    yc = np.concatenate((iy1.ravel() * sy, (iy2.ravel() + 0.5) * sy)) + ymin
+    counts = np.concatenate((lattice1.ravel(), lattice2.ravel()))
+
+    # each center is one point, so thresholds are applied here
+    if mincnt is not None:
+        keep = counts >= mincnt
+        xc, yc, counts = xc[keep], yc[keep], counts[keep]
+
+    return ax.hexbin(
+        xc,
+        yc,
+        C=counts,
+        gridsize=gridsize,
+        extent=extent,
+        reduce_C_function=np.sum,
+        mincnt=0,
+        **kw
+    )
+
+
+# /def
+
+##############################################################################
+# END
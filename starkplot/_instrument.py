@@ -0,0 +1,402 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _instrument
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""per-call instrumentation of decorated functions
+
+When on, each decorated call is measured:
+
+    - its wall time
+    - its peak traced memory (with tracemalloc), above the memory at
+      the start of the call
+    - the artists it added to the open figures, their path vertices
+      and the bytes of data they retain
+
+and the measurements are aggregated by function name, see call_stats &
+export_call_stats. Nested decorated calls are also counted in the calls
+which made them.
+
+Before Python 3.9 tracemalloc's peak can't be reset, so a call's peak
+is a lower bound when an earlier call had a higher peak.
+
+Example
+-------
+>>> with instrumentation():
+...     report()
+>>> print(export_call_stats(format="csv"))
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "instrument_call",
+    "start_instrumentation",
+    "stop_instrumentation",
+    "instrumentation",
+    "call_stats",
+    "reset_call_stats",
+    "export_call_stats",
+    "artist_vertices",
+    "artist_nbytes",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import csv
+import io
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+
+import numpy as np
+
+# matplotlib
+from matplotlib._pylab_helpers import Gcf
+from matplotlib.collections import Collection, QuadMesh
+from matplotlib.image import AxesImage
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+
+
+##############################################################################
+### Info
+
+# the instrumentation state
+_state = {"active": False, "memory": False, "started_tracing": False}
+
+# the aggregated measurements, by function name
+_stats = {}
+_lock = threading.Lock()
+
+# the peaks seen by the calls being measured, outermost first
+_peaks = []
+
+# the aggregated fields, in export order
+_fields = (
+    "calls",
+    "time",
+    "time_max",
+    "peak_memory_max",
+    "artists",
+    "vertices",
+    "nbytes",
+    "nbytes_max",
+)
+
+
+##############################################################################
+### Artists
+
+
+def artist_vertices(artist):
+    """the number of path vertices an artist draws"""
+    if isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+    elif isinstance(artist, QuadMesh):
+        return (artist._meshWidth + 1) * (artist._meshHeight + 1)
+    elif isinstance(artist, Collection):
+        paths = artist.get_paths()
+        if not len(paths):
+            return 0
+        offsets = len(artist.get_offsets())
+        if offsets > 1:  # the paths repeat at each offset
+            return int(
+                max(offsets, len(paths)) * np.mean([len(p) for p in paths])
+            )
+        return sum(len(p) for p in paths)
+    elif isinstance(artist, Patch):
+        return len(artist.get_path())
+    return 0
+
+
+# /def
+
+
+def _nbytes(arr):
+    return getattr(arr, "nbytes", 0) if arr is not None else 0
+
+
+# /def
+
+
+def artist_nbytes(artist):
+    """the bytes of data an artist retains"""
+    if isinstance(artist, Line2D):
+        return (
+            _nbytes(getattr(artist, "_xy", None))
+            + _nbytes(np.asanyarray(artist.get_xdata(orig=True)))
+            + _nbytes(np.asanyarray(artist.get_ydata(orig=True)))
+        )
+    elif isinstance(artist, QuadMesh):
+        return _nbytes(artist._coordinates) + _nbytes(artist.get_array())
+    elif isinstance(artist, Collection):
+        return (
+            _nbytes(artist.get_offsets())
+            + sum(_nbytes(p.vertices) for p in artist.get_paths())
+            + _nbytes(artist.get_array())
+        )
+    elif isinstance(artist, AxesImage):
+        return _nbytes(artist.get_array())
+    elif isinstance(artist, Patch):
+        return _nbytes(artist.get_path().vertices)
+    return 0
+
+
+# /def
+
+
+def _artists():
+    """the artists of the open figures & their axes, by id"""
+    artists = {}
+    for manager in Gcf.get_all_fig_managers():
+        fig = manager.canvas.figure
+        for artist in fig.get_children():
+            artists[id(artist)] = artist
+        for ax in fig.axes:
+            for artist in ax.get_children():
+                artists[id(artist)] = artist
+    return artists
+
+
+# /def
+
+
+##############################################################################
+### Measuring
+
+
+class _Probe(object):
+    """the measurements of one call"""
+
+    __slots__ = ("name", "t0", "mem0", "before", "seen")
+
+    def __init__(self, name):
+        self.name = name
+        self.before = _artists()
+        self.mem0, self.seen = None, 0
+        if _state["memory"] and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            for probe in _peaks:  # as the peak is reset
+                probe.seen = max(probe.seen, peak)
+            self.mem0, self.seen = current, current
+            if hasattr(tracemalloc, "reset_peak"):  # python >= 3.9
+                tracemalloc.reset_peak()
+        _peaks.append(self)
+        self.t0 = time.perf_counter()
+
+    # /def
+
+    def stop(self):
+        elapsed = time.perf_counter() - self.t0
+        _peaks.remove(self)
+
+        peak = 0
+        if self.mem0 is not None and tracemalloc.is_tracing():
+            _, top = tracemalloc.get_traced_memory()
+            top = max(top, self.seen)
+            for probe in _peaks:
+                probe.seen = max(probe.seen, top)
+            peak = max(top - self.mem0, 0)
+
+        added = [a for i, a in _artists().items() if i not in self.before]
+        nbytes = sum(artist_nbytes(a) for a in added)
+        _record(
+            self.name,
+            time=elapsed,
+            peak_memory=peak,
+            artists=len(added),
+            vertices=sum(artist_vertices(a) for a in added),
+            nbytes=nbytes,
+        )
+
+    # /def
+
+
+# /class
+
+
+def _record(
+    name, time=0.0, peak_memory=0, artists=0, vertices=0, nbytes=0
+):
+    """add a call's measurements to the function's aggregate"""
+    with _lock:
+        stats = _stats.setdefault(name, dict.fromkeys(_fields, 0))
+        stats["calls"] += 1
+        stats["time"] += time
+        stats["time_max"] = max(stats["time_max"], time)
+        stats["peak_memory_max"] = max(stats["peak_memory_max"], peak_memory)
+        stats["artists"] += artists
+        stats["vertices"] += vertices
+        stats["nbytes"] += nbytes
+        stats["nbytes_max"] = max(stats["nbytes_max"], nbytes)
+
+
+# /def
+
+
+def instrument_call(func, name=None):
+    """wrap a function, to measure its calls when instrumentation is on
+
+    Parameters
+    ----------
+    func : function
+    name : str, optional
+        the aggregate's name. default: the function's name
+
+    Returns
+    -------
+    instrumented : function
+    """
+    name = func.__name__ if name is None else name
+
+    @wraps(func)
+    def instrumented(*args, **kwargs):
+        if not _state["active"]:
+            return func(*args, **kwargs)
+
+        probe = _Probe(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            probe.stop()
+
+    # /def
+
+    return instrumented
+
+
+# /def
+
+
+##############################################################################
+### Control
+
+
+def start_instrumentation(memory=True):
+    """measure the decorated calls
+
+    Parameters
+    ----------
+    memory : bool
+        whether to trace memory, starting tracemalloc if not tracing.
+        tracing slows Python down
+    """
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _state["started_tracing"] = True
+    _state.update(active=True, memory=memory)
+
+
+# /def
+
+
+def stop_instrumentation():
+    """stop measuring the decorated calls
+
+    tracemalloc is stopped, if started by start_instrumentation
+    """
+    if _state["started_tracing"]:
+        tracemalloc.stop()
+    _state.update(active=False, memory=False, started_tracing=False)
+
+
+# /def
+
+
+@contextmanager
+def instrumentation(memory=True):
+    """measure the decorated calls in a with block, see
+    start_instrumentation"""
+    start_instrumentation(memory=memory)
+    try:
+        yield
+    finally:
+        stop_instrumentation()
+
+
+# /def
+
+
+def call_stats():
+    """the aggregated measurements, by function name
+
+    Returns
+    -------
+    stats : dict
+        of dicts with the calls, the total & max time (s), the max peak
+        memory (bytes), the total artists, vertices & bytes they retain,
+        and the max bytes of a call
+    """
+    with _lock:
+        return {name: dict(stats) for name, stats in _stats.items()}
+
+
+# /def
+
+
+def reset_call_stats():
+    """clear the aggregated measurements"""
+    with _lock:
+        _stats.clear()
+
+
+# /def
+
+
+def export_call_stats(fname=None, format="csv"):
+    """export the aggregated measurements
+
+    Parameters
+    ----------
+    fname : str, optional
+        the file to write
+    format : str
+        'csv' or 'json'
+
+    Returns
+    -------
+    text : str
+
+    Raises
+    ------
+    ValueError
+        if the format isn't 'csv' or 'json'
+    """
+    stats = call_stats()
+    if format == "json":
+        text = json.dumps(stats, indent=2, sort_keys=True)
+    elif format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(("name",) + _fields)
+        for name in sorted(stats):
+            writer.writerow((name,) + tuple(stats[name][k] for k in _fields))
+        text = buffer.getvalue()
+    else:
+        raise ValueError(f"format must be 'csv' or 'json', not {format!r}")
+
+    if fname is not None:
+        with open(fname, "w") as file:
+            file.write(text)
+
+    return text
+
+
+# /def
+
+##############################################################################
+# END
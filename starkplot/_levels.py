@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _levels
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""credible (enclosed-mass) contour levels
+
+The level enclosing a fraction of the mass of a density grid is the
+density above which the grid cells sum to that fraction. All levels
+come from one descending sort and cumulative sum of the grid, which is
+cached per grid array, so contour & contourf of one grid sort it once.
+Grid cells are assumed to be of equal area.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "sigma_masses",
+    "parse_credible_levels",
+    "credible_levels",
+    "credible_contour_args",
+    "clear_levels_cache",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+from math import erf, sqrt
+
+import numpy as np
+
+## Project-Specific
+from ._quantile import _ArrayCache
+
+
+##############################################################################
+### Info
+
+# {(grid, 'mass'): (descending density, cumulative mass fraction)}
+_mass_cache = _ArrayCache()
+
+
+##############################################################################
+### Masses
+
+
+def sigma_masses(sigmas=(1, 2, 3)):
+    """the mass enclosed within n sigma of a 1D Gaussian
+
+    Parameters
+    ----------
+    sigmas : float or sequence of floats
+
+    Returns
+    -------
+    masses : tuple of float
+        ex: (0.6827, 0.9545, 0.9973)
+    """
+    return tuple(erf(s / sqrt(2)) for s in np.atleast_1d(sigmas))
+
+
+# /def
+
+
+def parse_credible_levels(levels):
+    """the enclosed masses of a credible-levels specification
+
+    Parameters
+    ----------
+    levels : str or sequence of floats
+        'sigma' for 1, 2 & 3 sigma, 'sigma:1,2' for 1 & 2 sigma,
+        or the masses, each in (0, 1]
+
+    Returns
+    -------
+    masses : tuple of float
+        increasing
+
+    Raises
+    ------
+    ValueError
+        if not a valid specification
+    """
+    if isinstance(levels, str):
+        name, _, sigmas = levels.partition(":")
+        if name.strip() != "sigma":
+            raise ValueError(f"{levels!r} is not a credible level spec")
+        if sigmas:
+            masses = sigma_masses([float(s) for s in sigmas.split(",")])
+        else:
+            masses = sigma_masses()
+    else:
+        masses = tuple(float(m) for m in np.atleast_1d(levels))
+
+    if not all(0 < m <= 1 for m in masses):
+        raise ValueError("credible level masses must be in (0, 1]")
+
+    return tuple(sorted(masses))
+
+
+# /def
+
+
+##############################################################################
+### Levels
+
+
+def _cumulative_mass(grid):
+    """the grid values, descending, and the fraction of the mass above"""
+    values = np.ma.filled(np.ma.asarray(grid, dtype=float), np.nan).ravel()
+    values = values[np.isfinite(values)]
+    values = -np.sort(-values)  # descending
+    mass = np.cumsum(values)
+    if len(mass) and mass[-1] > 0:
+        mass /= mass[-1]
+    return values, mass
+
+
+# /def
+
+
+def credible_levels(grid, levels="sigma", cache=True):
+    """the density levels enclosing fractions of the mass of a grid
+
+    Parameters
+    ----------
+    grid : array-like
+        the density, non-negative. Non-finite cells are ignored.
+    levels : str or sequence of floats
+        see parse_credible_levels
+    cache : bool
+        whether to reuse the sorted grid of an earlier call
+
+    Returns
+    -------
+    thresholds : ndarray
+        increasing, so for decreasing masses
+    """
+    masses = parse_credible_levels(levels)
+
+    if cache:
+        values, mass = _mass_cache.get(grid, "mass", _cumulative_mass)
+    else:
+        values, mass = _cumulative_mass(grid)
+
+    if not len(values):
+        return np.array([])
+
+    idx = np.searchsorted(mass, masses)
+    thresholds = values[np.minimum(idx, len(values) - 1)]
+
+    return thresholds[::-1]
+
+
+# /def
+
+
+def credible_contour_args(args, kwargs, filled=False):
+    """replace credible levels in contour arguments by density levels
+
+    Credible levels are given by ``levels='sigma'`` or the like, or by
+    ``credible_levels=``, see parse_credible_levels.
+
+    Parameters
+    ----------
+    args : tuple
+        ``[X, Y,] Z, [levels]``
+    kwargs : dict
+    filled : bool
+        whether for contourf, whose levels are bounded by the grid maximum
+
+    Returns
+    -------
+    args : tuple
+    kwargs : dict
+    """
+    kwargs = dict(kwargs)
+    spec = kwargs.pop("credible_levels", None)
+    levels = kwargs.get("levels", None)
+    if spec is None and isinstance(levels, str):
+        spec = levels
+    if spec is None:
+        return args, kwargs
+
+    grid = args[2] if len(args) > 2 else args[0]
+    if len(args) in (2, 4):  # positional levels
+        args = args[:-1]
+
+    thresholds = np.unique(credible_levels(grid, spec))
+    if filled:
+        top = np.ma.filled(np.ma.asarray(grid, dtype=float), np.nan)
+        top = np.nanmax(top)
+        thresholds = np.unique(np.r_[thresholds, top])
+    kwargs["levels"] = thresholds
+
+    return args, kwargs
+
+
+# /def
+
+
+def clear_levels_cache():
+    """clear the cached sorted grids"""
+    _mass_cache.clear()
+
+
+# /def
+
+##############################################################################
+# END
@@ -29,6 +29,8 @@ TODO
 ## General Imports
 from warnings import warn
 
+import numpy as np
+
 # matplotlib
 # from matplotlib.pyplot import *  # start by importing all of _pyplot
 from matplotlib import pyplot as _pyplot  # for usage here
@@ -47,6 +49,27 @@ from ._util import (
 )
 
 from ._info import _pltypes
+from ._units import strip_plot_args, strip_args
+from . import (
+    _datafile,
+    _errorbar,
+    _histogram,
+    _pyramid,
+    _spectral,
+    _stats,
+    _vectorfield,
+)
+from ._triangulation import triangulation_from_args
+from ._levels import credible_contour_args
+from ._preclip import preclip_plot_args, preclip_args
+
+# leading arguments (and their axes) whose units are stripped
+_scatter_args = (("x", "y"), "xy")
+_errorbar_args = (("x", "y", "yerr", "xerr"), "xyyx")
+
+# leading arguments clipped to the decorator's limits, with preclip
+_scatter_clip = ("x", "y", "s", "c")
+_errorbar_clip = (_errorbar_args[0], ("yerr", "xerr"))
 
 # TODO get rid of
 # try:
@@ -149,6 +172,24 @@ def plot(*args, pltype="plot", **kwargs):
     ====================== ===================================================
     """
 
+    # astropy Quantities -> ndarrays in the axes' units
+    if pltype in ("plot", "loglog", "semilogx", "semilogy", "step"):
+        args = strip_plot_args(_pyplot.gca(), args)
+    elif pltype == "scatter":
+        args, kwargs = strip_args(_pyplot.gca(), args, kwargs, *_scatter_args)
+    elif pltype == "errorbar":
+        args, kwargs = strip_args(
+            _pyplot.gca(), args, kwargs, *_errorbar_args
+        )
+
+    # clipped to the decorator's limits, if preclip
+    if pltype == "plot":
+        args = preclip_plot_args(args)
+    elif pltype == "scatter":
+        args, kwargs = preclip_args(args, kwargs, _scatter_clip)
+    elif pltype == "errorbar":
+        args, kwargs = preclip_args(args, kwargs, *_errorbar_clip)
+
     # The Common Plot Types
     if pltype == "plot":
         res = _pyplot.plot(*args, **kwargs)
@@ -157,7 +198,7 @@ def plot(*args, pltype="plot", **kwargs):
         res = _pyplot.scatter(*args, **kwargs)
 
     elif pltype == "errorbar":
-        res = _pyplot.errorbar(*args, **kwargs)
+        res = _fast_errorbar(args, kwargs)
 
     elif pltype == "loglog":
         res = _pyplot.loglog(*args, **kwargs)
@@ -257,8 +298,31 @@ def bar(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.barbs.__doc__)
-def barbs(*args, **kwargs):
-    r"""starkplot wrapper for barbs"""
+def barbs(*args, subsample=None, pool=False, spacing=None, **kwargs):
+    r"""starkplot wrapper for barbs
+
+    subsample: bool, int, (int, int), None
+        whether to subsample the vectors of a 2D grid, with strides which
+        space them *spacing* points apart on the axes, or these strides
+        None: for grids of many vectors
+    pool: bool
+        whether to average the vectors over each stride block,
+        rather than take every stride-th one
+    spacing: float, None
+        the spacing of the subsampled vectors, in points
+    """
+    if 2 <= len(args) <= 5 and _vectorfield.use_subsample(
+        args[2 if len(args) >= 4 else 0], subsample
+    ):
+        args = _vectorfield.subsample_field(
+            _pyplot.gca(),
+            args,
+            subsample=subsample,
+            pool=pool,
+            kind="barbs",
+            spacing=spacing,
+        )
+
     return _pyplot.barbs(*args, **kwargs)
 
 
@@ -275,8 +339,30 @@ def barh(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.boxplot.__doc__)
-def boxplot(*args, **kwargs):
-    r"""starkplot wrapper for boxplot"""
+def boxplot(*args, engine=None, groups=None, **kwargs):
+    r"""starkplot wrapper for boxplot
+
+    engine: bool, None
+        whether to compute the statistics of all boxes at once, with the
+        vectorized statistics engine, which ignores NaN values
+        None: for many boxes, *groups*, or if *x* is a list of
+        QuantileSketches or of precomputed statistics dicts (see bxp)
+    groups: array-like, None
+        the group label of each value of a flat *x*, one box per label
+    """
+    kw = _bindargs(
+        args,
+        kwargs,
+        ("x", "notch", "sym", "vert", "whis", "positions", "widths"),
+    )
+    if (
+        kw is not None
+        and engine is not False
+        and "data" not in kw
+        and _stats.use_engine(kw["x"], groups, engine=engine)
+    ):
+        return _stats.boxplot(_pyplot.gca(), groups=groups, **kw)
+
     return _pyplot.boxplot(*args, **kwargs)
 
 
@@ -293,8 +379,28 @@ def broken_barh(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.cohere.__doc__)
-def cohere(*args, **kwargs):
-    r"""starkplot wrapper for cohere"""
+def cohere(*args, engine=None, **kwargs):
+    r"""starkplot wrapper for cohere
+
+    engine: bool, None
+        whether to compute with the streaming, multithreaded spectral
+        engine, which reads the signal a chunk at a time
+        None: for memory-mapped or large arrays, or iterators of chunks
+        (or of (x, y) chunks, with y=None)
+    """
+    kw = _bindargs(
+        args,
+        kwargs,
+        ("x", "y", "NFFT", "Fs", "Fc", "detrend", "window", "noverlap"),
+    )
+    if (
+        kw is not None
+        and engine is not False
+        and "data" not in kw
+        and _spectral.use_engine(kw["x"], kw.get("y"), engine=engine)
+    ):
+        return _spectral.cohere(_pyplot.gca(), **kw)
+
     return _pyplot.cohere(*args, **kwargs)
 
 
@@ -303,7 +409,12 @@ def cohere(*args, **kwargs):
 
 @mpl_decorator(funcdoc=_pyplot.contour.__doc__)
 def contour(*args, **kwargs):
-    r"""starkplot wrapper for contour"""
+    r"""starkplot wrapper for contour
+
+    levels may be credible (enclosed-mass) levels, ex: ``levels='sigma'``
+    or ``credible_levels=(0.68, 0.95)``, see credible_levels
+    """
+    args, kwargs = credible_contour_args(args, kwargs)
     return _pyplot.contour(*args, **kwargs)
 
 
@@ -312,7 +423,12 @@ def contour(*args, **kwargs):
 
 @mpl_decorator(funcdoc=_pyplot.contourf.__doc__)
 def contourf(*args, **kwargs):
-    r"""starkplot wrapper for contourf"""
+    r"""starkplot wrapper for contourf
+
+    levels may be credible (enclosed-mass) levels, ex: ``levels='sigma'``
+    or ``credible_levels=(0.68, 0.95)``, see credible_levels
+    """
+    args, kwargs = credible_contour_args(args, kwargs, filled=True)
     return _pyplot.contourf(*args, **kwargs)
 
 
@@ -320,8 +436,28 @@ def contourf(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.csd.__doc__)
-def csd(*args, **kwargs):
-    r"""starkplot wrapper for csd"""
+def csd(*args, engine=None, **kwargs):
+    r"""starkplot wrapper for csd
+
+    engine: bool, None
+        whether to compute with the streaming, multithreaded spectral
+        engine, which reads the signal a chunk at a time
+        None: for memory-mapped or large arrays, or iterators of chunks
+        (or of (x, y) chunks, with y=None)
+    """
+    kw = _bindargs(
+        args,
+        kwargs,
+        ("x", "y", "NFFT", "Fs", "Fc", "detrend", "window", "noverlap"),
+    )
+    if (
+        kw is not None
+        and engine is not False
+        and "data" not in kw
+        and _spectral.use_engine(kw["x"], kw.get("y"), engine=engine)
+    ):
+        return _spectral.csd(_pyplot.gca(), **kw)
+
     return _pyplot.csd(*args, **kwargs)
 
 
@@ -329,8 +465,63 @@ def csd(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.errorbar.__doc__)
-def errorbar(*args, **kwargs):
-    r"""starkplot wrapper for errorbar"""
+def errorbar(*args, fast=None, bands=False, merge=True, **kwargs):
+    r"""starkplot wrapper for errorbar
+
+    fast: bool, None
+        whether to draw with vectorized error segments, merging the
+        points in the same pixel
+        None: for many points, or *bands*
+        not with lolims, uplims, xlolims, xuplims or errorevery
+    bands: bool, int
+        whether to draw the y errors as a fill_between band (if fast).
+        an int is the number of bins in x, default the axes pixel width
+    merge: bool
+        whether to merge the points in the same pixel (if fast)
+    """
+    args, kwargs = strip_args(_pyplot.gca(), args, kwargs, *_errorbar_args)
+    args, kwargs = preclip_args(args, kwargs, *_errorbar_clip)
+    return _fast_errorbar(
+        args, dict(kwargs, fast=fast, bands=bands, merge=merge)
+    )
+
+
+# /def
+
+
+def _fast_errorbar(args, kwargs):
+    """errorbar, with the fast options of the errorbar wrapper"""
+    kwargs = dict(kwargs)
+    fast = kwargs.pop("fast", None)
+    bands = kwargs.pop("bands", False)
+    merge = kwargs.pop("merge", True)
+    if fast is None and bands:
+        fast = True
+
+    kw = _bindargs(
+        args,
+        kwargs,
+        (
+            "x",
+            "y",
+            "yerr",
+            "xerr",
+            "fmt",
+            "ecolor",
+            "elinewidth",
+            "capsize",
+            "barsabove",
+        ),
+    )
+    if (
+        kw is not None
+        and "data" not in kw
+        and _errorbar.use_fast(kw, fast=fast)
+    ):
+        return _errorbar.errorbar(
+            _pyplot.gca(), bands=bands, merge=merge, **kw
+        )
+
     return _pyplot.errorbar(*args, **kwargs)
 
 
@@ -382,9 +573,43 @@ def fill_betweenx(*args, **kwargs):
 # /def
 
 
+def _bindargs(args, kwargs, names):
+    """the leading arguments by name, None if there are more than *names*
+    """
+    if len(args) > len(names):
+        return None
+    kw = dict(zip(names, args))
+    kw.update(kwargs)
+    return kw
+
+
+# /def
+
+
 @mpl_decorator(funcdoc=_pyplot.hexbin.__doc__)
-def hexbin(*args, **kwargs):
-    r"""starkplot wrapper for hexbin"""
+def hexbin(*args, engine=None, **kwargs):
+    r"""starkplot wrapper for hexbin
+
+    engine: bool, None
+        whether to count with the chunked, multithreaded histogram engine
+        None: for arrays above a size threshold
+        only for linear scales, without C or marginals
+    """
+    kw = _bindargs(args, kwargs, ("x", "y", "C", "gridsize", "bins"))
+    if (
+        kw is not None
+        and engine is not False
+        and kw.get("C") is None
+        and kw.get("xscale", "linear") == "linear"
+        and kw.get("yscale", "linear") == "linear"
+        and not kw.get("marginals", False)
+        and _histogram.use_engine(kw["x"], kw["y"], engine=engine)
+    ):
+        kw.pop("C", None)
+        kw.pop("xscale", None)
+        kw.pop("yscale", None)
+        return _histogram.hexbin(_pyplot.gca(), **kw)
+
     return _pyplot.hexbin(*args, **kwargs)
 
 
@@ -392,8 +617,25 @@ def hexbin(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.hist.__doc__)
-def hist(*args, **kwargs):
-    r"""starkplot wrapper for hist"""
+def hist(*args, engine=None, **kwargs):
+    r"""starkplot wrapper for hist
+
+    engine: bool, None
+        whether to bin with the chunked, multithreaded histogram engine
+        None: for a 1D array above a size threshold, or an iterator
+        of chunks. only for one dataset and non-string bins
+    """
+    kw = _bindargs(args, kwargs, ("x", "bins", "range", "density", "weights"))
+    if (
+        kw is not None
+        and engine is not False
+        and np.ndim(kw["x"]) <= 1
+        and not isinstance(kw.get("bins"), str)
+        and not kw.get("stacked", False)
+        and _histogram.use_engine(kw["x"], engine=engine)
+    ):
+        return _histogram.hist(_pyplot.gca(), **kw)
+
     return _pyplot.hist(*args, **kwargs)
 
 
@@ -401,8 +643,27 @@ def hist(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.hist2d.__doc__)
-def hist2d(*args, **kwargs):
-    r"""starkplot wrapper for hist2d"""
+def hist2d(*args, engine=None, **kwargs):
+    r"""starkplot wrapper for hist2d
+
+    engine: bool, None
+        whether to bin with the chunked, multithreaded histogram engine
+        None: for arrays above a size threshold, or an iterator of
+        (x, y) chunks (with y=None)
+    """
+    kw = _bindargs(
+        args, kwargs, ("x", "y", "bins", "range", "density", "weights")
+    )
+    if (
+        kw is not None
+        and engine is not False
+        and _histogram.use_engine(
+            *((kw["x"],) if kw.get("y") is None else (kw["x"], kw["y"])),
+            engine=engine
+        )
+    ):
+        return _histogram.hist2d(_pyplot.gca(), **kw)
+
     return _pyplot.hist2d(*args, **kwargs)
 
 
@@ -419,8 +680,19 @@ def hlines(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.imshow.__doc__)
-def imshow(*args, **kwargs):
-    r"""starkplot wrapper for imshow"""
+def imshow(*args, pyramid=None, **kwargs):
+    r"""starkplot wrapper for imshow
+
+    pyramid: bool, None
+        whether to draw from a multi-resolution image pyramid, at the
+        level matching the axes' pixel extent
+        None: for images above a size threshold
+    """
+    X = args[0] if args else kwargs.get("X")
+    if len(args) <= 1 and _pyramid.use_pyramid(X, pyramid):
+        kwargs.pop("X", None)
+        return _pyramid.imshow(_pyplot.gca(), X, **kwargs)
+
     return _pyplot.imshow(*args, **kwargs)
 
 
@@ -430,6 +702,7 @@ def imshow(*args, **kwargs):
 @mpl_decorator(funcdoc=_pyplot.loglog.__doc__)
 def loglog(*args, **kwargs):
     r"""starkplot wrapper for loglog"""
+    args = strip_plot_args(_pyplot.gca(), args)
     return _pyplot.loglog(*args, **kwargs)
 
 
@@ -446,8 +719,20 @@ def magnitude_spectrum(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.matshow.__doc__)
-def matshow(*args, **kwargs):
-    r"""starkplot wrapper for matshow"""
+def matshow(*args, pyramid=None, **kwargs):
+    r"""starkplot wrapper for matshow
+
+    pyramid: bool, None
+        whether to draw from a multi-resolution image pyramid, at the
+        level matching the axes' pixel extent. drawn on the current axes
+        None: for images above a size threshold
+    """
+    A = args[0] if args else kwargs.get("A")
+    if len(args) <= 1 and _pyramid.use_pyramid(A, pyramid):
+        kwargs.pop("A", None)
+        kwargs.pop("fignum", None)
+        return _pyramid.matshow(_pyplot.gca(), A, **kwargs)
+
     return _pyplot.matshow(*args, **kwargs)
 
 
@@ -464,8 +749,23 @@ def pcolor(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.pcolormesh.__doc__)
-def pcolormesh(*args, **kwargs):
-    r"""starkplot wrapper for pcolormesh"""
+def pcolormesh(*args, pyramid=None, **kwargs):
+    r"""starkplot wrapper for pcolormesh
+
+    pyramid: bool, None
+        whether to draw from a multi-resolution image pyramid, at the
+        level matching the axes' pixel extent. returns an AxesImage
+        only for C, or X, Y, C with uniformly spaced 1D cell edges
+        None: for arrays above a size threshold, on uniform grids,
+        without edges, antialiasing or shading
+    """
+    if len(args) in (1, 3) and _pyramid.use_pyramid(args[-1], pyramid):
+        try:
+            return _pyramid.pcolormesh(_pyplot.gca(), *args, **kwargs)
+        except ValueError:  # not a uniform grid, or drawn as a mesh
+            if pyramid:
+                raise
+
     return _pyplot.pcolormesh(*args, **kwargs)
 
 
@@ -506,8 +806,26 @@ def plot_date(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.plotfile.__doc__)
-def plotfile(*args, **kwargs):
-    r"""starkplot wrapper for plotfile"""
+def plotfile(*args, engine=None, **kwargs):
+    r"""starkplot wrapper for plotfile
+
+    engine: bool, None
+        whether to read only the plotted columns, a chunk at a time,
+        reducing lines to their envelope at the axes width. see DataFile
+        None: for .npy & .npz files and large CSV files of numbers
+    """
+    kw = _bindargs(
+        args,
+        kwargs,
+        ("fname", "cols", "plotfuncs", "comments", "skiprows", "checkrows"),
+    )
+    if kw is not None and _datafile.use_engine(kw["fname"], engine=engine):
+        try:
+            return _datafile.plotfile(**kw)
+        except ValueError:  # not numeric
+            if engine:
+                raise
+
     return _pyplot.plotfile(*args, **kwargs)
 
 
@@ -524,8 +842,27 @@ def polar(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.psd.__doc__)
-def psd(*args, **kwargs):
-    r"""starkplot wrapper for psd"""
+def psd(*args, engine=None, **kwargs):
+    r"""starkplot wrapper for psd
+
+    engine: bool, None
+        whether to compute with the streaming, multithreaded spectral
+        engine, which reads the signal a chunk at a time
+        None: for memory-mapped or large arrays, or iterators of chunks
+    """
+    kw = _bindargs(
+        args,
+        kwargs,
+        ("x", "NFFT", "Fs", "Fc", "detrend", "window", "noverlap"),
+    )
+    if (
+        kw is not None
+        and engine is not False
+        and "data" not in kw
+        and _spectral.use_engine(kw["x"], engine=engine)
+    ):
+        return _spectral.psd(_pyplot.gca(), **kw)
+
     return _pyplot.psd(*args, **kwargs)
 
 
@@ -533,8 +870,31 @@ def psd(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.quiver.__doc__)
-def quiver(*args, **kwargs):
-    r"""starkplot wrapper for quiver"""
+def quiver(*args, subsample=None, pool=False, spacing=None, **kwargs):
+    r"""starkplot wrapper for quiver
+
+    subsample: bool, int, (int, int), None
+        whether to subsample the vectors of a 2D grid, with strides which
+        space them *spacing* points apart on the axes, or these strides
+        None: for grids of many vectors
+    pool: bool
+        whether to average the vectors over each stride block,
+        rather than take every stride-th one
+    spacing: float, None
+        the spacing of the subsampled vectors, in points
+    """
+    if 2 <= len(args) <= 5 and _vectorfield.use_subsample(
+        args[2 if len(args) >= 4 else 0], subsample
+    ):
+        args = _vectorfield.subsample_field(
+            _pyplot.gca(),
+            args,
+            subsample=subsample,
+            pool=pool,
+            kind="quiver",
+            spacing=spacing,
+        )
+
     return _pyplot.quiver(*args, **kwargs)
 
 
@@ -553,6 +913,8 @@ def rgrids(*args, **kwargs):
 @mpl_decorator(funcdoc=_pyplot.scatter.__doc__)
 def scatter(*args, **kwargs):
     r"""starkplot wrapper for scatter"""
+    args, kwargs = strip_args(_pyplot.gca(), args, kwargs, *_scatter_args)
+    args, kwargs = preclip_args(args, kwargs, _scatter_clip)
     return _pyplot.gca().scatter(
         *args, **kwargs
     )  # TODO check this works for ax argument
@@ -564,6 +926,7 @@ def scatter(*args, **kwargs):
 @mpl_decorator(funcdoc=_pyplot.semilogx.__doc__)
 def semilogx(*args, **kwargs):
     r"""starkplot wrapper for semilogx"""
+    args = strip_plot_args(_pyplot.gca(), args)
     return _pyplot.semilogx(*args, **kwargs)
 
 
@@ -573,6 +936,7 @@ def semilogx(*args, **kwargs):
 @mpl_decorator(funcdoc=_pyplot.semilogy.__doc__)
 def semilogy(*args, **kwargs):
     r"""starkplot wrapper for semilogy"""
+    args = strip_plot_args(_pyplot.gca(), args)
     return _pyplot.semilogy(*args, **kwargs)
 
 
@@ -580,8 +944,28 @@ def semilogy(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.specgram.__doc__)
-def specgram(*args, **kwargs):
-    r"""starkplot wrapper for specgram"""
+def specgram(*args, engine=None, **kwargs):
+    r"""starkplot wrapper for specgram
+
+    engine: bool, None
+        whether to compute with the streaming, multithreaded spectral
+        engine, which reads the signal a chunk at a time
+        None: for memory-mapped or large arrays, or iterators of chunks
+        the columns are averaged down to the axes width in pixels
+    """
+    kw = _bindargs(
+        args,
+        kwargs,
+        ("x", "NFFT", "Fs", "Fc", "detrend", "window", "noverlap"),
+    )
+    if (
+        kw is not None
+        and engine is not False
+        and "data" not in kw
+        and _spectral.use_engine(kw["x"], engine=engine)
+    ):
+        return _spectral.specgram(_pyplot.gca(), **kw)
+
     return _pyplot.specgram(*args, **kwargs)
 
 
@@ -618,6 +1002,7 @@ def stem(*args, **kwargs):
 @mpl_decorator(funcdoc=_pyplot.step.__doc__)
 def step(*args, **kwargs):
     r"""starkplot wrapper for step"""
+    args = strip_plot_args(_pyplot.gca(), args)
     return _pyplot.step(*args, **kwargs)
 
 
@@ -625,8 +1010,29 @@ def step(*args, **kwargs):
 
 
 @mpl_decorator(funcdoc=_pyplot.streamplot.__doc__)
-def streamplot(*args, **kwargs):
-    r"""starkplot wrapper for streamplot"""
+def streamplot(*args, subsample=None, **kwargs):
+    r"""starkplot wrapper for streamplot
+
+    subsample: bool, int, (int, int), None
+        whether to average-pool the grid to the axes' pixel resolution
+        (or by these strides) and cap the density so streamlines are
+        at least a few points apart
+        None: for grids of many vectors
+    """
+    kw = _bindargs(
+        args, kwargs, ("x", "y", "u", "v", "density", "linewidth", "color")
+    )
+    if (
+        kw is not None
+        and "data" not in kw
+        and _vectorfield.use_subsample(kw["u"], subsample)
+    ):
+        ax = _pyplot.gca()
+        names = ("x", "y", "u", "v", "density", "linewidth", "color")
+        grid = {k: kw.pop(k) for k in names if k in kw}
+        grid = _vectorfield.subsample_stream(ax, subsample=subsample, **grid)
+        return _pyplot.streamplot(**grid, **kw)
+
     return _pyplot.streamplot(*args, **kwargs)
 
 
@@ -640,8 +1046,12 @@ def streamplot(*args, **kwargs):
 
 @mpl_decorator(funcdoc=_pyplot.tricontour.__doc__)
 def tricontour(*args, **kwargs):
-    r"""starkplot wrapper for tricontour"""
-    return _pyplot.tricontour(*args, **kwargs)
+    r"""starkplot wrapper for tricontour
+
+    the Triangulation of x, y is cached, see triangulation
+    """
+    tri, args, kwargs = triangulation_from_args(args, kwargs)
+    return _pyplot.tricontour(tri, *args, **kwargs)
 
 
 # /def
@@ -649,8 +1059,12 @@ def tricontour(*args, **kwargs):
 
 @mpl_decorator(funcdoc=_pyplot.tricontourf.__doc__)
 def tricontourf(*args, **kwargs):
-    r"""starkplot wrapper for tricontourf"""
-    return _pyplot.tricontourf(*args, **kwargs)
+    r"""starkplot wrapper for tricontourf
+
+    the Triangulation of x, y is cached, see triangulation
+    """
+    tri, args, kwargs = triangulation_from_args(args, kwargs)
+    return _pyplot.tricontourf(tri, *args, **kwargs)
 
 
 # /def
@@ -658,8 +1072,12 @@ def tricontourf(*args, **kwargs):
 
 @mpl_decorator(funcdoc=_pyplot.tripcolor.__doc__)
 def tripcolor(*args, **kwargs):
-    r"""starkplot wrapper for tripcolor"""
-    return _pyplot.tripcolor(*args, **kwargs)
+    r"""starkplot wrapper for tripcolor
+
+    the Triangulation of x, y is cached, see triangulation
+    """
+    tri, args, kwargs = triangulation_from_args(args, kwargs)
+    return _pyplot.tripcolor(tri, *args, **kwargs)
 
 
 # /def
@@ -667,16 +1085,53 @@ def tripcolor(*args, **kwargs):
 
 @mpl_decorator(funcdoc=_pyplot.triplot.__doc__)
 def triplot(*args, **kwargs):
-    r"""starkplot wrapper for triplot"""
-    return _pyplot.triplot(*args, **kwargs)
+    r"""starkplot wrapper for triplot
+
+    the Triangulation of x, y is cached, see triangulation
+    """
+    tri, args, kwargs = triangulation_from_args(args, kwargs)
+    return _pyplot.triplot(tri, *args, **kwargs)
 
 
 # /def
 
 
 @mpl_decorator(funcdoc=_pyplot.violinplot.__doc__)
-def violinplot(*args, **kwargs):
-    r"""starkplot wrapper for violinplot"""
+def violinplot(*args, engine=None, groups=None, **kwargs):
+    r"""starkplot wrapper for violinplot
+
+    engine: bool, None
+        whether to compute the statistics of all violins at once, with
+        the vectorized statistics engine, which evaluates the KDEs
+        together on fine grids and ignores NaN values
+        None: for many violins, *groups*, or if *dataset* is a list of
+        QuantileSketches or of precomputed statistics dicts (see violin)
+    groups: array-like, None
+        the group label of each value of a flat *dataset*
+    """
+    kw = _bindargs(
+        args,
+        kwargs,
+        (
+            "dataset",
+            "positions",
+            "vert",
+            "widths",
+            "showmeans",
+            "showextrema",
+            "showmedians",
+            "points",
+            "bw_method",
+        ),
+    )
+    if (
+        kw is not None
+        and engine is not False
+        and "data" not in kw
+        and _stats.use_engine(kw["dataset"], groups, engine=engine)
+    ):
+        return _stats.violinplot(_pyplot.gca(), groups=groups, **kw)
+
     return _pyplot.violinplot(*args, **kwargs)
 
 
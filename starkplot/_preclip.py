@@ -0,0 +1,360 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _preclip
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""clip plotted data to explicit axis limits, before plotting
+
+The decorator's xlim & ylim are set after the plot, so the artists
+otherwise store, transform & clip all the data at draw time. When
+zooming into a small window of a big dataset, the points outside the
+window can be dropped first.
+
+The window is set for the plotting call by the decorator, see
+clip_window. Lines keep the segments which reach the window, so they
+stay continuous to the axes' edges, and are broken (with a NaN) where
+points between were dropped. Errorbars are kept if their bars reach the
+window.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "clip_window",
+    "get_clip_window",
+    "clip_index",
+    "preclip_plot_args",
+    "preclip_args",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+
+##############################################################################
+### Info
+
+# the (x, y) clip windows of the current plotting calls, per thread
+_local = threading.local()
+
+# scatter arguments which may be one per point
+_per_point = ("s", "c", "linewidths", "edgecolors", "facecolors")
+
+
+##############################################################################
+### Window
+
+
+def _bounds(lim):
+    """the (lower, upper) bounds of axis limits, or None
+
+    None in the limits is unbounded. Limits which aren't a pair of
+    numbers (ex: 'auto' percentile limits) are None.
+    """
+    if lim is None or isinstance(lim, str):
+        return None
+    try:
+        lo, hi = tuple(lim)[:2]
+        lo = -np.inf if lo is None else float(lo)
+        hi = np.inf if hi is None else float(hi)
+    except (TypeError, ValueError):
+        return None
+    if lo > hi:  # inverted axis
+        lo, hi = hi, lo
+    if lo == -np.inf and hi == np.inf:
+        return None
+    return lo, hi
+
+
+# /def
+
+
+def _windows():
+    """the stack of clip windows of this thread"""
+    if not hasattr(_local, "windows"):
+        _local.windows = []
+    return _local.windows
+
+
+# /def
+
+
+@contextmanager
+def clip_window(xlim=None, ylim=None):
+    """clip the data of plot, scatter & errorbar to axis limits
+
+    Parameters
+    ----------
+    xlim, ylim : (float, float), None
+        as for set_xlim, set_ylim. None: not clipped
+    """
+    stack = _windows()
+    stack.append((_bounds(xlim), _bounds(ylim)))
+    try:
+        yield
+    finally:
+        stack.pop()
+
+
+# /def
+
+
+def get_clip_window():
+    """the current (x, y) clip bounds, each (lower, upper) or None"""
+    stack = _windows()
+    return stack[-1] if stack else (None, None)
+
+
+# /def
+
+
+##############################################################################
+### Clipping
+
+
+def _numeric(arr):
+    return arr.ndim == 1 and arr.dtype.kind in "biuf"
+
+
+# /def
+
+
+def _overlaps(lower, upper, bounds):
+    """whether the intervals [lower, upper] overlap the bounds"""
+    if bounds is None:
+        return True
+    with np.errstate(invalid="ignore"):
+        inside = (upper >= bounds[0]) & (lower <= bounds[1])
+    return np.ma.filled(inside, False)
+
+
+# /def
+
+
+def clip_index(x, y, window=None, xerr=None, yerr=None, connected=True):
+    """the points to keep in a clip window
+
+    Parameters
+    ----------
+    x, y : ndarray
+        (N,)
+    window : ((float, float) or None, (float, float) or None), None
+        the (x, y) bounds. None: the current window
+    xerr, yerr : ndarray, optional
+        (N,) or (2, N) errors, kept if their bars reach the window
+    connected : bool
+        whether the points are joined by a line, so both ends of the
+        segments reaching the window are kept
+
+    Returns
+    -------
+    index : ndarray or None
+        the kept points, or None if all are
+    breaks : ndarray
+        the positions in *index* before which points were dropped
+    """
+    xb, yb = get_clip_window() if window is None else window
+
+    def interval(values, err):
+        if err is None:
+            return values, values
+        err = np.asarray(err, dtype=float)
+        lo, hi = err if err.ndim == 2 else (err, err)
+        return values - lo, values + hi
+
+    inside = _overlaps(*interval(x, xerr), xb) & _overlaps(
+        *interval(y, yerr), yb
+    )
+    inside = np.broadcast_to(inside, np.shape(x))
+    keep = np.array(inside, dtype=bool, copy=True)
+    if connected:  # and the segments whose bounding box reaches the window
+        x, y = np.ma.asarray(x, dtype=float), np.ma.asarray(y, dtype=float)
+        segment = _overlaps(
+            np.ma.minimum(x[:-1], x[1:]), np.ma.maximum(x[:-1], x[1:]), xb
+        ) & _overlaps(
+            np.ma.minimum(y[:-1], y[1:]), np.ma.maximum(y[:-1], y[1:]), yb
+        )
+        keep[:-1] |= segment
+        keep[1:] |= segment
+
+    if keep.all():
+        return None, np.array([], dtype=int)
+
+    index = np.flatnonzero(keep)
+    breaks = np.flatnonzero(np.diff(index) > 1) + 1 if connected else []
+    return index, np.asarray(breaks, dtype=int)
+
+
+# /def
+
+
+def _take(arr, index, breaks, axis=-1):
+    """arr at the index, with NaN at the breaks"""
+    arr = np.take(arr, index, axis=axis)
+    if len(breaks):
+        arr = np.ma.filled(np.ma.asarray(arr, dtype=float), np.nan)
+        arr = np.insert(arr, breaks, np.nan, axis=axis)
+    return arr
+
+
+# /def
+
+
+def _clip_xy(x, y, connected):
+    """x, y clipped to the current window, or None if unchanged"""
+    x, y = np.ma.asarray(x), np.ma.asarray(y)
+    if not (_numeric(x) and _numeric(y) and len(x) == len(y)):
+        return None
+    index, breaks = clip_index(x, y, connected=connected)
+    if index is None:
+        return None
+    return _take(x, index, breaks), _take(y, index, breaks)
+
+
+# /def
+
+
+def preclip_plot_args(args):
+    """clip plot-style arguments to the current window
+
+    *args* are groups of ``[x], y, [fmt]``, as for ax.plot. Groups with
+    1D x & y are clipped, others are unchanged.
+
+    Returns
+    -------
+    args : tuple
+    """
+    if get_clip_window() == (None, None):
+        return args
+
+    out = []
+    args = list(args)
+    while args:
+        y = args.pop(0)
+        x = None
+        if args and not isinstance(args[0], str):
+            x, y = y, args.pop(0)
+        fmt = [args.pop(0)] if args and isinstance(args[0], str) else []
+
+        xarg = np.arange(np.shape(y)[0]) if x is None and np.ndim(y) else x
+        clipped = None if xarg is None else _clip_xy(xarg, y, True)
+        if clipped is None:
+            out += ([] if x is None else [x]) + [y] + fmt
+        else:
+            out += list(clipped) + fmt
+
+    return tuple(out)
+
+
+# /def
+
+
+def _getarg(args, kw, names, name):
+    i = names.index(name)
+    return args[i] if i < len(args) else kw.get(name)
+
+
+# /def
+
+
+def _setarg(args, kw, names, name, value):
+    i = names.index(name)
+    if i < len(args):
+        args[i] = value
+    else:
+        kw[name] = value
+
+
+# /def
+
+
+def preclip_args(args, kw, names, errors=()):
+    """clip scatter or errorbar arguments to the current window
+
+    Parameters
+    ----------
+    args : tuple
+    kw : dict
+    names : tuple of str
+        the names of the leading positional arguments, starting x, y.
+        ex: errorbar is ('x', 'y', 'yerr', 'xerr')
+    errors : tuple of str
+        the error arguments, 'xerr', 'yerr'. If given, the points are
+        joined by a line (errorbar), else not (scatter)
+
+    Returns
+    -------
+    args : tuple
+    kw : dict
+    """
+    if get_clip_window() == (None, None) or "data" in kw:
+        return args, kw
+
+    args, kw = list(args), dict(kw)
+    x = np.ma.asarray(_getarg(args, kw, names, "x"))
+    y = np.ma.asarray(_getarg(args, kw, names, "y"))
+    if not (_numeric(x) and _numeric(y) and len(x) == len(y)):
+        return tuple(args), kw
+
+    n = len(x)
+    errs = {}
+    for name in errors:
+        err = _getarg(args, kw, names, name)
+        if err is not None and np.ndim(err):
+            err = np.asarray(err, dtype=float)
+            if err.shape not in ((n,), (2, n)):
+                return tuple(args), kw  # errorbar raises
+        errs[name] = err
+
+    connected = bool(errors)
+    index, breaks = clip_index(
+        x, y, xerr=errs.get("xerr"), yerr=errs.get("yerr"), connected=connected
+    )
+    if index is None:
+        return tuple(args), kw
+
+    _setarg(args, kw, names, "x", _take(x, index, breaks))
+    _setarg(args, kw, names, "y", _take(y, index, breaks))
+    for name, err in errs.items():
+        if err is not None and np.ndim(err):
+            _setarg(args, kw, names, name, _take(err, index, breaks))
+
+    if not connected:  # scatter's per-point properties
+        for name in _per_point:
+            if name in names:
+                value = _getarg(args, kw, names, name)
+            else:
+                value = kw.get(name)
+            if value is None or isinstance(value, str):
+                continue
+            arr = np.ma.asarray(value)
+            if arr.ndim and arr.shape[0] == n:
+                arr = arr[index]
+                if arr.dtype.kind in "USO":
+                    arr = arr.tolist()
+                if name in names:
+                    _setarg(args, kw, names, name, arr)
+                else:
+                    kw[name] = arr
+
+    return tuple(args), kw
+
+
+# /def
+
+##############################################################################
+# END
@@ -0,0 +1,540 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _pyramid
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""multi-resolution image pyramids for huge images
+
+An ImagePyramid holds block-mean downsampled levels of an image, which
+are computed in strips, so memory-mapped input is never loaded whole.
+Small levels are cached; the visible part of a large level is computed
+on demand.
+
+A PyramidImage, drawn by imshow / matshow / pcolormesh, picks the level
+and crop which match the axes' pixel extent each time it's drawn, so
+zooming in interactive backends switches levels, and the memory use and
+draw time depend on the screen size, not the data size.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "ImagePyramid",
+    "PyramidImage",
+    "image_pyramid",
+    "use_pyramid",
+    "imshow",
+    "matshow",
+    "pcolormesh",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import math
+import warnings
+
+import numpy as np
+
+# matplotlib
+from matplotlib import rcParams
+from matplotlib import ticker
+from matplotlib.image import AxesImage
+
+## Project-Specific
+from ._quantile import _ArrayCache
+
+
+##############################################################################
+### Info
+
+# images with at least this many pixels use a pyramid by default
+_pyramid_threshold = 4096 ** 2
+
+# levels with at most this many pixels are cached whole
+_max_level_pixels = 2048 ** 2
+
+# pixels read per strip when downsampling
+_strip_pixels = 2 ** 22
+
+# pcolormesh options which imshow doesn't take, & their values which
+# draw as an image
+_mesh_defaults = {
+    "shading": ("flat", "auto"),
+    "antialiased": (False,),
+    "edgecolors": ("none", "face"),
+    "linewidth": (0,),
+}
+
+_pyramid_cache = _ArrayCache()
+
+
+##############################################################################
+### ImagePyramid
+
+
+def _block_mean(src, rows, cols, factor):
+    """block means of src[rows, cols], read a strip at a time
+
+    Parameters
+    ----------
+    src : array
+        shape (M, N) or (M, N, channels)
+    rows, cols : (start, stop)
+        multiples of *factor*, except stop may be the end of src
+    factor : int
+
+    Returns
+    -------
+    out : ndarray
+        shape (ceil(rows / factor), ceil(cols / factor), ...)
+    """
+    (r0, r1), (c0, c1) = rows, cols
+    nr = -(-(r1 - r0) // factor)
+    nc = -(-(c1 - c0) // factor)
+    dtype = np.result_type(src.dtype, np.float32)
+    out = np.empty((nr, nc) + src.shape[2:], dtype=dtype)
+
+    # rows per strip, a multiple of factor
+    strip = max(1, _strip_pixels // max(1, (c1 - c0) * factor)) * factor
+
+    for i in range(r0, r1, strip):
+        block = np.asarray(src[i : min(i + strip, r1), c0:c1], dtype=dtype)
+
+        # pad partial blocks with nan
+        pr = -block.shape[0] % factor
+        pc = -block.shape[1] % factor
+        if pr or pc:
+            pad = [(0, pr), (0, pc)] + [(0, 0)] * (block.ndim - 2)
+            block = np.pad(
+                block, pad, mode="constant", constant_values=np.nan
+            )
+        nbr, nbc = block.shape[0] // factor, block.shape[1] // factor
+        block = block.reshape((nbr, factor, nbc, factor) + block.shape[2:])
+
+        j = (i - r0) // factor
+        if pr or pc:
+            with warnings.catch_warnings():  # all-nan blocks
+                warnings.simplefilter("ignore", RuntimeWarning)
+                out[j : j + nbr] = np.nanmean(block, axis=(1, 3))
+        else:
+            out[j : j + nbr] = block.mean(axis=(1, 3))
+
+    return out
+
+
+# /def
+
+
+class ImagePyramid(object):
+    """block-mean downsampled levels of an image
+
+    Parameters
+    ----------
+    data : array
+        shape (M, N) or (M, N, 3 or 4). may be memory-mapped
+    factor : int
+        downsampling factor between levels
+    min_size : int
+        the coarsest level is at most this big on a side
+    levels : dict, optional
+        the downsampled levels, by index, filled as they're computed.
+        shared by the pyramids of one array, see image_pyramid
+    """
+
+    def __init__(self, data, factor=2, min_size=512, levels=None):
+        if np.ma.isMaskedArray(data):
+            data = np.ma.filled(data.astype(float), np.nan)
+        self.data = data
+        self.factor = int(factor)
+        self.nlevels = 1 + max(
+            0, math.ceil(math.log(max(data.shape[:2]) / min_size, factor))
+        )
+        self._levels = {} if levels is None else levels
+
+    # /def
+
+    @property
+    def shape(self):
+        """the full-resolution shape"""
+        return self.data.shape
+
+    def scale(self, k):
+        """the full-resolution pixels per level-*k* pixel, on a side"""
+        return self.factor ** k
+
+    def level_shape(self, k):
+        s = self.scale(k)
+        return tuple(-(-n // s) for n in self.shape[:2])
+
+    def level(self, k):
+        """level *k*, None if it's too big to be cached whole"""
+        if k == 0:
+            return self.data
+        if k not in self._levels:
+            nr, nc = self.level_shape(k)
+            if nr * nc > _max_level_pixels:
+                return None
+            self._levels[k] = _block_mean(
+                self.data,
+                (0, self.shape[0]),
+                (0, self.shape[1]),
+                self.scale(k),
+            )
+        return self._levels[k]
+
+    # /def
+
+    def crop(self, k, rows, cols):
+        """level *k*, rows & cols in level-*k* pixels"""
+        (r0, r1), (c0, c1) = rows, cols
+        level = self.level(k)
+        if level is not None:
+            return level[r0:r1, c0:c1]
+
+        s = self.scale(k)
+        return _block_mean(
+            self.data,
+            (r0 * s, min(r1 * s, self.shape[0])),
+            (c0 * s, min(c1 * s, self.shape[1])),
+            s,
+        )
+
+    # /def
+
+
+# /class
+
+
+def image_pyramid(data, **kw):
+    """an ImagePyramid of an array, with its cached levels
+
+    only the downsampled levels are cached, so the cache doesn't keep
+    the array alive
+    """
+    key = tuple(sorted(kw.items()))
+    levels = _pyramid_cache.get(data, key, lambda d: {})
+    return ImagePyramid(data, levels=levels, **kw)
+
+
+# /def
+
+
+def use_pyramid(data, pyramid=None):
+    """whether to draw an image with a pyramid
+
+    Parameters
+    ----------
+    data : array
+    pyramid : bool, None
+        None: for 2D or RGB(A) arrays above the size threshold
+    """
+    if pyramid is not None:
+        return bool(pyramid)
+    return (
+        isinstance(data, np.ndarray)
+        and data.ndim in (2, 3)
+        and data.shape[0] * data.shape[1] >= _pyramid_threshold
+    )
+
+
+# /def
+
+
+##############################################################################
+### PyramidImage
+
+
+class PyramidImage(AxesImage):
+    """an AxesImage which draws the pyramid level matching the screen
+
+    Parameters
+    ----------
+    ax : Axes
+    pyramid : ImagePyramid
+    extent : (left, right, bottom, top)
+        of the full image
+    **kwargs : AxesImage arguments
+    """
+
+    def __init__(self, ax, pyramid, extent, **kwargs):
+        super().__init__(ax, extent=extent, **kwargs)
+        self.pyramid = pyramid
+        self._full_extent = tuple(extent)
+        self._view = None  # (level, rows, cols) currently drawn
+        self._view_extent = None
+
+    # /def
+
+    def get_extent(self):
+        if self._view_extent is not None:
+            return self._view_extent
+        return self._full_extent
+
+    # /def
+
+    def _visible_pixels(self):
+        """visible full-resolution rows & cols, and the screen pixels"""
+        nr, nc = self.pyramid.shape[:2]
+        l, r, b, t = self._full_extent
+        if self.origin == "upper":
+            r_start, r_stop = t, b
+        else:
+            r_start, r_stop = b, t
+
+        def _range(lims, start, stop, n):
+            p = sorted((v - start) / (stop - start) * n for v in lims)
+            return max(0, math.floor(p[0])), min(n, math.ceil(p[1]))
+
+        cols = _range(self.axes.get_xlim(), l, r, nc)
+        rows = _range(self.axes.get_ylim(), r_start, r_stop, nr)
+
+        bbox = self.axes.bbox
+        return rows, cols, (max(bbox.height, 1), max(bbox.width, 1))
+
+    # /def
+
+    def _update_view(self):
+        (r0, r1), (c0, c1), (h, w) = self._visible_pixels()
+        if r1 <= r0 or c1 <= c0:  # not visible
+            return
+
+        # the coarsest level with at least one pixel per screen pixel
+        pyr = self.pyramid
+        scale = min((r1 - r0) / h, (c1 - c0) / w)
+        k = 0 if scale <= 1 else int(math.log(scale, pyr.factor) + 1e-9)
+        k = min(k, pyr.nlevels - 1)
+
+        s = pyr.scale(k)
+        rows = (r0 // s, -(-r1 // s))
+        cols = (c0 // s, -(-c1 // s))
+        if self._view == (k, rows, cols):
+            return
+
+        self.set_data(pyr.crop(k, rows, cols))
+        self._view = (k, rows, cols)
+
+        # the extent of the crop
+        nr, nc = pyr.shape[:2]
+        l, r, b, t = self._full_extent
+        x0, x1 = (l + c * s / nc * (r - l) for c in cols)
+        if self.origin == "upper":
+            y1, y0 = (t + i * s / nr * (b - t) for i in rows)
+        else:
+            y0, y1 = (b + i * s / nr * (t - b) for i in rows)
+        self._view_extent = (x0, x1, y0, y1)
+
+    # /def
+
+    def draw(self, renderer, *args, **kwargs):
+        self._update_view()
+        super().draw(renderer, *args, **kwargs)
+
+    # /def
+
+
+# /class
+
+
+##############################################################################
+### Plotting
+
+
+def imshow(
+    ax,
+    X,
+    cmap=None,
+    norm=None,
+    aspect=None,
+    interpolation=None,
+    alpha=None,
+    vmin=None,
+    vmax=None,
+    origin=None,
+    extent=None,
+    filternorm=1,
+    filterrad=4.0,
+    resample=None,
+    url=None,
+    factor=2,
+    **kwargs
+):
+    """Axes.imshow of an ImagePyramid of *X*, see Axes.imshow
+
+    Parameters
+    ----------
+    factor : int
+        downsampling factor between pyramid levels
+
+    Returns
+    -------
+    image : PyramidImage
+    """
+    if isinstance(X, ImagePyramid):
+        pyramid = X
+    else:
+        pyramid = image_pyramid(X, factor=factor)
+    nr, nc = pyramid.shape[:2]
+
+    if origin is None:
+        origin = rcParams["image.origin"]
+    if extent is None:
+        if origin == "upper":
+            extent = (-0.5, nc - 0.5, nr - 0.5, -0.5)
+        else:
+            extent = (-0.5, nc - 0.5, -0.5, nr - 0.5)
+
+    if aspect is None:
+        aspect = rcParams["image.aspect"]
+    ax.set_aspect(aspect)
+
+    im = PyramidImage(
+        ax,
+        pyramid,
+        extent,
+        cmap=cmap,
+        norm=norm,
+        interpolation=interpolation,
+        origin=origin,
+        filternorm=filternorm,
+        filterrad=filterrad,
+        resample=resample,
+        **kwargs
+    )
+
+    # start with the coarsest level, which also sets the color limits
+    im.set_data(pyramid.level(pyramid.nlevels - 1))
+    im.set_alpha(alpha)
+    if im.get_clip_path() is None:
+        im.set_clip_path(ax.patch)
+    if vmin is not None or vmax is not None:
+        im.set_clim(vmin, vmax)
+    else:
+        im.autoscale_None()
+    im.set_url(url)
+
+    im.set_extent(extent)  # data limits & autoscaling
+    ax.add_image(im)
+
+    return im
+
+
+# /def
+
+
+def matshow(ax, Z, **kwargs):
+    """Axes.matshow of an ImagePyramid of *Z*, see imshow
+
+    Returns
+    -------
+    image : PyramidImage
+    """
+    kw = {
+        "origin": "upper",
+        "interpolation": "nearest",
+        "aspect": "equal",
+        **kwargs,
+    }
+    im = imshow(ax, Z, **kw)
+
+    ax.title.set_y(1.05)
+    ax.xaxis.tick_top()
+    ax.xaxis.set_ticks_position("both")
+    for axis in (ax.xaxis, ax.yaxis):
+        axis.set_major_locator(
+            ticker.MaxNLocator(nbins=9, steps=[1, 2, 5, 10], integer=True)
+        )
+
+    return im
+
+
+# /def
+
+
+def _uniform_edges(X, n):
+    """(first, last) edges of uniformly spaced 1D cell edges, else None"""
+    X = np.asarray(X, dtype=float)
+    if X.ndim != 1 or len(X) != n + 1:
+        return None
+    d = np.diff(X)
+    if not np.allclose(d, d[0]):
+        return None
+    return X[0], X[-1]
+
+
+# /def
+
+
+def _image_like(key, value):
+    """whether a pcolormesh option's value draws as an image"""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        value = value.lower()
+    elif not isinstance(value, (bool, int, float)):  # arrays
+        return False
+    return value in _mesh_defaults[key]
+
+
+# /def
+
+
+def pcolormesh(ax, *args, **kwargs):
+    """Axes.pcolormesh of an ImagePyramid, for uniform grids
+
+    Parameters
+    ----------
+    *args : C or X, Y, C
+        X, Y must be uniformly spaced 1D cell edges
+
+    Returns
+    -------
+    image : PyramidImage
+
+    Exceptions
+    ----------
+    ValueError : if X or Y are not uniformly spaced 1D edges,
+        or shading, antialiased, edgecolors or linewidth are set
+        to draw other than an image
+    """
+    if len(args) == 1:
+        C = args[0]
+        nr, nc = C.shape[:2]
+        xlim, ylim = (0, nc), (0, nr)
+    elif len(args) == 3:
+        X, Y, C = args
+        nr, nc = C.shape[:2]
+        xlim, ylim = _uniform_edges(X, nc), _uniform_edges(Y, nr)
+        if xlim is None or ylim is None:
+            raise ValueError("X and Y must be uniformly spaced cell edges")
+    else:
+        raise TypeError("pcolormesh takes C or X, Y, C")
+
+    # pcolormesh options which imshow doesn't take
+    for key in _mesh_defaults:
+        if not _image_like(key, kwargs.pop(key, None)):
+            raise ValueError(f"pcolormesh {key} isn't drawn as an image")
+
+    kw = {
+        "origin": "lower",
+        "interpolation": "nearest",
+        "aspect": "auto",
+        "extent": (xlim[0], xlim[1], ylim[0], ylim[1]),
+        **kwargs,
+    }
+    return imshow(ax, C, **kw)
+
+
+# /def
+
+##############################################################################
+# END
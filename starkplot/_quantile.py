@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _quantile
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""streaming quantile sketches for robust limits
+
+QuantileSketch is a mergeable, bounded-memory sketch (a KLL-style stack
+of compactors) which is updated chunk by chunk, so it works on
+memory-mapped arrays and iterators of chunks without a full sort.
+Sketches of plotted arrays are cached per array. Small in-memory arrays
+get exact percentiles instead.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "QuantileSketch",
+    "quantile_sketch",
+    "quantiles",
+    "robust_limits",
+    "parse_auto_limits",
+    "clear_quantile_cache",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import weakref
+from collections.abc import Iterator
+
+import numpy as np
+
+
+##############################################################################
+### Info
+
+# default compactor size. the rank error is ~ 1 / _sketch_k
+_sketch_k = 2048
+
+# elements read at once from a memory-mapped / large array
+_chunksize = 2 ** 20
+
+
+##############################################################################
+### QuantileSketch
+
+
+class QuantileSketch(object):
+    """streaming, mergeable quantile sketch
+
+    Items are added to level 0. When a level holds at least 2k items,
+    it is split into blocks of k, each block is sorted, and every other
+    item is promoted to the next level, where it counts twice.
+    Only blocks of k are ever sorted, and the sketch holds
+    ~ k log2(n / k) items.
+
+    Parameters
+    ----------
+    k : int
+        compactor size
+    """
+
+    __slots__ = ("k", "n", "min", "max", "_levels", "_parity")
+
+    def __init__(self, k=_sketch_k):
+        self.k = int(k)
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._levels = []
+        self._parity = []
+
+    # /def
+
+    def update(self, arr):
+        """add the finite values of an array
+
+        Parameters
+        ----------
+        arr : array-like
+            memory-mapped arrays are read in chunks
+        """
+        arr = np.ravel(np.ma.getdata(arr))
+        for i in range(0, arr.size, _chunksize):
+            chunk = np.asarray(arr[i : i + _chunksize], dtype=float)
+            chunk = chunk[np.isfinite(chunk)]
+            if chunk.size == 0:
+                continue
+            self.n += chunk.size
+            self.min = min(self.min, chunk.min())
+            self.max = max(self.max, chunk.max())
+            self._add(0, chunk)
+        return self
+
+    # /def
+
+    def merge(self, other):
+        """merge another sketch into this one"""
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for h, items in enumerate(other._levels):
+            if items.size:
+                self._add(h, items)
+        return self
+
+    # /def
+
+    def _add(self, h, items):
+        while len(self._levels) <= h:
+            self._levels.append(np.empty(0))
+            self._parity.append(0)
+
+        buf = np.concatenate((self._levels[h], items))
+        if buf.size < 2 * self.k:
+            self._levels[h] = buf
+            return
+
+        # sort blocks of k, promote every other item of each block,
+        # alternating between the even and odd items so there's no bias
+        k = self.k - self.k % 2
+        nblocks = buf.size // k
+        blocks = np.sort(buf[: nblocks * k].reshape(nblocks, k))
+        self._levels[h] = buf[nblocks * k :]
+
+        odd = (np.arange(nblocks) + self._parity[h]) % 2 == 1
+        promoted = np.where(odd[:, None], blocks[:, 1::2], blocks[:, ::2])
+        promoted = promoted.ravel()
+        self._parity[h] ^= nblocks % 2
+
+        self._add(h + 1, promoted)
+
+    # /def
+
+    def items(self):
+        """the retained items, sorted, and their weights
+
+        Returns
+        -------
+        values, weights : ndarray
+            the weights sum to ~ n
+        """
+        if not self._levels:
+            return np.empty(0), np.empty(0)
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(l.size, 2.0 ** h) for h, l in enumerate(self._levels)]
+        )
+        order = np.argsort(values, kind="mergesort")
+
+        return values[order], weights[order]
+
+    # /def
+
+    def quantile(self, q):
+        """the estimated quantile(s)
+
+        Parameters
+        ----------
+        q : float or array of floats in [0, 1]
+        """
+        if self.n == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+
+        values, weights = self.items()
+
+        # midpoint ranks, pinned to the exact extrema
+        cdf = (np.cumsum(weights) - 0.5 * weights) / weights.sum()
+        values = np.concatenate(([self.min], values, [self.max]))
+        cdf = np.concatenate(([0.0], cdf, [1.0]))
+
+        return np.interp(q, cdf, values)
+
+    # /def
+
+    def percentile(self, p):
+        """the estimated percentile(s), p in [0, 100]"""
+        return self.quantile(np.asarray(p) / 100.0)
+
+    # /def
+
+
+# /class
+
+
+##############################################################################
+### Cache
+
+
+class _ArrayCache(object):
+    """results cached per (array, key)
+
+    Entries are evicted when the array is garbage collected. Arrays are
+    assumed not to be modified in place while cached.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def _evict(self, ident):
+        for k in [k for k in list(self._cache) if k[0] == ident]:
+            self._cache.pop(k, None)
+
+    def get(self, arr, key, func):
+        """cached func(arr), computed on a miss"""
+        if not isinstance(arr, np.ndarray):
+            return func(arr)
+
+        ident = id(arr)
+        sig = (ident, key)
+        entry = self._cache.get(sig)
+        if entry is not None:
+            ref, shape, res = entry
+            if ref() is arr and shape == arr.shape:
+                return res
+
+        res = func(arr)
+        try:
+            ref = weakref.ref(arr, lambda _, i=ident: self._evict(i))
+        except TypeError:  # not weak-referenceable
+            return res
+        self._cache[sig] = (ref, arr.shape, res)
+
+        return res
+
+    def clear(self):
+        self._cache.clear()
+
+
+# /class
+
+_sketch_cache = _ArrayCache()
+
+
+def clear_quantile_cache():
+    """clear the cached per-array quantile sketches"""
+    _sketch_cache.clear()
+
+
+# /def
+
+
+##############################################################################
+### Functions
+
+
+def _finite_values(data, column=None):
+    """the finite values of a small in-memory array, else None
+
+    memory-mapped arrays, iterators and arrays of at least _chunksize
+    elements are sketched instead
+    """
+    if not isinstance(data, np.ndarray) or isinstance(data, np.memmap):
+        return None
+    if data.size >= _chunksize:
+        return None
+    arr = np.ma.getdata(data)
+    if column is not None:
+        arr = arr[:, column]
+    arr = np.asarray(arr, dtype=float).ravel()
+    return arr[np.isfinite(arr)]
+
+
+# /def
+
+
+def quantile_sketch(data, k=_sketch_k, cache=True, column=None):
+    """a QuantileSketch of an array, a list of chunks, or an iterator
+
+    Parameters
+    ----------
+    data : array, QuantileSketch, or iterable of arrays
+        arrays are read in chunks, so memory-mapped arrays are not loaded.
+        a list or tuple of numbers is an array
+    k : int
+        compactor size
+    cache : bool
+        whether to cache the sketch of each ndarray
+    column : int, None
+        if not None, only this column of a 2D array, ex: scatter offsets
+
+    Returns
+    -------
+    sketch : QuantileSketch
+    """
+    if isinstance(data, QuantileSketch):
+        return data
+
+    def _sketch(arr):
+        if column is not None:
+            arr = arr[:, column]
+        return QuantileSketch(k=k).update(arr)
+
+    if isinstance(data, np.ndarray) or np.isscalar(data):
+        if cache:
+            return _sketch_cache.get(data, (k, column), _sketch)
+        return _sketch(data)
+
+    if not isinstance(data, Iterator) and all(map(np.isscalar, data)):
+        return _sketch(np.asarray(data))  # not a list of chunks
+
+    # a list of chunks or an iterator
+    sketch = QuantileSketch(k=k)
+    for chunk in data:
+        sketch.merge(
+            quantile_sketch(chunk, k=k, cache=cache, column=column)
+        )
+
+    return sketch
+
+
+# /def
+
+
+def quantiles(data, q, **kw):
+    """quantiles of data, see quantile_sketch
+
+    exact for small in-memory arrays, else estimated
+    """
+    values = _finite_values(data, kw.get("column"))
+    if values is not None:
+        if values.size == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        return np.quantile(values, q)
+    return quantile_sketch(data, **kw).quantile(q)
+
+
+# /def
+
+
+def robust_limits(data, percentile=(0.5, 99.5), **kw):
+    """(lower, upper) percentile limits of data, see quantile_sketch
+
+    exact for small in-memory arrays, else estimated
+
+    Returns
+    -------
+    limits : tuple
+        (None, None) if data has no finite values
+    """
+    values = _finite_values(data, kw.get("column"))
+    if values is not None:
+        if values.size == 0:
+            return None, None
+        lo, hi = np.percentile(values, percentile)
+        return float(lo), float(hi)
+
+    sketch = quantile_sketch(data, **kw)
+    if sketch.n == 0:
+        return None, None
+    lo, hi = sketch.percentile(percentile)
+    return float(lo), float(hi)
+
+
+# /def
+
+
+def parse_auto_limits(lim):
+    """parse an 'auto' limits string into percentiles
+
+    Parameters
+    ----------
+    lim : str
+        'auto' : the full range
+        'auto:P' : the central P percent, ex: 'auto:99.5'
+        'auto:lo:hi' : the lo-th to hi-th percentiles, ex: 'auto:1:99'
+
+    Returns
+    -------
+    percentile : (lo, hi)
+
+    Exceptions
+    ----------
+    ValueError : if *lim* is not an 'auto' limits string
+    """
+    parts = lim.split(":")
+    if parts[0] != "auto" or len(parts) > 3:
+        raise ValueError(f"invalid limits {lim!r}")
+
+    try:
+        if len(parts) == 1:
+            return 0.0, 100.0
+        elif len(parts) == 2:
+            p = float(parts[1])
+            return (100.0 - p) / 2.0, (100.0 + p) / 2.0
+        else:
+            return float(parts[1]), float(parts[2])
+    except ValueError:
+        raise ValueError(f"invalid limits {lim!r}")
+
+
+# /def
+
+##############################################################################
+# END
@@ -0,0 +1,1021 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _spectral
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""streaming Welch & spectrogram engine
+
+mlab strides the whole signal into segments and FFTs them at once, so
+the signal, and a copy per segment, must fit in memory. Instead, the
+signal is read a chunk at a time (memory-mapped arrays only load that
+chunk, and iterators of chunks are supported), cut into batches of
+segments, which are detrended, windowed and FFT'd across a thread pool.
+
+    welch, coherence : the segment spectra are summed as they come
+    spectrogram : the segment spectra are averaged into at most
+        (about) *width* columns, ex: the display width of the axes
+
+The results have mlab's normalization, and are drawn as Axes.psd,
+csd, cohere & specgram do.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "welch",
+    "coherence",
+    "spectrogram",
+    "psd",
+    "csd",
+    "cohere",
+    "specgram",
+    "use_engine",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import math
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+import numpy as np
+
+# matplotlib
+from matplotlib import mlab
+
+## Project-Specific
+from ._histogram import _chunks, _is_array
+
+
+##############################################################################
+### Info
+
+# samples read per chunk
+_chunksize = 2 ** 20
+
+# segments FFT'd per task
+_batchsize = 256
+
+# arrays with at least this many samples use the engine by default
+_engine_threshold = 2 ** 22
+
+
+##############################################################################
+### Streaming
+
+
+def _imap(func, items, max_workers=None):
+    """func mapped over items in a thread pool, in order, lazily
+
+    at most a few tasks per thread are pending, so *items* are consumed
+    (read) only as fast as they are processed
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# /def
+
+
+def _signal_chunks(x, y=None, chunksize=_chunksize):
+    """aligned chunks of one or two signals, as tuples of 1D arrays
+
+    *x* (and *y*) is an array, or an iterator of chunks. If *y* is None
+    and *x* is an iterator, its chunks may be (x, y) pairs.
+    """
+    if _is_array(x) and (y is None or _is_array(y)):
+        if y is not None and len(x) != len(y):
+            raise ValueError("x and y must have the same length")
+        arrs = (np.ravel(x),) if y is None else (np.ravel(x), np.ravel(y))
+        return _chunks(*arrs, chunksize=chunksize)
+
+    if y is None:
+        return (
+            tuple(np.ravel(c) for c in chunk)
+            if isinstance(chunk, tuple)
+            else (np.ravel(chunk),)
+            for chunk in x
+        )
+
+    if _is_array(x):
+        x = _chunks(np.ravel(x), chunksize=chunksize)
+    if _is_array(y):
+        y = _chunks(np.ravel(y), chunksize=chunksize)
+
+    def _pairs():
+        for cx, cy in zip(x, y):
+            cx, cy = np.ravel(cx), np.ravel(cy)
+            if len(cx) != len(cy):
+                raise ValueError("x and y chunks must have the same lengths")
+            yield cx, cy
+
+    return _pairs()
+
+
+# /def
+
+
+def _segment_batches(chunks, NFFT, step, batchsize=_batchsize):
+    """batches of segments, (nsignals, nsegments, NFFT) strided views
+
+    as mlab.stride_windows of the concatenated chunks, which are zero-
+    padded to NFFT if shorter.
+    """
+    carry = None
+    nseg = 0
+    for chunk in chunks:
+        buf = np.stack(chunk)
+        if carry is not None and carry.shape[1]:
+            buf = np.concatenate([carry, buf.astype(carry.dtype)], axis=1)
+        n = buf.shape[1]
+        if n < NFFT:
+            carry = buf
+            continue
+
+        m = 1 + (n - NFFT) // step
+        s0, s1 = buf.strides
+        segs = np.lib.stride_tricks.as_strided(
+            buf, shape=(buf.shape[0], m, NFFT), strides=(s0, s1 * step, s1)
+        )
+        for i in range(0, m, batchsize):
+            yield segs[:, i : i + batchsize]
+        nseg += m
+        carry = buf[:, m * step :]
+
+    if nseg == 0 and carry is not None:  # zero pad, as mlab
+        buf = np.zeros((carry.shape[0], NFFT), dtype=carry.dtype)
+        buf[:, : carry.shape[1]] = carry
+        yield buf[:, None, :]
+
+
+# /def
+
+
+##############################################################################
+### Spectra
+
+
+class _Spectrum(object):
+    """the per-segment spectrum: mlab._spectral_helper, in batches"""
+
+    def __init__(
+        self,
+        NFFT=None,
+        Fs=None,
+        detrend=None,
+        window=None,
+        noverlap=None,
+        pad_to=None,
+        sides=None,
+        scale_by_freq=None,
+        mode=None,
+        is_complex=False,
+    ):
+        self.NFFT = 256 if NFFT is None else int(NFFT)
+        self.Fs = 2 if Fs is None else Fs
+        self.noverlap = 0 if noverlap is None else int(noverlap)
+        self.step = self.NFFT - self.noverlap
+        self.pad_to = self.NFFT if pad_to is None else int(pad_to)
+
+        if self.step <= 0:
+            raise ValueError("noverlap must be less than NFFT")
+
+        self.mode = "psd" if mode in (None, "default") else mode
+        if self.mode not in ("psd", "complex", "magnitude", "angle", "phase"):
+            raise ValueError(f"Unknown value for mode {mode}")
+
+        if sides in (None, "default"):
+            sides = "twosided" if is_complex else "onesided"
+        elif sides not in ("onesided", "twosided"):
+            raise ValueError(f"Unknown value for sides {sides}")
+        self.sides = sides
+
+        if self.mode != "psd":
+            scale_by_freq = False
+        elif scale_by_freq is None:
+            scale_by_freq = True
+        self.scale_by_freq = scale_by_freq
+
+        if detrend is None or detrend is mlab.detrend_none:
+            detrend = "none"
+        self.detrend = detrend
+
+        if window is None:
+            window = mlab.window_hanning
+        if callable(window):
+            window = window(np.ones(self.NFFT))
+        self.window = np.asarray(window)
+        if self.window.shape != (self.NFFT,):
+            raise ValueError("The len(window) must be the same as NFFT")
+
+        # frequencies, as mlab
+        if sides == "twosided":
+            self.nfreqs = self.pad_to
+        else:
+            self.nfreqs = self.pad_to // 2 + 1
+        self.rfft = sides == "onesided" and not is_complex
+
+    # /def
+
+    def fft(self, segs):
+        """the FFTs of a batch of segments, (..., nfreqs)"""
+        segs = np.array(segs)  # reads memory-mapped data
+        if self.detrend != "none":
+            segs = mlab.detrend(segs, self.detrend, axis=-1)
+        segs = segs * self.window
+        if self.rfft:
+            return np.fft.rfft(segs, n=self.pad_to, axis=-1)
+        return np.fft.fft(segs, n=self.pad_to, axis=-1)[..., : self.nfreqs]
+
+    # /def
+
+    def segment_spectra(self, segs):
+        """the per-segment spectra of *mode*, of a batch of one signal"""
+        res = self.fft(segs[0])
+        if self.mode == "psd":
+            res = (np.conj(res) * res).real
+        elif self.mode == "magnitude":
+            res = np.abs(res) / np.abs(self.window).sum()
+        elif self.mode in ("angle", "phase"):
+            res = np.angle(res)
+        else:  # complex
+            res = res / np.abs(self.window).sum()
+        return res
+
+    # /def
+
+    def scale(self, spec):
+        """the one-sided & density scaling of mlab, for mode 'psd'"""
+        if self.mode != "psd":
+            return spec
+        spec = np.array(spec)
+        if self.sides == "onesided":
+            slc = slice(1, -1) if not self.NFFT % 2 else slice(1, None)
+            spec[slc] *= 2.0
+        if self.scale_by_freq:
+            spec /= self.Fs
+            spec /= (np.abs(self.window) ** 2).sum()
+        else:
+            spec /= np.abs(self.window).sum() ** 2
+        return spec
+
+    # /def
+
+    def freqs(self):
+        """the frequencies, as mlab"""
+        freqs = np.fft.fftfreq(self.pad_to, 1 / self.Fs)[: self.nfreqs]
+        if self.sides == "twosided":
+            return np.fft.fftshift(freqs)
+        if not self.pad_to % 2:
+            freqs[-1] *= -1
+        return freqs
+
+    # /def
+
+    def order(self, spec):
+        """spec in the frequency order of freqs"""
+        if self.sides == "twosided":
+            return np.fft.fftshift(spec, axes=0)
+        return spec
+
+    # /def
+
+
+# /class
+
+
+def _is_complex(x):
+    return np.iscomplexobj(x) if _is_array(x) else False
+
+
+# /def
+
+
+def _peek(chunks):
+    """the first chunk and the chunks"""
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    if first is None:
+        raise ValueError("the signal is empty")
+    return first, chain([first], chunks)
+
+
+# /def
+
+
+def _summed_spectra(
+    x,
+    y=None,
+    NFFT=None,
+    Fs=None,
+    detrend=None,
+    window=None,
+    noverlap=None,
+    pad_to=None,
+    sides=None,
+    scale_by_freq=None,
+    cross=("xy",),
+    chunksize=_chunksize,
+    batchsize=_batchsize,
+    max_workers=None,
+):
+    """the segment-averaged (cross) power spectra, see welch
+
+    Returns
+    -------
+    spectra : list of ndarray
+        per item of *cross*: 'xx', 'yy' or 'xy'
+    spectrum : _Spectrum
+    """
+    first, chunks = _peek(_signal_chunks(x, y, chunksize=chunksize))
+    spectrum = _Spectrum(
+        NFFT=NFFT,
+        Fs=Fs,
+        detrend=detrend,
+        window=window,
+        noverlap=noverlap,
+        pad_to=pad_to,
+        sides=sides,
+        scale_by_freq=scale_by_freq,
+        is_complex=any(np.iscomplexobj(c) for c in first),
+    )
+    pairs = [("xy".index(c[0]), "xy".index(c[1])) for c in cross]
+
+    def _sum(segs):
+        ffts = spectrum.fft(segs)
+        return len(segs[0]), [
+            (np.conj(ffts[i]) * ffts[j]).sum(axis=0) for i, j in pairs
+        ]
+
+    batches = _segment_batches(
+        chunks, spectrum.NFFT, spectrum.step, batchsize=batchsize
+    )
+
+    count, sums = 0, None
+    for n, parts in _imap(_sum, batches, max_workers):
+        count += n
+        sums = parts if sums is None else [s + p for s, p in zip(sums, parts)]
+
+    spectra = [spectrum.order(spectrum.scale(s / count)) for s in sums]
+    return spectra, spectrum
+
+
+# /def
+
+
+def welch(
+    x,
+    y=None,
+    NFFT=None,
+    Fs=None,
+    detrend=None,
+    window=None,
+    noverlap=None,
+    pad_to=None,
+    sides=None,
+    scale_by_freq=None,
+    chunksize=_chunksize,
+    batchsize=_batchsize,
+    max_workers=None,
+):
+    """streaming mlab.psd (y=None) or mlab.csd
+
+    Parameters
+    ----------
+    x, y : array or iterator of arrays
+        arrays (including memory-mapped) are read a chunk at a time.
+        iterators of x chunks may be of (x, y) pairs, with y None
+    NFFT, Fs, detrend, window, noverlap, pad_to, sides, scale_by_freq :
+        see mlab.psd
+    chunksize : int
+        samples read at a time, from arrays
+    batchsize : int
+        segments FFT'd per task
+    max_workers : int, None
+        threads, see ThreadPoolExecutor
+
+    Returns
+    -------
+    Pxy : ndarray
+        real for the psd
+    freqs : ndarray
+    """
+    pairs = y is None and not _is_array(x)  # maybe (x, y) chunks
+    first, chunks = _peek(_signal_chunks(x, y, chunksize=chunksize))
+    cross = "xy" if y is not None or (pairs and len(first) == 2) else "xx"
+
+    (pxy,), spectrum = _summed_spectra(
+        chunks,
+        NFFT=NFFT,
+        Fs=Fs,
+        detrend=detrend,
+        window=window,
+        noverlap=noverlap,
+        pad_to=pad_to,
+        sides=sides,
+        scale_by_freq=scale_by_freq,
+        cross=(cross,),
+        batchsize=batchsize,
+        max_workers=max_workers,
+    )
+    if cross == "xx":
+        pxy = pxy.real
+
+    return pxy, spectrum.freqs()
+
+
+# /def
+
+
+def coherence(
+    x,
+    y=None,
+    NFFT=256,
+    Fs=2,
+    detrend=mlab.detrend_none,
+    window=mlab.window_hanning,
+    noverlap=0,
+    pad_to=None,
+    sides="default",
+    scale_by_freq=None,
+    chunksize=_chunksize,
+    batchsize=_batchsize,
+    max_workers=None,
+):
+    """streaming mlab.cohere, in one pass over the signals
+
+    Parameters are as for welch, *y* is required unless *x* is an
+    iterator of (x, y) chunks.
+
+    Returns
+    -------
+    Cxy : ndarray
+    freqs : ndarray
+    """
+    (pxx, pyy, pxy), spectrum = _summed_spectra(
+        _signal_chunks(x, y, chunksize=chunksize),
+        NFFT=NFFT,
+        Fs=Fs,
+        detrend=detrend,
+        window=window,
+        noverlap=noverlap,
+        pad_to=pad_to,
+        sides=sides,
+        scale_by_freq=scale_by_freq,
+        cross=("xx", "yy", "xy"),
+        batchsize=batchsize,
+        max_workers=max_workers,
+    )
+    cxy = np.abs(pxy) ** 2 / (pxx.real * pyy.real)
+    return cxy, spectrum.freqs()
+
+
+# /def
+
+
+class _ColumnReducer(object):
+    """spectrogram columns, averaged in groups of consecutive segments
+
+    If there are more than 2 * *width* columns, pairs are merged and the
+    group size doubles, so memory is bounded for signals of unknown
+    length.
+
+    Parameters
+    ----------
+    width : int, None
+        None for no reduction
+    group : int
+        the initial group size
+    first : bool
+        whether a group is its first column, instead of the mean.
+        ex: for angles
+    """
+
+    def __init__(self, width=None, group=1, first=False):
+        self.width = width
+        self.group = max(int(group), 1)
+        self.first = first
+        self.columns = []
+        self.times = []
+        self.tlim = None  # (first, last) segment times
+
+        # the group in progress
+        self._sum, self._t, self._n = None, 0.0, 0
+
+    # /def
+
+    def add(self, cols, times):
+        """add the (nsegments, nfreqs) spectra of segments at *times*"""
+        if not len(cols):
+            return
+        if self.tlim is None:
+            self.tlim = (times[0], times[-1])
+        self.tlim = (self.tlim[0], times[-1])
+
+        i = 0
+        while i < len(cols):
+            take = min(self.group - self._n, len(cols) - i)
+            block = cols[i : i + take]
+            if self._n == 0:
+                self._sum = block[0].copy() if self.first else 0.0
+            if not self.first:
+                self._sum = self._sum + block.sum(axis=0)
+            self._t += times[i : i + take].sum()
+            self._n += take
+            i += take
+            if self._n == self.group:
+                self._finish()
+
+    # /def
+
+    def _finish(self):
+        col = self._sum if self.first else self._sum / self._n
+        self.columns.append(col)
+        self.times.append(self._t / self._n)
+        self._sum, self._t, self._n = None, 0.0, 0
+
+        if self.width and len(self.columns) > 2 * self.width:
+            self._merge()
+
+    # /def
+
+    def _merge(self):
+        """merge pairs of columns, doubling the group size"""
+        cols, times, g = self.columns, self.times, self.group
+        n = len(cols) // 2 * 2
+
+        if self.first:
+            self.columns = cols[:n:2]
+        else:
+            self.columns = [
+                (a + b) / 2 for a, b in zip(cols[:n:2], cols[1:n:2])
+            ]
+        self.times = [(a + b) / 2 for a, b in zip(times[:n:2], times[1:n:2])]
+        self.group = 2 * g
+
+        if n < len(cols):  # the odd one out starts the next group
+            self._sum = cols[-1] if self.first else cols[-1] * g
+            self._t = times[-1] * g
+            self._n = g
+
+    # /def
+
+    def result(self):
+        """the columns, (nfreqs, ncolumns), and their times"""
+        if self._n:
+            self._finish()
+        return np.array(self.columns).T, np.array(self.times)
+
+    # /def
+
+
+# /class
+
+
+def _spectrogram(
+    x,
+    NFFT=None,
+    Fs=None,
+    detrend=None,
+    window=None,
+    noverlap=None,
+    pad_to=None,
+    sides=None,
+    scale_by_freq=None,
+    mode=None,
+    width=None,
+    chunksize=_chunksize,
+    batchsize=_batchsize,
+    max_workers=None,
+):
+    """see spectrogram, also returning the (first, last) segment times"""
+    if NFFT is None:
+        NFFT = 256  # as mlab.specgram
+    if noverlap is None:
+        noverlap = 128
+
+    first, chunks = _peek(_signal_chunks(x, chunksize=chunksize))
+    spectrum = _Spectrum(
+        NFFT=NFFT,
+        Fs=Fs,
+        detrend=detrend,
+        window=window,
+        noverlap=noverlap,
+        pad_to=pad_to,
+        sides=sides,
+        scale_by_freq=scale_by_freq,
+        mode=mode,
+        is_complex=np.iscomplexobj(first[0]),
+    )
+    if width is not None and spectrum.mode == "complex":
+        raise ValueError("complex spectrograms cannot be reduced in width")
+
+    group = 1
+    if width is not None and _is_array(x):  # the group size is known
+        nseg = max(1 + (np.size(x) - spectrum.NFFT) // spectrum.step, 1)
+        group = math.ceil(nseg / width)
+    reducer = _ColumnReducer(
+        width, group=group, first=spectrum.mode in ("angle", "phase")
+    )
+
+    batches = _segment_batches(
+        chunks, spectrum.NFFT, spectrum.step, batchsize=batchsize
+    )
+    k = 0
+    for cols in _imap(spectrum.segment_spectra, batches, max_workers):
+        idx = k + np.arange(len(cols))
+        reducer.add(
+            cols, (spectrum.NFFT / 2 + spectrum.step * idx) / spectrum.Fs
+        )
+        k += len(cols)
+
+    spec, t = reducer.result()
+    spec = spectrum.order(spectrum.scale(spec))
+    if spectrum.mode == "phase":
+        spec = np.unwrap(spec, axis=0)
+
+    return spec, spectrum.freqs(), t, reducer.tlim
+
+
+# /def
+
+
+def spectrogram(
+    x,
+    NFFT=None,
+    Fs=None,
+    detrend=None,
+    window=None,
+    noverlap=None,
+    pad_to=None,
+    sides=None,
+    scale_by_freq=None,
+    mode=None,
+    width=None,
+    chunksize=_chunksize,
+    batchsize=_batchsize,
+    max_workers=None,
+):
+    """streaming mlab.specgram, reduced to about *width* columns
+
+    Parameters
+    ----------
+    x : array or iterator of arrays
+        arrays (including memory-mapped) are read a chunk at a time
+    NFFT, Fs, detrend, window, noverlap, pad_to, sides, scale_by_freq, mode :
+        see mlab.specgram
+    width : int, None
+        average consecutive segments into columns, so there are at most
+        *width* (for arrays) or 2 * *width* (for iterators) columns.
+        for modes 'angle' and 'phase' the first of each group is kept.
+        None (default) for all segments
+    chunksize, batchsize, max_workers :
+        see welch
+
+    Returns
+    -------
+    spec : ndarray
+        (nfreqs, ncolumns)
+    freqs : ndarray
+    t : ndarray
+        the mean time of each column
+    """
+    if Fs is None:
+        Fs = 2
+    spec, freqs, t, _ = _spectrogram(
+        x,
+        NFFT=NFFT,
+        Fs=Fs,
+        detrend=detrend,
+        window=window,
+        noverlap=noverlap,
+        pad_to=pad_to,
+        sides=sides,
+        scale_by_freq=scale_by_freq,
+        mode=mode,
+        width=width,
+        chunksize=chunksize,
+        batchsize=batchsize,
+        max_workers=max_workers,
+    )
+    return spec, freqs, t
+
+
+# /def
+
+
+def use_engine(*arrs, engine=None):
+    """whether to use the spectral engine
+
+    Parameters
+    ----------
+    *arrs : the signal arguments
+    engine : bool, None
+        None: for iterators of chunks, memory-mapped arrays and
+        array-likes above the size threshold
+
+    Returns
+    -------
+    bool
+    """
+    if engine is not None:
+        return bool(engine)
+    arrs = [a for a in arrs if a is not None]
+    if not all(_is_array(a) for a in arrs):  # iterators are opted in
+        return True
+    if any(isinstance(a, np.memmap) for a in arrs):
+        return True
+    return np.size(np.asanyarray(arrs[0])) >= _engine_threshold
+
+
+# /def
+
+
+##############################################################################
+### Plotting
+
+
+def _db_yticks(ax):
+    """the 10 dB y ticks of Axes.psd & csd"""
+    vmin, vmax = ax.viewLim.intervaly
+    logi = int(np.log10(vmax - vmin))
+    if logi == 0:
+        logi = 0.1
+    step = 10 * logi
+    ax.set_yticks(np.arange(math.floor(vmin), math.ceil(vmax) + 1, step))
+
+
+# /def
+
+
+def _engine_kw(kw):
+    """pop the engine arguments from plot arguments"""
+    return {
+        k: kw.pop(k)
+        for k in ("chunksize", "batchsize", "max_workers")
+        if k in kw
+    }
+
+
+# /def
+
+
+def psd(
+    ax,
+    x,
+    NFFT=None,
+    Fs=None,
+    Fc=None,
+    detrend=None,
+    window=None,
+    noverlap=None,
+    pad_to=None,
+    sides=None,
+    scale_by_freq=None,
+    return_line=None,
+    **kw
+):
+    """Axes.psd, computed by the streaming engine
+
+    *x* is an array, or an iterator of chunks. Other arguments are as
+    for Axes.psd, and the engine's, see welch.
+    """
+    pxx, freqs = welch(
+        x,
+        NFFT=NFFT,
+        Fs=Fs,
+        detrend=detrend,
+        window=window,
+        noverlap=noverlap,
+        pad_to=pad_to,
+        sides=sides,
+        scale_by_freq=scale_by_freq,
+        **_engine_kw(kw)
+    )
+    freqs += 0 if Fc is None else Fc
+
+    units = "dB/Hz" if scale_by_freq in (None, True) else "dB"
+    line = ax.plot(freqs, 10 * np.log10(pxx), **kw)
+    ax.set_xlabel("Frequency")
+    ax.set_ylabel(f"Power Spectral Density ({units})")
+    ax.grid(True)
+    _db_yticks(ax)
+
+    if return_line:
+        return pxx, freqs, line
+    return pxx, freqs
+
+
+# /def
+
+
+def csd(
+    ax,
+    x,
+    y=None,
+    NFFT=None,
+    Fs=None,
+    Fc=None,
+    detrend=None,
+    window=None,
+    noverlap=None,
+    pad_to=None,
+    sides=None,
+    scale_by_freq=None,
+    return_line=None,
+    **kw
+):
+    """Axes.csd, computed by the streaming engine
+
+    *x*, *y* are arrays, or iterators of chunks (or *x* of (x, y)
+    chunks). Other arguments are as for Axes.csd, and the engine's,
+    see welch.
+    """
+    pxy, freqs = welch(
+        x,
+        y,
+        NFFT=NFFT,
+        Fs=Fs,
+        detrend=detrend,
+        window=window,
+        noverlap=noverlap,
+        pad_to=pad_to,
+        sides=sides,
+        scale_by_freq=scale_by_freq,
+        **_engine_kw(kw)
+    )
+    freqs += 0 if Fc is None else Fc
+
+    line = ax.plot(freqs, 10 * np.log10(np.abs(pxy)), **kw)
+    ax.set_xlabel("Frequency")
+    ax.set_ylabel("Cross Spectrum Magnitude (dB)")
+    ax.grid(True)
+    _db_yticks(ax)
+
+    if return_line:
+        return pxy, freqs, line
+    return pxy, freqs
+
+
+# /def
+
+
+def cohere(
+    ax,
+    x,
+    y=None,
+    NFFT=256,
+    Fs=2,
+    Fc=0,
+    detrend=mlab.detrend_none,
+    window=mlab.window_hanning,
+    noverlap=0,
+    pad_to=None,
+    sides="default",
+    scale_by_freq=None,
+    **kw
+):
+    """Axes.cohere, computed by the streaming engine in one pass
+
+    see csd for the signals, and Axes.cohere for the other arguments
+    """
+    cxy, freqs = coherence(
+        x,
+        y,
+        NFFT=NFFT,
+        Fs=Fs,
+        detrend=detrend,
+        window=window,
+        noverlap=noverlap,
+        pad_to=pad_to,
+        sides=sides,
+        scale_by_freq=scale_by_freq,
+        **_engine_kw(kw)
+    )
+    freqs += Fc
+
+    ax.plot(freqs, cxy, **kw)
+    ax.set_xlabel("Frequency")
+    ax.set_ylabel("Coherence")
+    ax.grid(True)
+
+    return cxy, freqs
+
+
+# /def
+
+
+def specgram(
+    ax,
+    x,
+    NFFT=None,
+    Fs=None,
+    Fc=None,
+    detrend=None,
+    window=None,
+    noverlap=None,
+    cmap=None,
+    xextent=None,
+    pad_to=None,
+    sides=None,
+    scale_by_freq=None,
+    mode=None,
+    scale=None,
+    vmin=None,
+    vmax=None,
+    width=None,
+    **kw
+):
+    """Axes.specgram, computed by the streaming engine
+
+    *x* is an array, or an iterator of chunks. The spectrogram columns
+    are reduced to the display *width*, see spectrogram. Other arguments
+    are as for Axes.specgram, and the engine's, see welch.
+
+    Parameters
+    ----------
+    width : int, None
+        default: the width of the axes, in pixels
+    """
+    if NFFT is None:
+        NFFT = 256
+    if Fs is None:
+        Fs = 2
+    if Fc is None:
+        Fc = 0
+    if noverlap is None:
+        noverlap = 128
+
+    if mode == "complex":
+        raise ValueError("Cannot plot a complex specgram")
+
+    if scale is None or scale == "default":
+        scale = "linear" if mode in ("angle", "phase") else "dB"
+    elif mode in ("angle", "phase") and scale == "dB":
+        raise ValueError("Cannot use dB scale with angle or phase mode")
+
+    if width is None:
+        width = max(int(math.ceil(ax.get_window_extent().width)), 1)
+
+    spec, freqs, t, tlim = _spectrogram(
+        x,
+        NFFT=NFFT,
+        Fs=Fs,
+        detrend=detrend,
+        window=window,
+        noverlap=noverlap,
+        pad_to=pad_to,
+        sides=sides,
+        scale_by_freq=scale_by_freq,
+        mode=mode,
+        width=width,
+        **_engine_kw(kw)
+    )
+
+    if scale == "linear":
+        Z = spec
+    elif scale == "dB":
+        factor = 10.0 if mode in (None, "default", "psd") else 20.0
+        Z = factor * np.log10(spec)
+    else:
+        raise ValueError(f"Unknown scale {scale}")
+
+    Z = np.flipud(Z)
+
+    if xextent is None:  # the segments, not the (averaged) columns
+        pad_xextent = (NFFT - noverlap) / Fs / 2
+        xextent = tlim[0] - pad_xextent, tlim[1] + pad_xextent
+    xmin, xmax = xextent
+    freqs += Fc
+    extent = xmin, xmax, freqs[0], freqs[-1]
+    im = ax.imshow(Z, cmap, extent=extent, vmin=vmin, vmax=vmax, **kw)
+    ax.axis("auto")
+
+    return spec, freqs, t, im
+
+
+# /def
+
+##############################################################################
+# END
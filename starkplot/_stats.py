@@ -0,0 +1,849 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _stats
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""vectorized boxplot & violinplot statistics for many groups
+
+matplotlib computes the statistics of each box and violin in a Python
+loop, with an exact KDE per violin. Here the values of all groups are
+sorted into one array, grouped by one stable sort of the group labels,
+after which the quantiles, means, whiskers & fliers of every group are
+read off at once.
+The KDEs of all groups are evaluated together on their grids by linear
+binning and FFT convolution with each group's Gaussian kernel.
+
+Groups are given as a list of datasets (as in matplotlib), or as flat
+values and a group label per value. Groups can also be QuantileSketches,
+for data which never fits in memory, or precomputed statistics dicts,
+which are drawn as is. NaN values are ignored.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "group_data",
+    "boxplot_stats",
+    "violin_stats",
+    "boxplot",
+    "violinplot",
+    "use_engine",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+
+# matplotlib
+from matplotlib import rcParams, cbook, mlab
+from matplotlib.axes._base import _process_plot_format
+
+## Project-Specific
+from ._quantile import QuantileSketch
+
+
+##############################################################################
+### Info
+
+# the number of groups above which the engine is used
+_engine_groups = 32
+
+# KDE grid spacing, in kernel widths
+_kde_spacing = 0.2
+
+# largest KDE grid, beyond which the KDE is summed exactly
+_kde_max_grid = 2 ** 14
+
+# elements (groups x grid) of one batch of KDEs
+_kde_batch = 2 ** 22
+
+# values x coordinates of one block of an exact KDE
+_exact_block = 2 ** 20
+
+# Axes.bxp arguments defaulting to rcParams in Axes.boxplot
+_bxp_rcparams = {
+    "vert": "boxplot.vertical",
+    "patch_artist": "boxplot.patchartist",
+    "shownotches": "boxplot.notch",
+    "meanline": "boxplot.meanline",
+    "showmeans": "boxplot.showmeans",
+    "showcaps": "boxplot.showcaps",
+    "showbox": "boxplot.showbox",
+    "showfliers": "boxplot.showfliers",
+}
+
+
+##############################################################################
+### Grouping
+
+
+class _Groups(object):
+    """values sorted by group, then value
+
+    Attributes
+    ----------
+    values : ndarray
+    weights : ndarray or None
+    starts, counts : int ndarray
+        the slice of each group in *values*
+    keys : ndarray or None
+        the label of each group
+    """
+
+    __slots__ = ("values", "weights", "starts", "counts", "keys")
+
+    def __init__(self, values, weights, starts, counts, keys=None):
+        self.values = values
+        self.weights = weights
+        self.starts = starts
+        self.counts = counts
+        self.keys = keys
+
+    # /def
+
+    def __len__(self):
+        return len(self.counts)
+
+    # /def
+
+    @property
+    def index(self):
+        """the group of each value"""
+        return np.repeat(np.arange(len(self.counts)), self.counts)
+
+    # /def
+
+    def reduce(self, arr):
+        """the per-group sums of an array aligned with *values*"""
+        out = np.zeros(len(self.counts))
+        full = self.counts > 0
+        if full.any():
+            out[full] = np.add.reduceat(arr, self.starts[full])
+        return out
+
+    # /def
+
+    def percentile(self, p):
+        """linearly interpolated percentiles (as np.percentile)
+
+        Parameters
+        ----------
+        p : float or ndarray
+            per group, if an array
+
+        Returns
+        -------
+        values : ndarray
+            NaN for empty groups
+        """
+        n = self.counts
+        full = n > 0
+        if not full.any():
+            return np.full(len(n), np.nan)
+        pos = np.asarray(p, dtype=float) / 100.0 * np.maximum(n - 1, 0)
+        below = np.floor(pos).astype(int)
+        frac = pos - below
+        above = np.minimum(below + 1, np.maximum(n - 1, 0))
+        last = len(self.values) - 1
+        lo = self.values[np.minimum(self.starts + below, last)]
+        hi = self.values[np.minimum(self.starts + above, last)]
+        return np.where(full, lo + (hi - lo) * frac, np.nan)
+
+    # /def
+
+    def split(self, arr):
+        """an array aligned with *values* split into the groups"""
+        return np.split(arr, np.cumsum(self.counts)[:-1])
+
+    # /def
+
+
+# /class
+
+
+def group_data(X, groups=None):
+    """sort the values of many groups at once
+
+    Parameters
+    ----------
+    X : array-like
+        a list of datasets, or the columns of a 2D array (as matplotlib).
+        if *groups* is given, the flat values
+    groups : array-like, optional
+        the group label of each value of *X*
+
+    Returns
+    -------
+    groups : _Groups
+        with the sorted unique labels as keys, if *groups* is given
+    """
+    if groups is None:
+        datasets = cbook._reshape_2D(X, "X")
+        lengths = [len(x) for x in datasets]
+        values = np.concatenate(
+            [np.asarray(x, dtype=float) for x in datasets] or [[]]
+        )
+        index = np.repeat(np.arange(len(datasets)), lengths)
+        keys = None
+    else:
+        values = np.ravel(np.asarray(X, dtype=float))
+        labels = np.ravel(groups)
+        if len(labels) != len(values):
+            raise ValueError("groups must have one label per value")
+        keys, index = np.unique(labels, return_inverse=True)
+
+    ngroups = len(keys) if keys is not None else len(lengths)
+
+    keep = ~np.isnan(values)
+    values, index = values[keep], index[keep]
+
+    # group with a stable (radix) sort of the integer index, then sort
+    # each group's values in place, cheaper than a lexsort on both
+    if groups is not None:
+        order = np.argsort(index, kind="stable")
+        values = values[order]
+    counts = np.bincount(index, minlength=ngroups)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        values[start:end].sort()
+
+    return _Groups(values, None, starts, counts, keys)
+
+
+# /def
+
+
+def _sketch_groups(sketches):
+    """the weighted items of QuantileSketches, as groups"""
+    items = [s.items() for s in sketches]
+    counts = np.array([len(v) for v, _ in items])
+    values = np.concatenate([v for v, _ in items] or [[]])
+    weights = np.concatenate([w for _, w in items] or [[]])
+    return _Groups(values, weights, np.cumsum(counts) - counts, counts)
+
+
+# /def
+
+
+def _is_sketches(X):
+    return (
+        isinstance(X, (list, tuple))
+        and len(X) > 0
+        and all(isinstance(x, QuantileSketch) for x in X)
+    )
+
+
+# /def
+
+
+def _is_stats(X):
+    return (
+        isinstance(X, (list, tuple))
+        and len(X) > 0
+        and all(isinstance(x, dict) for x in X)
+    )
+
+
+# /def
+
+
+##############################################################################
+### Box Statistics
+
+
+def _empty_box(label=None):
+    stats = {} if label is None else {"label": label}
+    stats["fliers"] = np.array([])
+    for key in ("mean", "med", "q1", "q3", "cilo", "cihi"):
+        stats[key] = np.nan
+    stats["whislo"] = stats["whishi"] = np.nan
+    return stats
+
+
+# /def
+
+
+def _bootstrap_median(data, N=5000):
+    """95% confidence interval of the median, as matplotlib"""
+    estimate = np.median(
+        data[np.random.randint(len(data), size=(N, len(data)))], axis=1
+    )
+    return np.percentile(estimate, [2.5, 97.5])
+
+
+# /def
+
+
+def _whisker_limits(percentile, q1, q3, iqr, whis, autorange):
+    """the lower & upper whisker bounds of each group
+
+    *percentile* is the function of the per-group percentiles
+    """
+    rng = np.zeros(len(q1), dtype=bool)
+    if autorange:
+        rng |= iqr == 0
+
+    if np.isscalar(whis) and np.isreal(whis):
+        loval, hival = q1 - whis * iqr, q3 + whis * iqr
+    elif np.isscalar(whis):
+        if whis not in ("range", "limit", "limits", "min/max"):
+            raise ValueError(
+                "whis must be a float, valid string, or list of percentiles"
+            )
+        loval, hival = np.full(len(q1), -np.inf), np.full(len(q1), np.inf)
+    else:
+        loval, hival = percentile(whis[0]), percentile(whis[1])
+
+    loval = np.where(rng, -np.inf, loval)
+    hival = np.where(rng, np.inf, hival)
+
+    return loval, hival
+
+
+# /def
+
+
+def _box_dicts(g, mean, q1, med, q3, whislo, whishi, fliers, labels, ci):
+    """the per-group stats dicts, as matplotlib's boxplot_stats"""
+    if labels is None:
+        labels = g.keys if g.keys is not None else [None] * len(g)
+    elif len(labels) != len(g):
+        raise ValueError("Dimensions of labels and X must be compatible")
+
+    bxpstats = []
+    for i, label in enumerate(labels):
+        if g.counts[i] == 0:
+            bxpstats.append(_empty_box(label))
+            continue
+
+        stats = {} if label is None else {"label": label}
+        stats["mean"] = mean[i]
+        stats["iqr"] = q3[i] - q1[i]
+        stats["cilo"], stats["cihi"] = ci[0][i], ci[1][i]
+        stats["whishi"], stats["whislo"] = whishi[i], whislo[i]
+        stats["fliers"] = fliers[i]
+        stats["q1"], stats["med"], stats["q3"] = q1[i], med[i], q3[i]
+        bxpstats.append(stats)
+
+    return bxpstats
+
+
+# /def
+
+
+def boxplot_stats(
+    X, whis=1.5, bootstrap=None, labels=None, autorange=False, groups=None
+):
+    """the boxplot statistics of many groups, vectorized
+
+    as matplotlib.cbook.boxplot_stats, but all groups are sorted at once.
+    The fliers of each group are sorted.
+
+    Parameters
+    ----------
+    X : array-like or list of QuantileSketch
+        see group_data. Sketches give estimated quantiles, whiskers at
+        the whisker bounds (within the extrema), and no fliers
+    whis : float, str, or (float, float)
+        see matplotlib.cbook.boxplot_stats
+    bootstrap : int, optional
+        the number of bootstrap resamples of the median's confidence
+        interval, which is a loop over groups. Ignored for sketches
+    labels : sequence, optional
+        default: the group labels, if *groups* is given
+    autorange : bool
+    groups : array-like, optional
+        the group label of each value of *X*
+
+    Returns
+    -------
+    bxpstats : list of dict
+        for Axes.bxp
+    """
+    sketches = _is_sketches(X)
+    g = _sketch_groups(X) if sketches else group_data(X, groups)
+    n = np.array([s.n for s in X]) if sketches else g.counts
+    full = n > 0
+
+    if sketches:
+        q1, med, q3 = np.array(
+            [s.percentile([25, 50, 75]) for s in X]
+        ).T.reshape(3, -1)
+        mean = g.reduce(g.values * g.weights) / np.where(
+            full, g.reduce(g.weights), 1
+        )
+    else:
+        q1, med, q3 = g.percentile(25), g.percentile(50), g.percentile(75)
+        mean = g.reduce(g.values) / np.maximum(n, 1)
+    iqr = q3 - q1
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cilo = med - 1.57 * iqr / np.sqrt(n)
+        cihi = med + 1.57 * iqr / np.sqrt(n)
+    if bootstrap is not None and not sketches:
+        for i, x in enumerate(g.split(g.values)):
+            if len(x):
+                cilo[i], cihi[i] = _bootstrap_median(x, N=bootstrap)
+
+    def percentile(p):
+        if sketches:
+            return np.array([s.percentile(p) for s in X])
+        return g.percentile(p)
+
+    loval, hival = _whisker_limits(percentile, q1, q3, iqr, whis, autorange)
+
+    if sketches:
+        # the data near the bounds is not kept, so they're the whiskers,
+        # within the exact extrema
+        mins = np.array([s.min for s in X])
+        maxs = np.array([s.max for s in X])
+        whislo = np.minimum(np.maximum(loval, mins), q1)
+        whishi = np.maximum(np.minimum(hival, maxs), q3)
+        fliers = [np.array([]) for _ in X]
+    else:
+        # the values within the bounds, from the counts outside them
+        index = g.index
+        nlo = g.reduce((g.values < loval[index]).astype(float))
+        nhi = g.reduce((g.values <= hival[index]).astype(float))
+        nlo, nhi = nlo.astype(int), nhi.astype(int)
+        last = max(len(g.values) - 1, 0)
+        values = g.values if len(g.values) else np.full(1, np.nan)
+        whislo = values[np.minimum(g.starts + nlo, last)]
+        whishi = values[np.clip(g.starts + nhi - 1, 0, last)]
+        whislo = np.where((nlo < g.counts) & (whislo <= q1), whislo, q1)
+        whishi = np.where((nhi > 0) & (whishi >= q3), whishi, q3)
+
+        out = (g.values < whislo[index]) | (g.values > whishi[index])
+        nout = g.reduce(out.astype(float)).astype(int)
+        fliers = np.split(g.values[out], np.cumsum(nout)[:-1])
+
+    return _box_dicts(
+        g, mean, q1, med, q3, whislo, whishi, fliers, labels, (cilo, cihi)
+    )
+
+
+# /def
+
+
+##############################################################################
+### Violin Statistics
+
+
+def _kde_factors(g, bw_method, n):
+    """the bandwidth factor of each group, as mlab.GaussianKDE"""
+    if bw_method is None or bw_method == "scott":
+        return np.power(n, -1.0 / 5)
+    elif bw_method == "silverman":
+        return np.power(n * 3.0 / 4, -1.0 / 5)
+    elif np.isscalar(bw_method) and not isinstance(bw_method, str):
+        return np.full(len(g), float(bw_method))
+    elif callable(bw_method):
+        factors = np.ones(len(g))
+        for i, x in enumerate(g.split(g.values)):
+            if len(x) and x.min() != x.max():
+                kde = mlab.GaussianKDE(x, bw_method)
+                factors[i] = kde.covariance_factor()
+        return factors
+    raise ValueError(
+        "'bw_method' should be 'scott', 'silverman', a scalar or a callable"
+    )
+
+
+# /def
+
+
+def _binned_kde(g, sel, lo, hi, sigma, wsum, points, r):
+    """grid KDEs of the groups *sel*, by linear binning & FFT convolution
+
+    the grids have (points - 1) * r + 1 nodes, every r-th one returned
+    """
+    M = (points - 1) * r + 1
+    L = 1 << (2 * M - 2).bit_length()  # no wrap-around
+    offset = np.arange(L)
+    offset = np.minimum(offset, L - offset)
+
+    vals = np.empty((len(sel), points))
+    step = max(_kde_batch // L, 1)
+    for b in range(0, len(sel), step):
+        grp = sel[b : b + step]
+        G = len(grp)
+        delta = (hi[grp] - lo[grp]) / (M - 1)
+
+        # linear binning onto the grid
+        counts = g.counts[grp]
+        index = np.repeat(np.arange(G), counts)
+        take = np.arange(counts.sum()) + np.repeat(
+            g.starts[grp] - (np.cumsum(counts) - counts), counts
+        )
+        pos = (g.values[take] - lo[grp][index]) / delta[index]
+        cell = np.clip(np.floor(pos).astype(int), 0, M - 2)
+        frac = pos - cell
+        w = 1.0 if g.weights is None else g.weights[take]
+        flat = index * L + cell
+        grid = np.bincount(flat, w * (1 - frac), minlength=G * L)
+        grid += np.bincount(flat + 1, w * frac, minlength=G * L)
+        grid = grid.reshape(G, L)
+
+        # each group's Gaussian, over the offsets within its grid
+        kern = np.exp(
+            -0.5 * (offset * (delta / sigma[grp])[:, None]) ** 2
+        )
+        kern[:, offset > M - 1] = 0
+
+        dens = np.fft.irfft(np.fft.rfft(grid) * np.fft.rfft(kern), L)
+        dens = dens[:, :M:r]
+        dens /= (np.sqrt(2 * np.pi) * sigma[grp] * wsum[grp])[:, None]
+        vals[b : b + G] = np.maximum(dens, 0)
+
+    return vals
+
+
+# /def
+
+
+def _exact_kde(x, w, coords, sigma, wsum):
+    """the KDE of one group, summed over the values in blocks"""
+    vals = np.zeros(len(coords))
+    block = max(_exact_block // len(coords), 1)
+    for i in range(0, len(x), block):
+        z = (coords[:, None] - x[None, i : i + block]) / sigma
+        k = np.exp(-0.5 * z ** 2)
+        vals += k.sum(axis=1) if w is None else k @ w[i : i + block]
+    return vals / (np.sqrt(2 * np.pi) * sigma * wsum)
+
+
+# /def
+
+
+def violin_stats(X, points=100, bw_method=None, groups=None):
+    """the violinplot statistics of many groups, vectorized
+
+    as matplotlib.cbook.violin_stats with a Gaussian KDE, but the KDEs
+    of all groups are evaluated together, on grids 1/5 of a kernel width
+    apart (interpolated to the *points* coordinates). Groups whose grid
+    would be too large are summed exactly.
+
+    Parameters
+    ----------
+    X : array-like or list of QuantileSketch
+        see group_data. The KDE of a sketch is of its weighted items
+    points : int
+        the number of KDE coordinates of each group
+    bw_method : str, scalar, callable, optional
+        see mlab.GaussianKDE
+    groups : array-like, optional
+        the group label of each value of *X*
+
+    Returns
+    -------
+    vpstats : list of dict
+        for Axes.violin
+
+    Raises
+    ------
+    ValueError
+        if a group is empty
+    """
+    sketches = _is_sketches(X)
+    g = _sketch_groups(X) if sketches else group_data(X, groups)
+    n = np.array([s.n for s in X]) if sketches else g.counts
+    if np.any(g.counts == 0):
+        raise ValueError("cannot compute the violin of an empty group")
+
+    lo = g.values[g.starts]
+    hi = g.values[g.starts + g.counts - 1]
+    if sketches:
+        median = np.array([s.percentile(50) for s in X])
+        lo = np.array([s.min for s in X])
+        hi = np.array([s.max for s in X])
+        wsum = g.reduce(g.weights)
+        mean = g.reduce(g.values * g.weights) / wsum
+        w = g.weights
+    else:
+        median = g.percentile(50)
+        wsum = n.astype(float)
+        mean = g.reduce(g.values) / wsum
+        w = 1.0
+
+    # the kernel widths, from the (weighted, n - 1) variance
+    dev = g.values - mean[g.index]
+    var = g.reduce(w * dev ** 2) / wsum * n / np.maximum(n - 1, 1)
+    sigma = np.sqrt(var) * _kde_factors(g, bw_method, n)
+
+    coords = np.linspace(lo, hi, points, axis=-1)
+    vals = np.empty((len(g), points))
+
+    flat = (hi == lo) | (sigma == 0)
+    vals[flat] = (coords[flat] == lo[flat, None]).astype(float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.ceil((hi - lo) / (sigma * _kde_spacing * (points - 1)))
+    r = np.where(flat, 1, np.maximum(r, 1))
+    binned = ~flat & ((points - 1) * r + 1 <= _kde_max_grid)
+
+    sel = np.flatnonzero(binned)
+    if len(sel):
+        rr = int(r[sel].max())
+        vals[sel] = _binned_kde(g, sel, lo, hi, sigma, wsum, points, rr)
+
+    for i in np.flatnonzero(~flat & ~binned):
+        s = slice(g.starts[i], g.starts[i] + g.counts[i])
+        vals[i] = _exact_kde(
+            g.values[s],
+            None if g.weights is None else g.weights[s],
+            coords[i],
+            sigma[i],
+            wsum[i],
+        )
+
+    return [
+        {
+            "coords": coords[i],
+            "vals": vals[i],
+            "mean": mean[i],
+            "median": median[i],
+            "min": lo[i],
+            "max": hi[i],
+        }
+        for i in range(len(g))
+    ]
+
+
+# /def
+
+
+##############################################################################
+### Plotting
+
+
+def use_engine(X, groups=None, engine=None):
+    """whether to compute the statistics of X with the engine
+
+    Parameters
+    ----------
+    X : array-like, list of QuantileSketch, or list of dict
+    groups : array-like, optional
+    engine : bool, None
+        None: for labeled groups, sketches, precomputed stats,
+        or many groups
+    """
+    if engine is not None:
+        return bool(engine)
+    if groups is not None or _is_sketches(X) or _is_stats(X):
+        return True
+    if isinstance(X, np.ndarray):
+        return X.ndim == 2 and X.shape[1] >= _engine_groups
+    if isinstance(X, (list, tuple)):
+        return len(X) >= _engine_groups and np.ndim(X[0]) > 0
+    return False
+
+
+# /def
+
+
+def _bxp_kwargs(
+    notch,
+    sym,
+    vert,
+    patch_artist,
+    meanline,
+    showmeans,
+    showcaps,
+    showbox,
+    showfliers,
+    boxprops,
+    flierprops,
+    **kw,
+):
+    """the Axes.bxp arguments of Axes.boxplot, with rcParams defaults"""
+    boxprops = dict(boxprops or {})
+    flierprops = dict(flierprops or {})
+
+    if patch_artist is None:
+        patch_artist = rcParams["boxplot.patchartist"]
+    if patch_artist:
+        boxprops["linestyle"] = "solid"  # as Axes.boxplot
+        if "color" in boxprops:
+            boxprops["edgecolor"] = boxprops.pop("color")
+
+    if showfliers is None:
+        showfliers = rcParams["boxplot.showfliers"]
+    if sym == "":
+        flierprops = dict(linestyle="none", marker="", color="none")
+        showfliers = False
+    elif sym is not None:
+        _, marker, color = _process_plot_format(sym)
+        if marker is not None:
+            flierprops["marker"] = marker
+        if color is not None:
+            flierprops["color"] = color
+            flierprops["markerfacecolor"] = color
+            flierprops["markeredgecolor"] = color
+
+    kw.update(
+        vert=vert,
+        patch_artist=patch_artist,
+        shownotches=notch,
+        meanline=meanline,
+        showmeans=showmeans,
+        showcaps=showcaps,
+        showbox=showbox,
+        showfliers=showfliers,
+        boxprops=boxprops,
+        flierprops=flierprops,
+    )
+    for key, param in _bxp_rcparams.items():
+        if kw[key] is None:
+            kw[key] = rcParams[param]
+
+    return kw
+
+
+# /def
+
+
+def boxplot(
+    ax,
+    x,
+    notch=None,
+    sym=None,
+    vert=None,
+    whis=None,
+    bootstrap=None,
+    usermedians=None,
+    conf_intervals=None,
+    labels=None,
+    autorange=False,
+    groups=None,
+    patch_artist=None,
+    meanline=None,
+    showmeans=None,
+    showcaps=None,
+    showbox=None,
+    showfliers=None,
+    boxprops=None,
+    flierprops=None,
+    **kw,
+):
+    """Axes.boxplot, with vectorized statistics
+
+    Parameters
+    ----------
+    ax : Axes
+    x : array-like, list of QuantileSketch, or list of dict
+        data (see boxplot_stats), or precomputed stats, drawn as is
+    groups : array-like, optional
+        the group label of each value of *x*, which label the boxes
+    others
+        see Axes.boxplot
+
+    Returns
+    -------
+    artists : dict
+    """
+    if _is_stats(x):
+        bxpstats = [dict(s) for s in x]
+    else:
+        bxpstats = boxplot_stats(
+            x,
+            whis=rcParams["boxplot.whiskers"] if whis is None else whis,
+            bootstrap=(
+                rcParams["boxplot.bootstrap"]
+                if bootstrap is None
+                else bootstrap
+            ),
+            labels=labels,
+            autorange=autorange,
+            groups=groups,
+        )
+
+    if usermedians is not None:
+        if (
+            len(np.ravel(usermedians)) != len(bxpstats)
+            or np.shape(usermedians)[0] != len(bxpstats)
+        ):
+            raise ValueError("usermedians length not compatible with x")
+        for stats, med in zip(bxpstats, usermedians):
+            if med is not None:
+                stats["med"] = med
+
+    if conf_intervals is not None:
+        if np.shape(conf_intervals)[0] != len(bxpstats):
+            raise ValueError("conf_intervals length not compatible with x")
+        for stats, ci in zip(bxpstats, conf_intervals):
+            if ci is None:
+                continue
+            if len(ci) != 2:
+                raise ValueError(
+                    "each confidence interval must have two values"
+                )
+            if ci[0] is not None:
+                stats["cilo"] = ci[0]
+            if ci[1] is not None:
+                stats["cihi"] = ci[1]
+
+    kw = _bxp_kwargs(
+        notch,
+        sym,
+        vert,
+        patch_artist,
+        meanline,
+        showmeans,
+        showcaps,
+        showbox,
+        showfliers,
+        boxprops,
+        flierprops,
+        **kw,
+    )
+
+    return ax.bxp(bxpstats, **kw)
+
+
+# /def
+
+
+def violinplot(ax, dataset, points=100, bw_method=None, groups=None, **kw):
+    """Axes.violinplot, with vectorized statistics
+
+    Parameters
+    ----------
+    ax : Axes
+    dataset : array-like, list of QuantileSketch, or list of dict
+        data (see violin_stats), or precomputed stats, drawn as is
+    points : int
+    bw_method : str, scalar, callable, optional
+    groups : array-like, optional
+        the group label of each value of *dataset*
+    kw
+        for Axes.violin
+
+    Returns
+    -------
+    artists : dict
+    """
+    if _is_stats(dataset):
+        vpstats = dataset
+    else:
+        vpstats = violin_stats(
+            dataset, points=points, bw_method=bw_method, groups=groups
+        )
+
+    return ax.violin(vpstats, **kw)
+
+
+# /def
+
+##############################################################################
+# END
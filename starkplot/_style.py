@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _style
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""compiled stylesheets
+
+A stylesheet is compiled once into a validated dict of rcParams, cached
+by name or path and invalidated when the file's mtime changes.
+style_context applies only the keys which differ from the current
+rcParams, and restores only those, instead of resolving the style and
+snapshotting all of rcParams on every call.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = ["compile_style", "style_context", "clear_style_cache"]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import os
+import warnings
+from contextlib import contextmanager
+from warnings import warn
+
+# matplotlib
+import matplotlib as mpl
+from matplotlib import rcParams, rcParamsDefault
+from matplotlib.style.core import library
+
+try:  # the rcParams which aren't set by styles
+    from matplotlib.style.core import STYLE_BLACKLIST
+except ImportError:  # private, so may be moved
+    STYLE_BLACKLIST = {
+        "interactive",
+        "backend",
+        "backend.qt4",
+        "webagg.port",
+        "webagg.address",
+        "webagg.port_retries",
+        "webagg.open_in_browser",
+        "backend_fallback",
+        "toolbar",
+        "timezone",
+        "datapath",
+        "figure.max_open_warning",
+        "figure.raise_window",
+        "savefig.directory",
+        "tk.window_focus",
+        "docstring.hardcopy",
+    }
+
+
+##############################################################################
+### Info
+
+_style_alias = {"mpl20": "default", "mpl15": "classic"}
+
+# compiled styles {key: (stamp, rc)}
+_style_cache = {}
+
+
+##############################################################################
+### Compiling
+
+
+def _validated(rc, warn_blacklist=True):
+    """a plain dict of the validated rcParams, without blacklisted keys"""
+    if not isinstance(rc, mpl.RcParams):
+        rc = mpl.RcParams(rc)  # validates
+
+    out = {}
+    with warnings.catch_warnings():  # of deprecated rcParams
+        warnings.simplefilter("ignore", mpl.MatplotlibDeprecationWarning)
+        for key, value in rc.items():
+            if key in STYLE_BLACKLIST:
+                if warn_blacklist:
+                    warn(
+                        f"Style includes a parameter, {key!r}, that is not "
+                        "related to style. Ignoring"
+                    )
+                continue
+            out[key] = value
+
+    return out
+
+
+# /def
+
+
+def _compile_one(style):
+    """the compiled rc of a single style (str or dict)"""
+    if not isinstance(style, str):  # dicts are not cached
+        return _validated(style)
+
+    style = _style_alias.get(style, style)
+
+    # key, stamp and source of the style
+    if style == "default":
+        key, stamp = ("default",), None
+        load = lambda: _validated(rcParamsDefault, warn_blacklist=False)
+    elif style in library:
+        src = library[style]  # replaced on style.reload_library()
+        key, stamp = ("library", style), id(src)
+        load = lambda: _validated(src)
+    else:
+        path = os.path.abspath(os.path.expanduser(style))
+        try:
+            stamp = os.stat(path).st_mtime_ns
+        except OSError:  # a URL, or missing
+            stamp = None
+            path = style
+        key = ("file", path)
+
+        def load():
+            try:
+                rc = mpl.rc_params_from_file(
+                    path, use_default_template=False
+                )
+            except IOError:
+                raise IOError(
+                    f"{style!r} not found in the style library and input "
+                    "is not a valid URL or path; see `style.available` "
+                    "for list of available styles"
+                )
+            return _validated(rc)
+
+    entry = _style_cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+
+    rc = load()
+    _style_cache[key] = (stamp, rc)
+
+    return rc
+
+
+# /def
+
+
+def compile_style(style):
+    """compile a stylesheet into a dict of validated rcParams
+
+    Parameters
+    ----------
+    style : str, dict, or list
+        as for pyplot.style.use
+        str: a style name, 'default', or a path / URL to a style file
+
+    Returns
+    -------
+    rc : dict
+        do not modify, it may be the cached dict
+    """
+    if isinstance(style, str) or hasattr(style, "keys"):
+        return _compile_one(style)
+
+    rc = {}
+    for s in style:
+        rc.update(_compile_one(s))
+
+    return rc
+
+
+# /def
+
+
+def clear_style_cache():
+    """clear the compiled stylesheets"""
+    _style_cache.clear()
+
+
+# /def
+
+
+##############################################################################
+### Context
+
+
+def _differs(a, b):
+    if a is b:
+        return False
+    try:
+        return bool(a != b)
+    except Exception:  # ex: ambiguous array comparison
+        return True
+
+
+# /def
+
+
+@contextmanager
+def style_context(style):
+    """temporarily use a stylesheet, see compile_style
+
+    Only the rcParams which the stylesheet changes are set, and only
+    those are restored on exit.
+    """
+    rc = compile_style(style)
+
+    getitem = dict.__getitem__  # skip deprecation handling
+    old = {}
+    for key, value in rc.items():
+        current = getitem(rcParams, key)
+        if _differs(current, value):
+            old[key] = current
+
+    # values are already validated
+    dict.update(rcParams, {key: rc[key] for key in old})
+    try:
+        yield
+    finally:
+        dict.update(rcParams, old)
+
+
+# /def
+
+##############################################################################
+# END
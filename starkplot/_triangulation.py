@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _triangulation
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""content-hashed Triangulation cache
+
+tricontour, tricontourf, tripcolor and triplot each build a Triangulation
+from x, y, running a Delaunay triangulation every call, even when many
+fields are plotted on one mesh. Instead, Triangulations are cached by a
+hash of the contents of x, y (and triangles, mask), in an LRU. Hashing
+is far cheaper than triangulating, and safe if arrays change in place.
+The Delaunay triangulation of x, y is shared by all masks.
+
+Cached Triangulations are SharedTriangulations, which pickle without
+their C++ objects, so they can be pre-built, sent to worker processes,
+and registered there with register_triangulation.
+Cached Triangulations should not be modified (ex: with set_mask).
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "SharedTriangulation",
+    "triangulation",
+    "triangulation_key",
+    "register_triangulation",
+    "triangulation_from_args",
+    "clear_triangulation_cache",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+from collections import OrderedDict
+from hashlib import blake2b
+
+import numpy as np
+
+# matplotlib
+from matplotlib.tri import Triangulation
+
+
+##############################################################################
+### Info
+
+# number of cached Triangulations
+_triangulation_cache_size = 32
+
+# {key: SharedTriangulation}, least recently used first
+_triangulation_cache = OrderedDict()
+
+
+##############################################################################
+### Triangulation
+
+
+class SharedTriangulation(Triangulation):
+    """a Triangulation which can be pickled after it has been used
+
+    the C++ triangulation & TriFinder are dropped, and remade when needed
+    """
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_cpp_triangulation"] = None
+        state["_trifinder"] = None
+        return state
+
+    # /def
+
+    @classmethod
+    def from_triangulation(cls, tri, mask=None):
+        """a SharedTriangulation of the triangles of another, new mask
+
+        the x, y & triangles arrays are shared, not copied or re-checked
+        """
+        new = cls.__new__(cls)
+        new.__dict__.update(tri.__dict__)
+        new._cpp_triangulation = None
+        new._trifinder = None
+        new._edges = None
+
+        # as in Triangulation.__init__, which keeps the Delaunay neighbors
+        new.mask = None
+        if mask is not None:
+            new.mask = np.asarray(mask, dtype=bool)
+            if new.mask.shape != (new.triangles.shape[0],):
+                raise ValueError(
+                    "mask array must have same length as triangles array"
+                )
+
+        return new
+
+    # /def
+
+
+# /class
+
+
+##############################################################################
+### Keys
+
+
+def _digest(arr):
+    """the content digest of an array, None for None"""
+    if arr is None:
+        return None
+    arr = np.ascontiguousarray(arr)
+    h = blake2b(digest_size=16)
+    h.update(str((arr.dtype.str, arr.shape)).encode())
+    h.update(arr.view(np.uint8).ravel() if arr.size else b"")
+    return h.hexdigest()
+
+
+# /def
+
+
+def triangulation_key(x, y, triangles=None, mask=None):
+    """the content key of a triangulation of x, y (& triangles, mask)
+
+    Parameters
+    ----------
+    x, y : array-like
+    triangles : array-like, optional
+        integer (ntri, 3)
+    mask : array-like, optional
+        bool (ntri,)
+
+    Returns
+    -------
+    key : tuple of str
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if triangles is not None:
+        triangles = np.asarray(triangles, dtype=np.int32)
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+    return (_digest(x), _digest(y), _digest(triangles), _digest(mask))
+
+
+# /def
+
+
+def _store(key, tri):
+    _triangulation_cache[key] = tri
+    _triangulation_cache.move_to_end(key)
+    while len(_triangulation_cache) > _triangulation_cache_size:
+        _triangulation_cache.popitem(last=False)
+
+
+# /def
+
+
+##############################################################################
+### Functions
+
+
+def triangulation(x, y, triangles=None, mask=None, cache=True):
+    """the (cached) Triangulation of x, y
+
+    Parameters
+    ----------
+    x, y : array-like
+        equal-length 1D
+    triangles : array-like, optional
+        integer (ntri, 3). If None, the Delaunay triangulation is used
+    mask : array-like, optional
+        bool (ntri,)
+    cache : bool
+        whether to look up & store the Triangulation
+
+    Returns
+    -------
+    tri : SharedTriangulation
+    """
+    if not cache:
+        return SharedTriangulation(x, y, triangles, mask)
+
+    key = triangulation_key(x, y, triangles, mask)
+    tri = _triangulation_cache.get(key)
+    if tri is not None:
+        _triangulation_cache.move_to_end(key)
+        return tri
+
+    if key[3] is None:
+        tri = SharedTriangulation(x, y, triangles)
+    else:  # masks share the unmasked triangulation
+        tri = SharedTriangulation.from_triangulation(
+            triangulation(x, y, triangles), mask
+        )
+
+    _store(key, tri)
+
+    return tri
+
+
+# /def
+
+
+def register_triangulation(tri):
+    """add a pre-built Triangulation to the cache
+
+    ex: one built in another process, and pickled. It is used for plots
+    of the same x, y (and mask). If it is Delaunay, also for plots
+    of x, y without triangles, else for plots with the same triangles.
+
+    Parameters
+    ----------
+    tri : Triangulation
+
+    Returns
+    -------
+    tri : SharedTriangulation
+        *tri*, or a SharedTriangulation of it
+    """
+    if not isinstance(tri, SharedTriangulation):
+        tri = SharedTriangulation.from_triangulation(tri, tri.mask)
+
+    triangles = None if tri.is_delaunay else tri.triangles
+    _store(triangulation_key(tri.x, tri.y, triangles, tri.mask), tri)
+    if tri.mask is not None:  # also the unmasked triangulation
+        key = triangulation_key(tri.x, tri.y, triangles)
+        if key not in _triangulation_cache:
+            _store(key, SharedTriangulation.from_triangulation(tri))
+
+    return tri
+
+
+# /def
+
+
+def triangulation_from_args(args, kwargs, cache=True):
+    """Triangulation.get_from_args_and_kwargs, with cached Triangulations
+
+    Parameters
+    ----------
+    args : tuple
+        ``triangulation, ...`` or ``x, y, [triangles], ...``
+    kwargs : dict
+        may contain *triangles*, *mask*
+    cache : bool
+
+    Returns
+    -------
+    tri : Triangulation
+    args : tuple
+        the remaining arguments
+    kwargs : dict
+        the remaining keyword arguments
+    """
+    if isinstance(args[0], Triangulation):
+        return args[0], tuple(args[1:]), kwargs
+
+    kwargs = dict(kwargs)
+    x, y, args = args[0], args[1], tuple(args[2:])
+
+    # same rules as matplotlib: triangles from kwargs, then args
+    triangles = kwargs.pop("triangles", None)
+    from_args = False
+    if triangles is None and args:
+        triangles = args[0]
+        from_args = True
+
+    if triangles is not None:
+        try:
+            triangles = np.asarray(triangles, dtype=np.int32)
+        except ValueError:
+            triangles = None
+
+    if triangles is not None and (
+        triangles.ndim != 2 or triangles.shape[1] != 3
+    ):
+        triangles = None
+
+    if triangles is not None and from_args:
+        args = args[1:]
+
+    mask = kwargs.pop("mask", None)
+
+    tri = triangulation(x, y, triangles, mask, cache=cache)
+
+    return tri, args, kwargs
+
+
+# /def
+
+
+def clear_triangulation_cache():
+    """clear the cached Triangulations"""
+    _triangulation_cache.clear()
+
+
+# /def
+
+##############################################################################
+# END
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _units
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""fast path for astropy Quantity inputs
+
+matplotlib's unit machinery inspects and converts Quantity arrays on
+every call, through the converter registry, and numpy operations on
+Quantities are slow. Instead, the axis unit is set up (and labeled)
+from a one-element slice, and the whole array is passed as a plain
+ndarray in the axis unit, a view when no conversion is needed.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["astropy", "matplotlib"]
+
+__all__ = ["to_axis_value", "strip_units", "strip_plot_args", "strip_args"]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from astropy.units import Quantity, UnitBase, UnitConversionError
+except ImportError:
+    _APY = False
+else:
+    _APY = True
+
+
+##############################################################################
+### Converters
+
+
+@lru_cache(maxsize=256)
+def _scale(from_unit, to_unit):
+    """the scale factor from one unit to another, None if not a scaling"""
+    try:
+        return from_unit.to(to_unit)
+    except UnitConversionError:  # ex: needs equivalencies
+        return None
+
+
+# /def
+
+
+def _is_quantity(arg):
+    return _APY and isinstance(arg, Quantity)
+
+
+# /def
+
+
+def to_axis_value(axis, q):
+    """a Quantity as an ndarray in the unit of an axis
+
+    If the axis has no units, they are set from a one-element slice of
+    *q*, which also sets the unit label (with quantity_support).
+
+    Parameters
+    ----------
+    axis : Axis
+    q : Quantity or any
+        anything else is returned unchanged
+
+    Returns
+    -------
+    value : ndarray
+        a view of *q* if it's already in the axis unit
+    """
+    if not _is_quantity(q):
+        return q
+
+    if axis.units is None:
+        axis.update_units(q.ravel()[:1])  # registers & labels the unit
+
+    unit = axis.units
+    if not isinstance(unit, UnitBase):  # not astropy-managed
+        return q
+
+    value = q.view(np.ndarray)
+    if q.unit is unit or q.unit == unit:
+        return value
+
+    scale = _scale(q.unit, unit)
+    if scale is None:
+        return q.to_value(unit)
+    return value * scale
+
+
+# /def
+
+
+def strip_units(ax, x=None, y=None):
+    """*x*, *y* as ndarrays in the units of the axes, see to_axis_value"""
+    return to_axis_value(ax.xaxis, x), to_axis_value(ax.yaxis, y)
+
+
+# /def
+
+
+def strip_plot_args(ax, args):
+    """strip the units of plot-style arguments
+
+    *args* are groups of ``[x], y, [fmt]``, as for ax.plot.
+
+    Returns
+    -------
+    args : tuple
+    """
+    if not _APY or not any(isinstance(a, Quantity) for a in args):
+        return args
+
+    out = []
+    args = list(args)
+    while args:
+        y = args.pop(0)
+        if args and not isinstance(args[0], str):
+            x, y = y, args.pop(0)
+            out.append(to_axis_value(ax.xaxis, x))
+        out.append(to_axis_value(ax.yaxis, y))
+        if args and isinstance(args[0], str):
+            out.append(args.pop(0))
+
+    return tuple(out)
+
+
+# /def
+
+
+def strip_args(ax, args, kw, names, which):
+    """strip the units of named arguments, passed positionally or by key
+
+    Parameters
+    ----------
+    ax : Axes
+    args : tuple
+    kw : dict
+    names : tuple of str
+        the names of the leading positional arguments
+    which : str
+        the axis of each name, 'x' or 'y'. ex: errorbar is
+        names=('x', 'y', 'yerr', 'xerr'), which='xyyx'
+
+    Returns
+    -------
+    args : tuple
+    kw : dict
+    """
+    if not _APY:
+        return args, kw
+
+    args = list(args)
+    for i, (name, xy) in enumerate(zip(names, which)):
+        axis = ax.xaxis if xy == "x" else ax.yaxis
+        if i < len(args):
+            args[i] = to_axis_value(axis, args[i])
+        elif name in kw:
+            kw = dict(kw)
+            kw[name] = to_axis_value(axis, kw[name])
+
+    return tuple(args), kw
+
+
+# /def
+
+##############################################################################
+# END
@@ -40,6 +40,8 @@ Planned Features
 #############################################################################
 # Imports
 
+from functools import lru_cache
+
 import numpy as np
 
 from matplotlib import pyplot
@@ -47,8 +49,17 @@ from matplotlib import pyplot as plt
 from matplotlib.figure import Figure
 
 from .decorators import docstring
+from ._quantile import (
+    QuantileSketch,
+    quantile_sketch,
+    parse_auto_limits,
+    _finite_values,
+    _chunksize,
+)
 
 from ._figure._info import _newfigk, _tightlayoutk, _savefigk, _suptitlek
+from ._figure._tight_layout import cached_tight_layout
+from ._figure._lifecycle import track_figure, touch_figure
 from ._axes._info import _titlek, _xlabelk, _ylabelk, _zlabelk
 
 # from .utils.colorbar._info import _colorbark as _cbark
@@ -156,6 +167,46 @@ def _parsestrandopts(attr):
 # /def
 
 
+@lru_cache(maxsize=1024)
+def _option_plan(keys, compatible, prefix):
+    r"""compiled option resolution for one consumer of an xkw key set
+
+    Parameters
+    ---------
+    keys: tuple
+        the sorted keys of the xkw dict
+    compatible: tuple
+        the consumer's compatible (un-prefixed) options
+    prefix: str
+        the consumer's override prefix, ex: 'title_'
+
+    Returns
+    -------
+    plan: tuple
+        (xkw key, option key) pairs in update order: compatible options
+        first, then the prefixed overrides, which take precedence.
+        Memoized, so an xkw key set is only scanned once per consumer.
+    """
+    plan = [(k, k) for k in compatible if k in keys]
+    plan.extend(
+        (k, _stripprefix(k, prefix)) for k in keys if k.startswith(prefix)
+    )
+    return tuple(plan)
+
+
+# /def
+
+
+def _resolve_options(kw, compatible, prefix):
+    r"""resolve a consumer's options from kw using the compiled plan
+    """
+    plan = _option_plan(tuple(sorted(kw)), tuple(compatible), prefix)
+    return {opt: kw[k] for k, opt in plan}
+
+
+# /def
+
+
 def _parsexkwandopts(
     arg, kw, name, compatible, parser, prefix=None, allowupdate=True
 ):
@@ -204,18 +255,10 @@ def _parsexkwandopts(
             update = False
 
         if not argkw1 or update:  # still no kwargs
-            # start with any compatible options in kw
-            argkw2 = {k: kw.get(k) for k in compatible if k in kw}
-            # overwrite with any specific options
+            # compatible options in kw, overwritten by any specific options
             if prefix is None:
                 prefix = name + "_"
-            argkw2.update(
-                {
-                    _stripprefix(k, prefix): v
-                    for k, v in kw.items()
-                    if k.startswith(prefix)
-                }
-            )
+            argkw2 = _resolve_options(kw, compatible, prefix)
     # updating & maintaining priority
     argkw = argkw2
     argkw.update(argkw1)
@@ -254,6 +297,7 @@ def _prepare_figure(fig=None, rtcf=True, figsize=None, **kw):
         plt.figure(fig.number)  # makes figure current
 
         fig = plt.gcf()
+        touch_figure(fig)
 
     elif isinstance(fig, (int, np.integer)):
         if rtcf in (True, None):  # preserve oldfig
@@ -261,10 +305,16 @@ def _prepare_figure(fig=None, rtcf=True, figsize=None, **kw):
         plt.figure(fig)  # makes figure current
 
         fig = plt.gcf()
+        touch_figure(fig)
 
     # get current figure
     elif fig is None:
+        made = not plt.get_fignums()
         fig = plt.gcf()
+        if made:
+            track_figure(fig)
+        else:
+            touch_figure(fig)
 
     # make new figure
     elif fig == "new":
@@ -273,16 +323,10 @@ def _prepare_figure(fig=None, rtcf=True, figsize=None, **kw):
         # figure kwargs if included
         nfkw = kw.get("fig", {})
         if not nfkw:
-            nfkw = {k: kw.get(k) for k in _newfigk if k in kw}
-            nfkw.update(
-                {
-                    _stripprefix(k, "fig_"): v
-                    for k, v in kw.items()
-                    if k.startswith("fig_")
-                }
-            )
+            nfkw = _resolve_options(kw, _newfigk, "fig_")
         # making the figure
         fig = plt.figure(figsize=figsize, **nfkw)
+        track_figure(fig)
 
     # not yet covered
     else:
@@ -295,7 +339,9 @@ def _prepare_figure(fig=None, rtcf=True, figsize=None, **kw):
 
 
 def tightLayout(fig=None, tlkw={}, **kw):
-    r"""
+    r"""tight_layout, reusing the solutions of identically structured figures
+
+    see cached_tight_layout
     """
     fig = _gcf(fig)
 
@@ -303,7 +349,7 @@ def tightLayout(fig=None, tlkw={}, **kw):
         tlkw, kw, "tight_layout", _tightlayoutk, _parseoptsdict
     )
 
-    fig.tight_layout(**tlkw)
+    cached_tight_layout(fig=fig, **tlkw)
 
 
 # /def
@@ -587,6 +633,97 @@ def axisLabels(ax=None, x=None, y=None, z=None, units=True, **kw):
 # Axis Limits
 
 
+def _axis_data(ax, axis):
+    r"""the plotted data along an axis, as (array, column) pairs
+
+    Parameters
+    ---------
+    ax: axes
+    axis: str
+        'x', 'y', or 'z'
+    """
+    i = "xyz".index(axis)
+
+    for line in ax.lines:
+        if axis == "z":
+            verts = getattr(line, "_verts3d", None)
+            if verts is not None:
+                yield np.asarray(verts[2]), None
+        elif axis == "x":
+            yield line.get_xdata(orig=True), None
+        else:
+            yield line.get_ydata(orig=True), None
+
+    for coll in ax.collections:
+        if axis == "z":
+            offsets = getattr(coll, "_offsets3d", None)
+            if offsets is not None:
+                yield np.asarray(offsets[2]), None
+        elif coll.get_offset_transform() is ax.transData:  # ex: scatter
+            yield coll.get_offsets(), i
+        elif coll.get_transform() is ax.transData:  # ex: LineCollection
+            verts = [p.vertices[:, i] for p in coll.get_paths()]
+            if verts:
+                yield np.concatenate(verts), None
+
+
+# /def
+
+
+def _auto_limits(ax, lim, axis):
+    r"""robust limits from the data plotted along an axis
+
+    Parameters
+    ---------
+    ax: axes
+    lim: str
+        'auto', 'auto:P', or 'auto:lo:hi', see parse_auto_limits
+        percentiles are exact for small in-memory data, else estimated
+        with a streaming QuantileSketch, which is cached per plotted array
+    axis: str
+        'x', 'y', or 'z'
+
+    Returns
+    -------
+    lim: tuple or None
+        None if nothing is plotted along the axis
+    """
+    percentile = parse_auto_limits(lim)
+
+    arrs = [
+        (np.ma.getdata(arr), column)
+        for arr, column in _axis_data(ax, axis)
+        if column is None or np.ndim(arr) == 2
+    ]
+
+    small = [_finite_values(arr, column) for arr, column in arrs]
+    if all(v is not None for v in small) and (
+        sum(v.size for v in small) < _chunksize
+    ):  # exact
+        values = np.concatenate(small) if small else np.empty(0)
+        if values.size == 0:
+            return None
+        lo, hi = np.percentile(values, percentile)
+
+    else:
+        sketch = QuantileSketch()
+        for arr, column in arrs:
+            sketch.merge(quantile_sketch(arr, column=column))
+        if sketch.n == 0:
+            return None
+        lo, hi = sketch.percentile(percentile)
+
+    # maintain axis orientation
+    old = getattr(ax, f"get_{axis}lim")()
+    if old[0] > old[1]:
+        lo, hi = hi, lo
+
+    return lo, hi
+
+
+# /def
+
+
 @docstring.Appender(
     pyplot.Axes.set_xlim.__doc__,
     join="\n\n{}\n".format("=" * 78),
@@ -594,11 +731,26 @@ def axisLabels(ax=None, x=None, y=None, z=None, units=True, **kw):
 )
 def set_xlim(ax=None, x=None):
     r"""starkplot wrapper for set_xlim
+
+    Parameters
+    ---------
+    ax: axis, None
+    x: tuple, str, None
+        tuple: arguments for ax.set_xlim
+        str: robust percentile limits of the plotted data,
+            'auto:P' (the central P percent) or 'auto:lo:hi'
+        None: does nothing
     """
     if x is None:
         return
 
     ax = ax if ax is not None else pyplot.gca()
+
+    if isinstance(x, str):  # percentile limits
+        x = _auto_limits(ax, x, "x")
+        if x is None:
+            return
+
     return ax.set_xlim(*x)
 
 
@@ -612,11 +764,26 @@ def set_xlim(ax=None, x=None):
 )
 def set_ylim(ax=None, y=None):
     r"""starkplot wrapper for set_ylim
+
+    Parameters
+    ---------
+    ax: axis, None
+    y: tuple, str, None
+        tuple: arguments for ax.set_ylim
+        str: robust percentile limits of the plotted data,
+            'auto:P' (the central P percent) or 'auto:lo:hi'
+        None: does nothing
     """
     if y is None:
         return
 
     ax = ax if ax is not None else pyplot.gca()
+
+    if isinstance(y, str):  # percentile limits
+        y = _auto_limits(ax, y, "y")
+        if y is None:
+            return
+
     return ax.set_ylim(*y)
 
 
@@ -627,15 +794,31 @@ def set_ylim(ax=None, y=None):
 #                     join='\n\n{}\n'.format('=' * 78), prededent=True)
 def set_zlim(ax=None, z=None):
     r"""starkplot wrapper for set_zlim
+
+    Parameters
+    ---------
+    ax: axis, None
+    z: tuple, str, None
+        tuple: arguments for ax.set_zlim
+        str: robust percentile limits of the plotted data,
+            'auto:P' (the central P percent) or 'auto:lo:hi'
+        None: does nothing
     """
     if z is None:
         return
 
     ax = ax if ax is not None else pyplot.gca()
     try:
-        return ax.set_zlim(*z)
+        ax.get_zlim()
     except AttributeError:
-        pass
+        return
+
+    if isinstance(z, str):  # percentile limits
+        z = _auto_limits(ax, z, "z")
+        if z is None:
+            return
+
+    return ax.set_zlim(*z)
 
 
 # /def
@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : _vectorfield
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""display-aware subsampling of dense vector fields
+
+quiver & barbs draw a polygon per vector, and streamplot interpolates on
+the full grid, so full-resolution simulation grids make millions of
+patches that can't be seen. Instead, the grid strides are picked so
+arrows are spaced a fixed number of points apart on the axes, and
+vectors are either taken every stride or average-pooled over each
+stride block. For streamplot, the grid is pooled to the axes' pixel
+resolution and the seed density is capped so streamlines are spaced at
+least a few points apart.
+
+The strides are those of the axes when plotted, with the field's extent
+autoscaled.
+"""
+
+__author__ = "Nathaniel Starkman"
+__credits__ = ["matplotlib"]
+
+__all__ = [
+    "display_strides",
+    "pool_blocks",
+    "subsample_field",
+    "subsample_stream",
+    "use_subsample",
+]
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import math
+
+import numpy as np
+
+
+##############################################################################
+### Info
+
+# the spacing of arrows & barbs on the axes, in points
+_spacing = {"quiver": 15.0, "barbs": 25.0}
+
+# the smallest spacing of streamlines, in points
+_stream_spacing = 4.0
+
+# streamplot's seed grid is 30 x density cells across the field
+_stream_cells = 30
+
+# fields with at least this many vectors are subsampled by default
+_subsample_threshold = 128 ** 2
+
+
+##############################################################################
+### Grid
+
+
+def use_subsample(U, subsample=None):
+    """whether to subsample the vector field U
+
+    Parameters
+    ----------
+    U : array-like
+    subsample : bool, int, (int, int), None
+        None: for 2D fields of many vectors
+    """
+    if subsample is None:
+        return np.ndim(U) == 2 and np.size(U) >= _subsample_threshold
+    return subsample is not False and np.ndim(U) == 2
+
+
+# /def
+
+
+def _autoscale_to(ax, extent):
+    """autoscale the axes to include an extent, and its size in pixels"""
+    x0, x1, y0, y1 = extent
+    ax.update_datalim([(x0, y0), (x1, y1)])
+    ax.autoscale_view()
+
+    (px0, py0), (px1, py1) = ax.transData.transform([(x0, y0), (x1, y1)])
+    return abs(px1 - px0), abs(py1 - py0)
+
+
+# /def
+
+
+def display_strides(ax, extent, shape, spacing):
+    """the (row, column) strides of a grid, for a spacing on the axes
+
+    the field's extent is added to the axes' data limits, which are
+    then autoscaled, so the strides are those of the final view
+
+    Parameters
+    ----------
+    ax : Axes
+    extent : (x0, x1, y0, y1)
+    shape : (nrows, ncols)
+    spacing : float
+        in points
+
+    Returns
+    -------
+    strides : (int, int)
+    """
+    width, height = _autoscale_to(ax, extent)
+    spacing = spacing * ax.figure.dpi / 72.0
+    nrows, ncols = shape
+
+    def stride(n, pixels):
+        if not np.isfinite(pixels) or n < 2:
+            return 1
+        return max(1, int(math.ceil(n * spacing / max(abs(pixels), 1))))
+
+    return stride(nrows, height), stride(ncols, width)
+
+
+# /def
+
+
+def pool_blocks(arr, strides, trim=False):
+    """the means of the (row, column) stride blocks of a 2D array
+
+    NaN & masked values are ignored. Blocks without values are masked.
+
+    Parameters
+    ----------
+    arr : array-like
+        2D
+    strides : (int, int)
+    trim : bool
+        whether to drop partial blocks at the ends, else they're averaged
+
+    Returns
+    -------
+    pooled : MaskedArray
+    """
+    sy, sx = strides
+    arr = np.ma.filled(np.ma.asarray(arr, dtype=float), np.nan)
+    ny, nx = arr.shape
+    if trim:
+        ny, nx = max(ny // sy, 1) * sy, max(nx // sx, 1) * sx
+        arr = arr[:ny, :nx]
+    else:
+        pad = ((0, -ny % sy), (0, -nx % sx))
+        arr = np.pad(arr, pad, mode="constant", constant_values=np.nan)
+
+    blocks = arr.reshape(arr.shape[0] // sy, sy, arr.shape[1] // sx, sx)
+    finite = np.isfinite(blocks)
+    count = finite.sum(axis=(1, 3))
+    total = np.where(finite, blocks, 0).sum(axis=(1, 3))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.ma.masked_invalid(total / count)
+
+
+# /def
+
+
+def _take(arr, strides):
+    """every stride-th value of a 2D array, from the middle of the first
+    stride block
+    """
+    sy, sx = strides
+    return arr[sy // 2 :: sy, sx // 2 :: sx]
+
+
+# /def
+
+
+def _resample(arr, strides, mean, trim=False):
+    if arr is None or np.ndim(arr) != 2:
+        return arr
+    return pool_blocks(arr, strides, trim) if mean else _take(arr, strides)
+
+
+# /def
+
+
+def _strides(ax, extent, shape, subsample, spacing):
+    if subsample is True or subsample is None:
+        return display_strides(ax, extent, shape, spacing)
+    return tuple(int(s) for s in np.broadcast_to(subsample, 2))
+
+
+# /def
+
+
+##############################################################################
+### Fields
+
+
+def subsample_field(
+    ax, args, subsample=None, pool=False, kind="quiver", spacing=None
+):
+    """subsample the arguments of quiver or barbs
+
+    Parameters
+    ----------
+    ax : Axes
+    args : tuple
+        ``[X, Y], U, V, [C]``, as for quiver, with U & V 2D
+    subsample : bool, int, (int, int), None
+        True or None: strides for the spacing on the axes.
+        or the (row, column) strides
+    pool : bool
+        whether to average-pool the vectors over the stride blocks,
+        rather than take every stride-th vector
+    kind : str
+        'quiver' or 'barbs', for the default spacing
+    spacing : float, optional
+        the spacing of the vectors on the axes, in points
+
+    Returns
+    -------
+    args : tuple
+        ``X, Y, U, V, [C]``
+    """
+    args = list(args)
+    C = args.pop(-1) if len(args) in (3, 5) else None
+    U, V = np.ma.asarray(args[-2]), np.ma.asarray(args[-1])
+    ny, nx = U.shape
+
+    if len(args) == 4:
+        X, Y = np.asarray(args[0]), np.asarray(args[1])
+        if X.ndim == 1 and Y.ndim == 1 and (len(X), len(Y)) == (nx, ny):
+            X, Y = np.meshgrid(X, Y)
+    else:
+        X, Y = np.meshgrid(np.arange(nx), np.arange(ny))
+    X, Y = np.reshape(X, (ny, nx)), np.reshape(Y, (ny, nx))
+
+    if spacing is None:
+        spacing = _spacing.get(kind, _spacing["quiver"])
+    extent = (np.nanmin(X), np.nanmax(X), np.nanmin(Y), np.nanmax(Y))
+    strides = _strides(ax, extent, (ny, nx), subsample, spacing)
+
+    out = [_resample(a, strides, pool) for a in (X, Y, U, V)]
+    if C is not None:
+        C = np.ma.asarray(C)
+        out.append(_resample(C.reshape(ny, nx), strides, pool))
+
+    return tuple(out)
+
+
+# /def
+
+
+def subsample_stream(
+    ax, x, y, u, v, density=1, linewidth=None, color=None, subsample=None
+):
+    """pool a streamplot grid & cap its seed density
+
+    Parameters
+    ----------
+    ax : Axes
+    x, y : array-like
+        evenly spaced, 1D or 2D
+    u, v : array-like
+        (ny, nx)
+    density : float or (float, float)
+    linewidth, color : array-like, optional
+        (ny, nx) arrays are pooled with u, v
+    subsample : bool, int, (int, int), None
+        True or None: pool to the axes' pixel resolution.
+        or the (row, column) strides
+
+    Returns
+    -------
+    kwargs : dict
+        x, y, u, v, density, linewidth, color
+    """
+    x = np.asarray(x)[0, :] if np.ndim(x) == 2 else np.asarray(x)
+    y = np.asarray(y)[:, 0] if np.ndim(y) == 2 else np.asarray(y)
+    ny, nx = np.shape(u)
+
+    extent = (x[0], x[-1], y[0], y[-1])
+    pixels = np.array(_autoscale_to(ax, extent))
+    pixel = 72.0 / ax.figure.dpi  # in points
+    sy, sx = _strides(ax, extent, (ny, nx), subsample, pixel)
+    sy, sx = min(sy, max(ny // 2, 1)), min(sx, max(nx // 2, 1))
+
+    # whole blocks, so the pooled grid stays evenly spaced
+
+    def centers(a, s):
+        n = max(len(a) // s, 1) * s
+        return a[:n].reshape(-1, s).mean(axis=1)
+
+    kw = dict(
+        x=centers(x, sx),
+        y=centers(y, sy),
+        u=_resample(u, (sy, sx), True, trim=True),
+        v=_resample(v, (sy, sx), True, trim=True),
+    )
+    for name, arr in (("linewidth", linewidth), ("color", color)):
+        if np.ndim(arr) == 2 and np.shape(arr) == (ny, nx):
+            arr = _resample(arr, (sy, sx), True, trim=True)
+        kw[name] = arr
+
+    # the seed grid, capped to a streamline every few points
+    spacing = _stream_spacing / pixel
+    cap = np.maximum(pixels / (spacing * _stream_cells), 1.0 / _stream_cells)
+    density = np.minimum(np.broadcast_to(density, 2), cap)
+    kw["density"] = float(density[0]) if density[0] == density[1] else density
+
+    return kw
+
+
+# /def
+
+##############################################################################
+# END
@@ -29,6 +29,7 @@ __credits__ = ["astropy, matplotlib"]
 ## General
 import numpy as np
 import types
+from contextlib import ExitStack
 from warnings import warn
 
 # plotting
@@ -58,11 +59,11 @@ from .._util import (
     _ylabelk,
     _zlabelk,
     _cbark,
-    _stripprefix,
     _latexstr,
     _parseoptsdict,
     _parselatexstrandopts,
     _parsestrandopts,
+    _resolve_options,
 )
 
 from .._util import _prepare_figure, tightLayout, prepare_axes, set_title
@@ -72,9 +73,18 @@ from .._figure import (
     set_suptitle,
     override_figure,
     save_figure,
+    rasterize_heavy,
+    shared_colorbar,
     _suptitlek,
 )
 
+from .._quantile import robust_limits, parse_auto_limits
+from .._style import style_context
+from .._preclip import clip_window
+from .._graph import current_graph
+from .._instrument import instrument_call
+from .._axes._legend import register_legend_handles
+
 ###############################################################################
 # Full Decorator
 
@@ -116,6 +126,7 @@ savefig: None, str, (str, dict)
     default: {savefig}
     None: does not save
     str: fname
+    MultipagePDF: appends the figure as a page, see MultipagePDF
     dict: savefig kwargs. If no dict, draws from xkw.
     prefers xkw['savefig'] else tries from xkw:
         (override key prefix: 'savefig_')
@@ -126,6 +137,14 @@ savefig: None, str, (str, dict)
 closefig: bool
     whether to close figure after plotting
     default: {closefig}
+rasterize_above: None, bool, int
+    default: {rasterize_above}
+    None: the global policy, see set_rasterize_policy
+    False: no artists are rasterized
+    True: the policy's threshold, or 10000 if the policy is off
+    int: artists with more elements (points, paths, cells) are rasterized,
+        so vector outputs embed them as images. text & axes stay vector.
+        vector files are saved at the policy's dpi, unless given
 suptitle: None, str, (str, dict)
     default: {suptitle}
     None: does not assign
@@ -143,6 +162,7 @@ tight_layout: dict, bool
     dict: tight_layout is kwargs for fig.tight_layout()
     True: call tight_layout with options from xkw
     False, empty dict: do not call tight_layout
+    solutions are cached by layout, see cached_tight_layout
     prefers xkw['tight_layout'] else tries from xkw:
         (override key prefix: 'tight_layout_')
         'pad', 'h_pad', 'w_pad', 'rect'
@@ -184,15 +204,26 @@ zlabel: None, str, (str, dict)
 unit_labels: bool
     whether to use auto labels from astropy.quantity_support()
     default: {unit_labels}
-xlim: (lim1, lim2) or (lim1, lim2, emit, auto)
+xlim: (lim1, lim2) or (lim1, lim2, emit, auto) or str
     default: {xlim}
     can ignore all by (None, None, True, False)
-ylim:(lim1, lim2) or (lim1, lim2, emit, auto)
+    str: robust percentile limits of the plotted data,
+        'auto', 'auto:P' (central P%), or 'auto:lo:hi'
+ylim:(lim1, lim2) or (lim1, lim2, emit, auto) or str
     default: {ylim}
     can ignore all by (None, None, True, False)
-zlim: (lim1, lim2) or (lim1, lim2, emit, auto)
+    str: robust percentile limits of the plotted data,
+        'auto', 'auto:P' (central P%), or 'auto:lo:hi'
+zlim: (lim1, lim2) or (lim1, lim2, emit, auto) or str
     default: {zlim}
     can ignore all by (None, None, True, False)
+    str: robust percentile limits of the plotted data,
+        'auto', 'auto:P' (central P%), or 'auto:lo:hi'
+preclip: bool
+    default: {preclip}
+    whether to clip the data of plot, scatter & errorbar to xlim & ylim
+    before plotting. lines keep one point past each limit.
+    not str limits
 xscale: None, str, (str, dict)
     default: {xscale}
     None: no xscale
@@ -217,6 +248,8 @@ aspect: str
 legend: dict
     kwargs for ax.legend()
     default: {legend}
+    the legend is built when the figure is drawn, from the handles
+    registered by each call, see register_legend_handles
 
 colorbar: dict, bool
     default: {colorbar}
@@ -229,16 +262,24 @@ colorbar: dict, bool
 clabel: str, None
     colorbar label
     default: {clabel}
-clim: tuple, none
+clim: tuple, str, none
     colorbar limits
     default: {clim}
     does nothing if None
-cloc: str, None, mpl.axes.Axes
+    str: robust percentile limits of the mappable's data,
+        'auto', 'auto:P' (central P%), or 'auto:lo:hi'
+cloc: str, None, mpl.axes.Axes, list of Axes
     default: {cloc}
-    None: uses pyplot.colorbar(ax=)
+    None: uses pyplot.colorbar(ax=), with all the axes of a cgroup
     'in': uses pyplot.colorbar(cax=)
     'out': uses pyplot.colorbar(ax=)
-    Axes: uses pyplot.colorbar(ax=)
+    Axes, list of Axes: uses pyplot.colorbar(ax=)
+cgroup: None, hashable
+    default: {cgroup}
+    None: each call makes its own colorbar
+    hashable: the figure's colorbar group. all calls in a group share one
+        normalization, with limits accumulated over the group's data,
+        and one colorbar, made & configured on the group's first call
 """
 
 # description of xkwargs
@@ -305,6 +346,7 @@ _mplattrs = (
     "overridefig",
     "savefig",
     "closefig",
+    "rasterize_above",
     "suptitle",
     # style
     "stylesheet",
@@ -319,6 +361,7 @@ _mplattrs = (
     "xlim",
     "ylim",
     "zlim",
+    "preclip",
     "invert_axis",
     "xscale",
     "yscale",
@@ -330,6 +373,7 @@ _mplattrs = (
     "clabel",
     "clim",
     "cloc",
+    "cgroup",
     # sidehist arguments
     "sidehists",
     "shtype",
@@ -361,6 +405,17 @@ _mplattrs = (
     "xkw",
 )
 
+# the local variables of wrapped calls which aren't decorator options
+_notoptions = (
+    "self",
+    "wrapped",
+    "wrapped_function",
+    "instrumented",
+    "func_args",
+    "func_kwargs",
+    "graph",
+)
+
 
 class MatplotlibDecorator(object):
     """MatplotlibDecorator
@@ -374,19 +429,20 @@ class MatplotlibDecorator(object):
             fig={fig}, rtcf={rtcf},
             figsize={figsize}, overridefig={overridefig},
             suptitle={suptitle},
-            savefig={savefig},
+            savefig={savefig}, rasterize_above={rasterize_above},
             # ax
             ax={ax},
             title={title},
             xlabel={xlabel}, ylabel={ylabel}, zlabel={zlabel},
             unit_labels={unit_labels},
-            xlim={xlim}, ylim={ylim}, zlim={zlim},
+            xlim={xlim}, ylim={ylim}, zlim={zlim}, preclip={preclip},
             invert_axis={invert_axis},
             xscale={xscale}, yscale={yscale}, zscale={zscale},
             aspect={aspect},
             legend={legend},
             # colorbar arguments
             colorbar={colorbar}, clabel={clabel}, clim={clim}, cloc={cloc},
+            cgroup={cgroup},
             # sidehist arguments
             sidehists={sidehists}, shtype={shtype},
             shbins={shbins}, shcolor={shcolor}, shfc={shfc}, shec={shec},
@@ -437,6 +493,7 @@ class MatplotlibDecorator(object):
         default: {savefig}
         None: does not save
         str: fname
+        MultipagePDF: appends the figure as a page, see MultipagePDF
         dict: savefig kwargs. If no dict, draws from xkw.
         prefers xkw['savefig'] else tries from xkw:
             (override key prefix: 'savefig_')
@@ -447,6 +504,15 @@ class MatplotlibDecorator(object):
     closefig: bool
         whether to close figure after plotting
         default: {closefig}
+    rasterize_above: None, bool, int
+        default: {rasterize_above}
+        None: the global policy, see set_rasterize_policy
+        False: no artists are rasterized
+        True: the policy's threshold, or 10000 if the policy is off
+        int: artists with more elements (points, paths, cells) are
+            rasterized, so vector outputs embed them as images. text &
+            axes stay vector. vector files are saved at the policy's
+            dpi, unless given
     suptitle: None, str, (str, dict)
         default: {suptitle}
         None: does not assign
@@ -463,6 +529,7 @@ class MatplotlibDecorator(object):
         dict: tight_layout is kwargs for fig.tight_layout()
         True: call tight_layout with options from xkw
         False, empty dict: do not call tight_layout
+        solutions are cached by layout, see cached_tight_layout
         prefers xkw['tight_layout'] else tries from xkw:
             (override key prefix: 'tight_layout_')
             'pad', 'h_pad', 'w_pad', 'rect'
@@ -503,15 +570,26 @@ class MatplotlibDecorator(object):
     unit_labels: bool
         whether to use auto labels from astropy.quantity_support()
         default: {unit_labels}
-    xlim: (lim1, lim2) or (lim1, lim2, emit, auto)
+    xlim: (lim1, lim2) or (lim1, lim2, emit, auto) or str
         default: {xlim}
         can ignore all by (None, None, True, False)
-    ylim:(lim1, lim2) or (lim1, lim2, emit, auto)
+        str: robust percentile limits of the plotted data,
+            'auto', 'auto:P' (central P%), or 'auto:lo:hi'
+    ylim:(lim1, lim2) or (lim1, lim2, emit, auto) or str
         default: {ylim}
         can ignore all by (None, None, True, False)
-    zlim: (lim1, lim2) or (lim1, lim2, emit, auto)
+        str: robust percentile limits of the plotted data,
+            'auto', 'auto:P' (central P%), or 'auto:lo:hi'
+    zlim: (lim1, lim2) or (lim1, lim2, emit, auto) or str
         default: {zlim}
         can ignore all by (None, None, True, False)
+        str: robust percentile limits of the plotted data,
+            'auto', 'auto:P' (central P%), or 'auto:lo:hi'
+    preclip: bool
+        default: {preclip}
+        whether to clip the data of plot, scatter & errorbar to xlim & ylim
+        before plotting. lines keep one point past each limit.
+        not str limits
     invert_axis: str
         # TODO
     xscale: None, str, (str, dict)
@@ -538,6 +616,8 @@ class MatplotlibDecorator(object):
     legend: dict
         kwargs for ax.legend()
         default: {legend}
+        the legend is built when the figure is drawn, from the handles
+        registered by each call, see register_legend_handles
 
     colorbar: dict, bool
         default: {colorbar}
@@ -550,16 +630,25 @@ class MatplotlibDecorator(object):
     clabel: str, None
         colorbar label
         default: {clabel}
-    clim: tuple, none
+    clim: tuple, str, none
         colorbar limits
         default: {clim}
         does nothing if None
-    cloc: str, None, mpl.axes.Axes
+        str: robust percentile limits of the mappable's data,
+            'auto', 'auto:P' (central P%), or 'auto:lo:hi'
+    cloc: str, None, mpl.axes.Axes, list of Axes
         default: {cloc}
-        None: uses pyplot.colorbar(ax=)
+        None: uses pyplot.colorbar(ax=), with all the axes of a cgroup
         'in': uses pyplot.colorbar(cax=)
         'out': uses pyplot.colorbar(ax=)
-        Axes: uses pyplot.colorbar(ax=)
+        Axes, list of Axes: uses pyplot.colorbar(ax=)
+    cgroup: None, hashable
+        default: {cgroup}
+        None: each call makes its own colorbar
+        hashable: the figure's colorbar group. all calls in a group share
+            one normalization, with limits accumulated over the group's
+            data, and one colorbar, made & configured on the group's first
+            call
 
     sidehists: bool
         whether to use sidehists
@@ -655,6 +744,7 @@ class MatplotlibDecorator(object):
         overridefig=False,
         savefig=False,
         closefig=False,
+        rasterize_above=None,
         suptitle=None,
         # axes
         ax=None,
@@ -666,6 +756,7 @@ class MatplotlibDecorator(object):
         xlim=None,
         ylim=None,
         zlim=None,
+        preclip=False,
         invert_axis=None,
         xscale=None,
         yscale=None,
@@ -677,6 +768,7 @@ class MatplotlibDecorator(object):
         clabel=None,
         clim=None,
         cloc=None,
+        cgroup=None,
         # sidehists
         sidehists=False,
         shbins=None,
@@ -736,6 +828,7 @@ class MatplotlibDecorator(object):
                 overridefig=overridefig,
                 savefig=savefig,
                 closefig=closefig,
+                rasterize_above=rasterize_above,
                 suptitle=suptitle,
                 # axes
                 ax=ax,
@@ -747,6 +840,7 @@ class MatplotlibDecorator(object):
                 xlim=xlim,
                 ylim=ylim,
                 zlim=zlim,
+                preclip=preclip,
                 invert_axis=invert_axis,
                 xscale=xscale,
                 yscale=yscale,
@@ -758,6 +852,7 @@ class MatplotlibDecorator(object):
                 clabel=clabel,
                 clim=clim,
                 cloc=cloc,
+                cgroup=cgroup,
                 # sidehists
                 sidehists=sidehists,
                 shbins=shbins,
@@ -811,6 +906,7 @@ class MatplotlibDecorator(object):
                 self.overridefig = overridefig
                 self.savefig = savefig
                 self.closefig = closefig
+                self.rasterize_above = rasterize_above
 
                 self.suptitle = suptitle
 
@@ -830,6 +926,7 @@ class MatplotlibDecorator(object):
                 self.xlim = xlim
                 self.ylim = ylim
                 self.zlim = zlim
+                self.preclip = preclip
                 self.invert_axis = invert_axis
 
                 self.xscale = xscale
@@ -846,6 +943,7 @@ class MatplotlibDecorator(object):
                 self.clabel = clabel
                 self.clim = clim
                 self.cloc = cloc
+                self.cgroup = cgroup
 
                 # +----------- Side Hists -----------+
                 self.sidehists = sidehists
@@ -890,6 +988,7 @@ class MatplotlibDecorator(object):
                     overridefig=self.overridefig,
                     savefig=self.savefig,
                     closefig=self.closefig,
+                    rasterize_above=self.rasterize_above,
                     suptitle=self.suptitle,
                     # axes
                     ax=self.ax,
@@ -901,6 +1000,7 @@ class MatplotlibDecorator(object):
                     xlim=self.xlim,
                     ylim=self.ylim,
                     zlim=self.zlim,
+                    preclip=self.preclip,
                     invert_axis=self.invert_axis,
                     xscale=self.xscale,
                     yscale=self.yscale,
@@ -912,6 +1012,7 @@ class MatplotlibDecorator(object):
                     clabel=self.clabel,
                     clim=self.clim,
                     cloc=self.cloc,
+                    cgroup=self.cgroup,
                     # sidehists
                     sidehists=self.sidehists,
                     shtype=self.shtype,
@@ -934,6 +1035,23 @@ class MatplotlibDecorator(object):
                 ):
                     r"""
                     """
+                    # lazy mode: recorded in the figure graph, not plotted
+                    graph = current_graph()
+                    if graph is not None:
+                        options = {
+                            k: v
+                            for k, v in locals().items()
+                            if k not in _notoptions
+                        }
+                        return graph.record(
+                            self,
+                            instrumented,
+                            wrapped_function,
+                            func_args,
+                            func_kwargs,
+                            options,
+                        )
+
                     # PRE
 
                     # combining dictionaries
@@ -970,7 +1088,13 @@ class MatplotlibDecorator(object):
                     else:
                         stylesheet = "default"
 
-                    with pyplot.style.context(stylesheet):
+                    # clipping the data to the limits, if preclip
+                    if preclip:
+                        clip = clip_window(xlim, ylim)
+                    else:
+                        clip = ExitStack()  # a no-op context
+
+                    with style_context(stylesheet), clip:
                         # argspec = inspect.getfullargspec(wrapped_function)
                         # if argspec.varkw is not None:  # accepts extra kwargs
                         #     pass
@@ -1010,39 +1134,29 @@ class MatplotlibDecorator(object):
 
                         axisScales(ax, x=xscale, y=yscale, z=zscale, **wkw)
 
-                        # Legend
+                        # Legend, built when the figure is drawn
                         if legend is not False:
-                            handles, labels = ax.get_legend_handles_labels()
-                            if labels:
-                                legend = _parseoptsdict(legend)
-                                ax.legend(
-                                    handles=handles, labels=labels, **legend
-                                )
+                            register_legend_handles(
+                                ax, **_parseoptsdict(legend)
+                            )
 
                     # +---- colorbar ----+
                     if colorbar:
-                        ckw = xkw.get("colorbar", {})
+                        ckw = dict(xkw.get("colorbar", {}))
                         if not ckw:
-                            # allowable arguments
-                            ckw = {k: xkw.get(k) for k in _cbark if k in xkw}
-                            # any specific overrides
-                            ckw.update(
-                                {
-                                    _stripprefix(k, "colorbar_"): v
-                                    for k, v in ckw.items()
-                                    if k.startswith("colorbar_")
-                                }
-                            )
+                            # allowable arguments & any specific overrides
+                            ckw = _resolve_options(xkw, _cbark, "colorbar_")
 
-                        # make colorbar
+                        # colorbar location
                         if cloc is None:
-                            cbar = fig.colorbar(_res, ax=ax, **ckw)
-                        elif cloc == "in":
-                            cbar = fig.colorbar(_res, cax=ax, **ckw)
-                        elif cloc == "out":
-                            cbar = fig.colorbar(_res, ax=ax, **ckw)
-                        elif isinstance(cloc, Axes):
-                            cbar = fig.colorbar(_res, ax=cloc, **ckw)
+                            if cgroup is None:  # else the group's axes
+                                ckw["ax"] = ax
+                        elif isinstance(cloc, str) and cloc == "in":
+                            ckw["cax"] = ax
+                        elif isinstance(cloc, str) and cloc == "out":
+                            ckw["ax"] = ax
+                        elif isinstance(cloc, (Axes, list, tuple, np.ndarray)):
+                            ckw["ax"] = cloc
 
                         else:
                             raise TypeError("cloc wrong type")
@@ -1050,11 +1164,28 @@ class MatplotlibDecorator(object):
                         # elif cloc[0] == 'in & isinstance(cloc[1], mpl.axes.Axes):
                         #     cbar = fig.colorbar(return_, cax=cloc[1], **ckw)
 
-                        if clim is not None:
-                            cbar.set_clim(*clim)
+                        # make colorbar
+                        if cgroup is not None:  # one per group
+                            cbar = shared_colorbar(
+                                _res,
+                                group=cgroup,
+                                fig=fig,
+                                clim=clim,
+                                clabel=clabel,
+                                **ckw
+                            )
+                        else:
+                            cbar = fig.colorbar(_res, **ckw)
+
+                            if isinstance(clim, str):
+                                clim = robust_limits(
+                                    _res.get_array(), parse_auto_limits(clim)
+                                )
+                            if clim is not None:
+                                cbar.set_clim(*clim)
 
-                        if clabel is not None:
-                            cbar.set_label(clabel)
+                            if clabel is not None:
+                                cbar.set_label(clabel)
 
                     # +---- sidehists ----+
                     if sidehists is not False:
@@ -1143,16 +1274,24 @@ class MatplotlibDecorator(object):
                         # False, empty dict: do not call tight_layout
                         tightLayout(fig=fig, tlkw=tight_layout, **wkw)
 
+                    # rasterizing heavy artists, for vector outputs
+                    rasterize_heavy(fig, rasterize_above)
+
                     # saving
                     if savefig:  # T/F
-                        save_figure(savefig, fig=fig, **wkw)
+                        save_figure(
+                            savefig,
+                            fig=fig,
+                            rasterize_above=rasterize_above,
+                            **wkw
+                        )
 
                     if closefig:
                         pyplot.close(fig)
 
-                    # old figure
-                    if (
-                        oldfig is not None
+                    # old figure, unless closed, as by saving
+                    if oldfig is not None and pyplot.fignum_exists(
+                        oldfig.number
                     ):  # Returning old figure to current status
                         pyplot.figure(oldfig.number)
                         fig = pyplot.gcf()
@@ -1176,7 +1315,12 @@ class MatplotlibDecorator(object):
                 )
                 wrapped.__doc__ = cleandoc(wrapped.__doc__) + _added_doc
 
-                return wrapped
+                # measured, when instrumentation is on
+                instrumented = instrument_call(
+                    wrapped, wrapped_function.__name__
+                )
+
+                return instrumented
 
             # /def
 
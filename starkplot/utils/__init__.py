@@ -28,10 +28,13 @@ from .subplots import (
     closest_square_axis_grid_shape,
     closest_square_axis_grid,
     closest_square_axis_grid_iter,
+    small_multiples,
     corner_plot,
     staircase_plot,
 )
 
+from .objrecord import ObjRecord, ObjRecordArray
+
 
 ##############################################################################
 ### CODE
@@ -21,5 +21,11 @@ __author__ = "Nathaniel Starkman"
 ## Project-Specific
 from ._info import _colorbark
 
+from ..._figure._shared_colorbar import (
+    SharedNorm,  # Normalize with limits accumulated over many panels
+    shared_norm,  # the SharedNorm of a figure's colorbar group
+    shared_colorbar,  # one colorbar per group of panels
+)
+
 
 ##############################################################################
@@ -2,27 +2,61 @@
 
 """initialization file for jupyter notebook functions
 
-# TODO:
-- provide functions to set the inline vs notebook,
-  change figure_format to something other than retina, etc.
+Importing this module changes nothing. The notebook display is set up
+by configure_notebook: the inline backend is enabled and figures are
+displayed by render_figure, with the chosen format, dpi & compression.
+
+Displayed images are cached by the figure's content, so re-running a
+cell which makes an unchanged figure doesn't re-render it. Figures with
+values of unknown state aren't cached.
+
+Example
+-------
+>>> from starkplot.utils.ipython import configure_notebook
+>>> configure_notebook(format="png", dpi=100, max_pixels=2e6)
+
+The previous import-time setup is
+``configure_notebook(format="retina", style=astropy_mpl_style,
+quantity_support=True)``
 
 """
 
 __author__ = "Nathaniel Starkman"
 
+__all__ = [
+    "configure_notebook",
+    "get_notebook_config",
+    "render_figure",
+    "figure_signature",
+    "figure_cache_info",
+    "clear_figure_cache",
+]
+
 
 ##############################################################################
 ### IMPORTS
 
 ## General
-import matplotlib.pyplot as pyplot
+import hashlib
+import io
+import struct
+import types
+from collections import OrderedDict
+
+import numpy as np
 
-try:
-    from astropy.visualization import quantity_support, astropy_mpl_style
-except ImportError:
-    _APY = False
-else:
-    _APY = True
+# matplotlib
+import matplotlib.pyplot as pyplot
+from matplotlib import rcParams
+from matplotlib.artist import Artist
+from matplotlib.axis import Tick
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.cbook import CallbackRegistry
+from matplotlib.colorbar import ColorbarBase
+from matplotlib.colors import Colormap
+from matplotlib.figure import Figure
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2DBase, BboxBase, TransformNode
 
 ## Custom
 
@@ -30,32 +64,426 @@ else:
 
 
 ##############################################################################
-### Running
+### Info
 
-# configure matplotlib
-try:
-    get_ipython()
+# the display settings
+_config = {
+    "format": "png",
+    "dpi": None,
+    "max_pixels": None,
+    "png_compression": None,
+    "throttle": True,
+}
 
-except NameError:
-    pass
+# the mimetype of each format, & the dpi scale (retina is 2x png)
+_formats = {
+    "png": ("image/png", 1),
+    "retina": ("image/png", 2),
+    "jpeg": ("image/jpeg", 1),
+    "svg": ("image/svg+xml", 1),
+    "pdf": ("application/pdf", 1),
+}
 
-else:
-    get_ipython().magic("matplotlib inline")
-    get_ipython().magic("config InlineBackend.figure_format='retina'")
+# whether the inline backend was enabled
+_state = {"inline": False}
 
+# the rendered images, by figure signature & settings
+_cache = OrderedDict()
+_cache_info = {"hits": 0, "misses": 0}
+_cache_size = 32
 
-if _APY:
-    quantity_support()
-    pyplot.style.use(astropy_mpl_style)
+# artist attributes which don't change the image, or are set drawing
+_skip = {
+    "_oid",
+    "_stale",
+    "stale_callback",
+    "_remove_method",
+    "_propobservers",
+    "callbacks",
+    "number",
+    "_xcid",
+    "_ycid",
+    "axis",
+    "_cachedRenderer",
+    "_renderer",
+    "_invalidx",
+    "_invalidy",
+    "_path",
+    "_transformed_path",
+    "_rect_transform",
+    "_autotitlepos",
+    "_axstack",
+    "_get_lines",
+    "_get_patches_for_fill",
+    "_subplotspec",
+    "_starkplot_legend_registry",
+}
+
+# values hashed by their type: set by, or drawn as, the hashed artists
+_by_type = (
+    Artist,
+    TransformNode,
+    CallbackRegistry,
+    FigureCanvasBase,
+    ColorbarBase,
+    types.MethodType,
+)
+
+# the nesting of values hashed by their state
+_max_depth = 3
 
 
 ##############################################################################
-### Printing Output
-print(
-    """Imported:
-Set matplotlib inline
-configured figure format to retina
-set up astropy quantity support
-changed style to astropy style
-"""
-)
+### Signature
+
+
+class _UnknownState(Exception):
+    """a value which can't be hashed by its state"""
+
+
+# /class
+
+
+def _feed(h, value, depth=0):
+    """add an attribute value to a hash
+
+    Raises
+    ------
+    _UnknownState
+        if the value's state is unknown, as nested too deep
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        h.update(repr(value).encode())
+    elif isinstance(value, np.generic):
+        h.update(repr(value.item()).encode())
+    elif isinstance(value, np.ndarray):
+        h.update(f"{value.dtype}{value.shape}".encode())
+        if value.dtype.kind == "O":
+            for v in value.flat:
+                _feed(h, v, depth + 1)
+        else:
+            h.update(np.ascontiguousarray(value).tobytes())
+        if np.ma.isMaskedArray(value):
+            h.update(np.ma.getmaskarray(value).tobytes())
+    elif isinstance(value, Path):
+        _feed(h, value.vertices, depth)
+        _feed(h, value.codes, depth)
+    elif isinstance(value, BboxBase):
+        _feed(h, value.get_points(), depth)
+    elif isinstance(value, Affine2DBase):
+        _feed(h, value.get_matrix(), depth)
+    elif isinstance(value, Colormap):
+        h.update(value.name.encode())
+    elif isinstance(value, _by_type):  # artists are hashed on their own
+        h.update(type(value).__name__.encode())
+    elif isinstance(value, types.FunctionType):
+        h.update(f"{value.__module__}.{value.__qualname__}".encode())
+    elif depth >= _max_depth:
+        raise _UnknownState(type(value).__name__)
+    elif isinstance(value, (tuple, list)):
+        h.update(b"(")
+        for v in value:
+            _feed(h, v, depth + 1)
+        h.update(b")")
+    elif isinstance(value, dict):
+        _feed(h, sorted(value.items(), key=lambda kv: str(kv[0])), depth)
+    elif hasattr(value, "__dict__"):  # as norms, markers & fonts
+        h.update(type(value).__name__.encode())
+        for key, v in sorted(_state_items(value)):
+            h.update(key.encode())
+            _feed(h, v, depth + 1)
+    else:
+        raise _UnknownState(type(value).__name__)
+
+
+# /def
+
+
+def _state_items(obj):
+    """the attributes of an object which may change the image"""
+    for key, value in vars(obj).items():
+        if key not in _skip and not isinstance(value, Artist):
+            yield key, value
+
+
+# /def
+
+
+def _artists(artist):
+    """the artist & its children, without ticks, which are made drawing
+
+    the ticks are set by the axes' limits, locators & formatters
+    """
+    yield artist
+    for child in artist.get_children():
+        if not isinstance(child, Tick):
+            yield from _artists(child)
+
+
+# /def
+
+
+def figure_signature(fig):
+    """a hash of the figure's content, the same for figures drawn alike
+
+    the artists' state, as their data, styles & limits, and rcParams.
+    Drawing may change it, as legends are laid out when drawn
+
+    Parameters
+    ----------
+    fig : Figure
+
+    Returns
+    -------
+    signature : str or None
+        None if the state of an attribute's value is unknown
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(repr(sorted(rcParams.items())).encode())
+    try:
+        for artist in _artists(fig):
+            h.update(type(artist).__name__.encode())
+            for key, value in sorted(_state_items(artist)):
+                h.update(key.encode())
+                _feed(h, value)
+    except _UnknownState:
+        return None
+    return h.hexdigest()
+
+
+# /def
+
+
+##############################################################################
+### Rendering
+
+
+def _figure_dpi(fig, scale=1):
+    """the dpi to render a figure, at most max_pixels"""
+    dpi = (fig.dpi if _config["dpi"] is None else _config["dpi"]) * scale
+    if _config["max_pixels"] is not None:
+        width, height = fig.get_size_inches()
+        dpi = min(dpi, np.sqrt(_config["max_pixels"] / (width * height)))
+    return dpi
+
+
+# /def
+
+
+def _print_figure(fig, format, dpi):
+    """the image of a figure, as the IPython display takes it"""
+    kw = {}
+    if format == "png" and _config["png_compression"] is not None:
+        kw["pil_kwargs"] = {"compress_level": _config["png_compression"]}
+
+    buffer = io.BytesIO()
+    fig.canvas.print_figure(
+        buffer,
+        format=format,
+        dpi=dpi,
+        facecolor=fig.get_facecolor(),
+        edgecolor=fig.get_edgecolor(),
+        bbox_inches="tight",
+        **kw,
+    )
+    data = buffer.getvalue()
+    return data.decode("utf-8") if format == "svg" else data
+
+
+# /def
+
+
+def render_figure(fig, format=None):
+    """render a figure for the notebook display
+
+    with the configured dpi & compression, see configure_notebook.
+    if throttled, an unchanged figure isn't re-rendered, unless it has
+    no signature
+
+    Parameters
+    ----------
+    fig : Figure
+    format : str, optional
+        'png', 'retina', 'jpeg', 'svg' or 'pdf'. default: the configured
+
+    Returns
+    -------
+    data : bytes, str, tuple or None
+        the image, (png, metadata) if displayed at another size than
+        rendered, or None if the figure is empty
+    """
+    if not fig.axes and not fig.lines:
+        return None
+
+    format = _config["format"] if format is None else format
+    scale = _formats[format][1]
+    base = fig.dpi if _config["dpi"] is None else _config["dpi"]
+    dpi = _figure_dpi(fig, scale=scale)
+
+    key = None
+    signature = figure_signature(fig) if _config["throttle"] else None
+    if signature is not None:
+        key = (signature, format, dpi, _config["png_compression"])
+        if key in _cache:
+            _cache_info["hits"] += 1
+            _cache.move_to_end(key)
+            return _cache[key]
+        _cache_info["misses"] += 1
+
+    fmt = "png" if format == "retina" else format
+    data = _print_figure(fig, fmt, dpi)
+    if fmt == "png" and dpi != base:  # displayed at the nominal size
+        width, height = struct.unpack(">ii", data[16:24])
+        ratio = dpi / base
+        data = (
+            data,
+            {"width": int(width / ratio), "height": int(height / ratio)},
+        )
+
+    if key is not None:
+        _cache[key] = data
+        while len(_cache) > _cache_size:
+            _cache.popitem(last=False)
+
+    return data
+
+
+# /def
+
+
+def figure_cache_info():
+    """the hits, misses & size of the rendered figure cache, as a dict"""
+    return {**_cache_info, "size": len(_cache)}
+
+
+# /def
+
+
+def clear_figure_cache():
+    """clear the rendered figure cache"""
+    _cache.clear()
+    _cache_info.update(hits=0, misses=0)
+
+
+# /def
+
+
+##############################################################################
+### Configuring
+
+
+def _get_shell():
+    """the IPython shell, or None"""
+    try:
+        from IPython import get_ipython
+    except ImportError:
+        return None
+    return get_ipython()
+
+
+# /def
+
+
+def _register_formatters(shell):
+    """display figures with render_figure, in the configured format"""
+    formatters = shell.display_formatter.formatters
+    for mimetype, _ in _formats.values():
+        formatters[mimetype].pop(Figure, None)
+
+    mimetype = _formats[_config["format"]][0]
+    formatters[mimetype].for_type(Figure, render_figure)
+
+
+# /def
+
+
+def configure_notebook(
+    format="png",
+    dpi=None,
+    max_pixels=None,
+    png_compression=None,
+    throttle=True,
+    style=None,
+    quantity_support=False,
+):
+    """configure the notebook display of figures
+
+    enables the inline backend, once, and displays figures with
+    render_figure. Outside IPython, only the settings are stored.
+    Can be called again, to change the settings
+
+    Parameters
+    ----------
+    format : str
+        'png', 'retina' (png at 2x the dpi), 'jpeg', 'svg' or 'pdf'
+    dpi : float, optional
+        default: the figure's dpi
+    max_pixels : float, optional
+        the most pixels of a displayed image, lowering the dpi of big
+        figures. None: unlimited
+    png_compression : int, optional
+        the zlib level (0-9) of png images. needs Pillow.
+        None: matplotlib's default
+    throttle : bool
+        whether to cache displayed images, so unchanged figures aren't
+        re-rendered when a cell is re-run
+    style : str, dict, list, optional
+        a style to use globally, see pyplot.style.use
+    quantity_support : bool
+        whether to turn on astropy's quantity support
+
+    Returns
+    -------
+    config : dict
+        the display settings
+
+    Raises
+    ------
+    ValueError
+        if the format isn't supported
+    """
+    if format not in _formats:
+        raise ValueError(
+            f"format must be one of {tuple(_formats)}, not {format!r}"
+        )
+
+    _config.update(
+        format=format,
+        dpi=dpi,
+        max_pixels=max_pixels,
+        png_compression=png_compression,
+        throttle=throttle,
+    )
+    if not throttle:
+        clear_figure_cache()
+
+    if style is not None:
+        pyplot.style.use(style)
+
+    if quantity_support:
+        from astropy.visualization import quantity_support as support
+
+        support()
+
+    shell = _get_shell()
+    if shell is not None:
+        if not _state["inline"]:
+            shell.enable_matplotlib("inline")
+            _state["inline"] = True
+        _register_formatters(shell)
+
+    return get_notebook_config()
+
+
+# /def
+
+
+def get_notebook_config():
+    """the notebook display settings, as a dict"""
+    return dict(_config)
+
+
+# /def
+
+##############################################################################
+# END
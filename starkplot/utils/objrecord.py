@@ -0,0 +1,471 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : objrecord
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+r"""compact, frozen-schema counterparts to ObjDict
+
+ObjRecord : one record, slot-based
+ObjRecordArray : many records, backed by a numpy structured array
+"""
+
+__author__ = "Nathaniel Starkman"
+
+##############################################################################
+### IMPORTS
+
+# General
+import numpy as np
+
+# Project-Specific
+from .pickle import dump as _dump, load as _load
+
+
+##############################################################################
+### Info
+
+# names that would shadow the ObjRecord API
+_reserved = (
+    "name",
+    "keys",
+    "values",
+    "items",
+    "subset",
+    "keyslist",
+    "to_objdict",
+    "dump",
+    "save",
+    "load",
+    "from_objdict",
+)
+
+# one class per schema, so records sharing keys share a class
+_record_classes = {}
+
+
+##############################################################################
+### CODE
+
+
+def _record_class(fields):
+    r"""get (or make) the ObjRecord subclass for a tuple of fields
+    """
+    fields = tuple(fields)
+
+    try:
+        return _record_classes[fields]
+    except KeyError:
+        pass
+
+    for field in fields:
+        if not isinstance(field, str) or not field.isidentifier():
+            raise ValueError(f"field {field!r} is not a valid identifier")
+        if field.startswith("_") or field in _reserved:
+            raise ValueError(f"field {field!r} is reserved")
+    if len(set(fields)) != len(fields):
+        raise ValueError("fields must be unique")
+
+    cls = type(
+        "ObjRecord", (ObjRecord,), {"__slots__": fields, "_fields": fields}
+    )
+    _record_classes[fields] = cls
+
+    return cls
+
+
+# /def
+
+
+def _rebuild_record(fields, name, values):
+    r"""unpickling helper for ObjRecord
+    """
+    return _record_class(fields)(name, *values)
+
+
+# /def
+
+
+# --------------------------------------------------------------------------
+
+
+class ObjRecord(object):
+    """ObjRecord
+    a compact, slot-based version of ObjDict with a frozen set of keys.
+    instantiated with a name (str) and the values for each key.
+
+    the schema is built once, from an ObjDict or a list of keys, and
+    values are stored in __slots__, so a record has no per-instance dict.
+    supports the ObjDict API: __getattr__, __getitem__ (str or list),
+    values(*names), items(*names), subset(*names), keyslist & pickling.
+
+    >> rec = ObjRecord.from_objdict(objdict)
+    >> Rec = ObjRecord.schema('x', 'y')
+    >> rec = Rec('name', 1, 2)
+    """
+
+    __slots__ = ("_name",)
+    _fields = ()
+
+    def __init__(self, name="", *args, **kw):
+        """__init__
+        initialize with a name for the record and the values
+        positionally (in key order) or by key. missing keys are None
+        """
+        if len(args) > len(self._fields):
+            raise TypeError(
+                f"expected at most {len(self._fields)} values, got {len(args)}"
+            )
+
+        object.__setattr__(self, "_name", name)
+
+        for key, value in zip(self._fields, args):
+            object.__setattr__(self, key, value)
+        for key in self._fields[len(args) :]:
+            object.__setattr__(self, key, kw.pop(key, None))
+        if kw:
+            raise KeyError(f"not in schema: {tuple(kw)}")
+
+    # /def
+
+    @staticmethod
+    def schema(*fields):
+        """the ObjRecord class for these keys"""
+        return _record_class(fields)
+
+    # /def
+
+    @classmethod
+    def from_objdict(cls, objdict, name=None):
+        """make a record from an ObjDict (or any mapping)
+
+        Parameters
+        ----------
+        objdict : ObjDict, dict
+            its keys are the schema
+        name : str, optional
+            default: objdict.name, if it has one, else ''
+        """
+        if name is None:
+            name = getattr(objdict, "name", "")
+        if cls._fields:  # already a schema
+            rec = cls(name)
+            for key, value in objdict.items():
+                rec[key] = value
+            return rec
+        return _record_class(objdict.keys())(name, *objdict.values())
+
+    # /def
+
+    @property
+    def name(self):
+        return self._name
+
+    # +-------- Mapping --------+
+
+    def __getitem__(self, keys):
+        if isinstance(keys, str):
+            try:
+                return getattr(self, keys)
+            except AttributeError:
+                raise KeyError(keys)
+        else:
+            return [self[key] for key in keys]
+
+    def __setitem__(self, key, value):
+        if key not in self._fields:
+            raise KeyError(f"{key} not in schema")
+        object.__setattr__(self, key, value)
+
+    def __setattr__(self, key, value):
+        if key not in self._fields:  # as __slots__ classes
+            raise AttributeError(f"{key} not in schema")
+        object.__setattr__(self, key, value)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __eq__(self, other):
+        if not isinstance(other, ObjRecord):
+            return NotImplemented
+        return (
+            self._fields == other._fields
+            and self._name == other._name
+            and all(self[k] == other[k] for k in self._fields)
+        )
+
+    __hash__ = None  # mutable
+
+    def __repr__(self):
+        body = ", ".join(f"{k}={self[k]!r}" for k in self._fields)
+        return f"{self._name}ObjRecord({body})"
+
+    def keys(self):
+        return self._fields
+
+    def values(self, *names):
+        if not names:
+            names = self._fields
+        return [self[k] for k in names]
+
+    def items(self, *names):
+        if not names:
+            names = self._fields
+        return {k: self[k] for k in names}.items()
+
+    def subset(self, *names):
+        if not names:
+            return self
+        else:
+            return {k: self[k] for k in names}
+
+    def keyslist(self):
+        return list(self._fields)
+
+    def to_objdict(self):
+        """the equivalent ObjDict"""
+        from . import ObjDict
+
+        return ObjDict(self._name, **dict(self.items()))
+
+    # /def
+
+    # +-------- Serialize --------+
+    def __reduce__(self):
+        return (
+            _rebuild_record,
+            (self._fields, self._name, tuple(self.values())),
+        )
+
+    # /def
+
+    def dump(self, fname, protocol=None, *, fopt="b", fix_imports=True):
+        _dump(
+            self, fname, protocol=protocol, fopt=fopt, fix_imports=fix_imports
+        )
+
+    # /def
+
+    def save(self, fname, protocol=None, *, fopt="b", fix_imports=True):
+        self.dump(fname, protocol=protocol, fopt=fopt, fix_imports=fix_imports)
+
+    # /def
+
+    @staticmethod
+    def load(
+        fname, *, fopt="b", fix_imports=True, encoding="ASCII", errors="strict"
+    ):
+        self = _load(
+            fname,
+            fopt=fopt,
+            fix_imports=fix_imports,
+            encoding=encoding,
+            errors=errors,
+        )
+        return self
+
+    # /def
+
+
+# /class
+
+
+# --------------------------------------------------------------------------
+
+
+class ObjRecordArray(object):
+    """ObjRecordArray
+    many records with the same keys, stored column-wise in a numpy
+    structured array. numeric keys get numeric columns, anything else
+    is stored as an object column.
+
+    supports vectorized column access (arr.x, arr['x'], arr[['x', 'y']])
+    and the ObjDict API over columns: values(*names), items(*names),
+    subset(*names), keyslist. indexing with an int returns an ObjRecord,
+    with a slice / mask / index array returns an ObjRecordArray.
+    """
+
+    __slots__ = ("_data", "_names")
+
+    def __init__(self, data, names=None):
+        """__init__
+
+        Parameters
+        ----------
+        data : structured ndarray
+        names : array of str, optional
+            the name of each record. default: all ''
+        """
+        data = np.asanyarray(data)
+        if data.dtype.names is None:
+            raise TypeError("data must be a structured array")
+
+        if names is None:
+            names = np.full(len(data), "", dtype=object)
+        else:
+            names = np.asarray(names, dtype=object)
+            if names.shape != data.shape:
+                raise ValueError("names and data must have the same shape")
+
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_names", names)
+
+    # /def
+
+    @classmethod
+    def from_records(cls, records):
+        """from ObjRecords, ObjDicts or mappings sharing the same keys
+
+        Parameters
+        ----------
+        records : sequence
+            the keys of the first record are the schema
+        """
+        records = list(records)
+        if not records:
+            raise ValueError("need at least one record to infer the schema")
+        fields = tuple(records[0].keys())
+
+        columns = []
+        for field in fields:
+            column = [rec[field] for rec in records]
+            try:
+                arr = np.asarray(column)
+            except ValueError:  # ragged
+                arr = np.empty(len(column), dtype=object)
+                arr[:] = column
+            if arr.ndim != 1 or arr.dtype.kind not in "biufcmMSU?":
+                arr = np.empty(len(column), dtype=object)
+                arr[:] = column
+            columns.append(arr)
+
+        data = np.empty(
+            len(records),
+            dtype=[(f, c.dtype) for f, c in zip(fields, columns)],
+        )
+        for field, column in zip(fields, columns):
+            data[field] = column
+
+        names = [getattr(rec, "name", "") for rec in records]
+
+        return cls(data, names=names)
+
+    # /def
+
+    @property
+    def data(self):
+        """the underlying structured array"""
+        return self._data
+
+    @property
+    def names(self):
+        """the name of each record"""
+        return self._names
+
+    @property
+    def record_class(self):
+        """the ObjRecord class of a row"""
+        return _record_class(self._data.dtype.names)
+
+    # +-------- Columns --------+
+
+    def __getattr__(self, key):
+        if key.startswith("_"):
+            raise AttributeError(key)
+        try:
+            return self._data[key]
+        except (ValueError, KeyError):
+            raise AttributeError(key)
+
+    def __setattr__(self, key, value):
+        if key not in self._data.dtype.names:  # as __slots__ classes
+            raise AttributeError(f"{key} not in schema")
+        self._data[key] = value
+
+    def __getitem__(self, keys):
+        if isinstance(keys, str):
+            return self._data[keys]
+        elif isinstance(keys, (int, np.integer)):
+            row = self._data[keys]
+            return self.record_class(self._names[keys], *row.tolist())
+        elif isinstance(keys, list) and keys and isinstance(keys[0], str):
+            return [self._data[key] for key in keys]
+        else:  # slice, mask, index array
+            return self.__class__(self._data[keys], names=self._names[keys])
+
+    def __setitem__(self, key, value):
+        if key not in self._data.dtype.names:
+            raise KeyError(f"{key} not in schema")
+        self._data[key] = value
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        for i in range(len(self._data)):
+            yield self[i]
+
+    def __repr__(self):
+        return f"ObjRecordArray({self._data!r})"
+
+    def keys(self):
+        return self._data.dtype.names
+
+    def values(self, *names):
+        if not names:
+            names = self._data.dtype.names
+        return [self._data[k] for k in names]
+
+    def items(self, *names):
+        if not names:
+            names = self._data.dtype.names
+        return {k: self._data[k] for k in names}.items()
+
+    def subset(self, *names):
+        if not names:
+            return self
+        else:
+            return {k: self._data[k] for k in names}
+
+    def keyslist(self):
+        return list(self._data.dtype.names)
+
+    # +-------- Serialize --------+
+    def __getstate__(self):
+        return {"data": self._data, "names": self._names}
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "_data", state["data"])
+        object.__setattr__(self, "_names", state["names"])
+
+    # /def
+
+    def dump(self, fname, protocol=None, *, fopt="b", fix_imports=True):
+        _dump(
+            self, fname, protocol=protocol, fopt=fopt, fix_imports=fix_imports
+        )
+
+    # /def
+
+    def save(self, fname, protocol=None, *, fopt="b", fix_imports=True):
+        self.dump(fname, protocol=protocol, fopt=fopt, fix_imports=fix_imports)
+
+    # /def
+
+    load = staticmethod(ObjRecord.load)
+
+
+# /class
+
+##############################################################################
+# End
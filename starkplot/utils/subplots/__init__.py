@@ -21,6 +21,7 @@ from .square import (
     closest_square_axis_grid_shape,  # shape of the closest-to-square grid
     closest_square_axis_grid,  # closest-to-square grid of axes
     closest_square_axis_grid_iter,  # flattened closest-to-square grid of axes
+    small_multiples,  # one plotting function across many datasets
 )
 
 from .corner import corner_plot, staircase_plot
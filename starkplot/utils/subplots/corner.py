@@ -33,6 +33,7 @@ from matplotlib import pyplot
 
 ## Project-Specific
 from ...decorators import mpl_decorator
+from ..._levels import credible_contour_args
 
 
 ##############################################################################
@@ -103,6 +104,7 @@ def corner_plot(
     data_labels=None,
     orientation="lower left",
     draw_contours=False,
+    credible_levels=None,
     fig=None,
     axs=None,
     savefig=False,
@@ -122,6 +124,11 @@ def corner_plot(
     orientation : str
         the orientation about which this is `centered'
         options: 'lower left', 'lower right', 'upper left', 'upper right'
+    draw_contours : bool
+        whether to draw KDE contours instead of scatter plots
+    credible_levels : str or sequence of floats, optional
+        contour the KDE at levels enclosing these masses, ex: 'sigma'.
+        see starkplot._levels.parse_credible_levels
     fig : matplotlib Figure, optional
         The input figure to plot on.
         If None then make one
@@ -200,12 +207,15 @@ def corner_plot(
                 kernel_evaluate = np.reshape(kernel(positions).T, xx.shape)
 
                 # Make contours out of the KDE
-                cfset = axs[i, j].contourf(
-                    xx, yy, kernel_evaluate, cmap="Blues"
+                args = (xx, yy, kernel_evaluate)
+                fargs, fkw = credible_contour_args(
+                    args, {"credible_levels": credible_levels}, filled=True
                 )
-                cset = axs[i, j].contour(
-                    xx, yy, kernel_evaluate, colors="Black"
+                cargs, ckw = credible_contour_args(
+                    args, {"credible_levels": credible_levels}
                 )
+                cfset = axs[i, j].contourf(*fargs, cmap="Blues", **fkw)
+                cset = axs[i, j].contour(*cargs, colors="Black", **ckw)
 
                 # Decorate
                 axs[i, j].set_xlim(xmin, xmax)
@@ -249,6 +259,7 @@ def staircase_plot(
     data,
     data_labels=None,
     draw_contours=False,
+    credible_levels=None,
     fig=None,
     axs=None,
     savefig=False,
@@ -265,6 +276,10 @@ def staircase_plot(
         number and the second axis should be the variable
     data_labels : (length n array)
         the variable labels
+    draw_contours : bool
+        whether to draw KDE contours instead of scatter plots
+    credible_levels : str or sequence of floats, optional
+        see corner_plot
     fig : matplotlib Figure, optional
         The input figure to plot on.
         If None then make one
@@ -283,6 +298,7 @@ def staircase_plot(
         data,
         data_labels=data_labels,
         draw_contours=draw_contours,
+        credible_levels=credible_levels,
         fig=fig,
         axs=axs,
         savefig=savefig,
@@ -19,11 +19,14 @@ __author__ = "Nathaniel Starkman"
 
 ## General
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 from matplotlib import pyplot
+from matplotlib.colors import Normalize
 
 ## Project-Specific
 from ...decorators import mpl_decorator
+from ..._figure import save_figure
 
 
 ##############################################################################
@@ -142,6 +145,152 @@ def closest_square_axis_grid_iter(numax, prefer_cols=True):
     )
 
 
+# /def
+
+
+# --------------------------------------------------------------------------
+
+
+def _data_range(arrs):
+    """the finite (min, max) over a sequence of arrays, None if empty"""
+    lo, hi = np.inf, -np.inf
+    for arr in arrs:
+        arr = np.asanyarray(arr)
+        if arr.size == 0 or arr.dtype.kind not in "biuf":
+            continue
+        lo = min(lo, np.nanmin(arr))
+        hi = max(hi, np.nanmax(arr))
+    if lo > hi:
+        return None
+    return lo, hi
+
+
+# /def
+
+
+def _explicit_xy(datasets):
+    """whether every dataset starts with 1D x & y of the same shape"""
+    return all(
+        len(d) > 1
+        and np.ndim(d[0]) == np.ndim(d[1]) == 1
+        and np.shape(d[0]) == np.shape(d[1])
+        for d in datasets
+    )
+
+
+# /def
+
+
+def small_multiples(
+    func,
+    datasets,
+    prefer_cols=True,
+    sharex=True,
+    sharey=True,
+    carg=None,
+    prepare=None,
+    max_workers=None,
+    savefig=False,
+    closefig=False,
+    subplots_kw={},
+    **kw
+):
+    """apply one plotting function across many datasets on a square grid
+
+    The figure and the closest-to-square grid of axes are made once,
+    shared x/y limits and the color normalization are computed once
+    over all the datasets, and each panel is drawn on its own axes
+    without returning to the previous figure.
+
+    Parameters
+    ----------
+    func : mpl_decorator-decorated function
+        called as func(*dataset, fig=fig, ax=ax, rtcf=False, **kw)
+    datasets : sequence
+        each item is a tuple of positional arguments for func
+        (a non-tuple item is treated as a single argument)
+    prefer_cols : bool, optional
+        see closest_square_axis_grid_shape
+    sharex, sharey : bool, optional
+        whether the panels share the x (y) limits. If every dataset
+        starts with 1D x & y, the limits are computed from them,
+        else they are left to the shared axes.
+        explicit xlim (ylim) in kw take precedence
+    carg : int, None, optional
+        index of the positional argument holding the color values.
+        if not None, one Normalize over all the datasets is passed as norm
+    prepare : callable, None, optional
+        applied to each dataset before plotting, ex: loading or binning
+    max_workers : int, None, optional
+        if > 1, run prepare on a thread pool of this size
+    savefig : str, (str, dict), False, optional
+        passed to save_figure once the grid is drawn
+    closefig : bool, optional
+        whether to close the figure at the end
+    subplots_kw : dict, optional
+        passed to pyplot.subplots, ex: figsize
+    **kw : passed to every func call
+
+    Returns
+    -------
+    fig : Figure
+    axs : flat array of Axes
+    results : list
+        the return of each func call
+    """
+    datasets = [d if isinstance(d, tuple) else (d,) for d in datasets]
+
+    # preparing the data
+    if prepare is not None:
+        if max_workers is not None and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                datasets = list(pool.map(prepare, datasets))
+        else:
+            datasets = [prepare(d) for d in datasets]
+        datasets = [d if isinstance(d, tuple) else (d,) for d in datasets]
+
+    # shared limits & normalization
+    explicit = _explicit_xy(datasets)
+    if sharex and explicit and "xlim" not in kw:
+        xlim = _data_range(d[0] for d in datasets)
+        if xlim is not None:
+            kw["xlim"] = xlim
+    if sharey and explicit and "ylim" not in kw:
+        ylim = _data_range(d[1] for d in datasets)
+        if ylim is not None:
+            kw["ylim"] = ylim
+    if carg is not None and "norm" not in kw:
+        clim = _data_range(d[carg] for d in datasets if len(d) > carg)
+        if clim is not None:
+            kw["norm"] = Normalize(*clim)
+
+    # figure & axes, made once
+    fig, axs = closest_square_axis_grid(
+        len(datasets),
+        prefer_cols=prefer_cols,
+        flatten=True,
+        sharex=sharex,
+        sharey=sharey,
+        squeeze=False,
+        **subplots_kw
+    )
+
+    results = [
+        func(*args, fig=fig, ax=ax, rtcf=False, **kw)
+        for args, ax in zip(datasets, axs)
+    ]
+
+    for ax in axs[len(datasets) :]:  # unused grid cells
+        ax.set_axis_off()
+
+    if savefig:
+        save_figure(savefig, fig=fig)
+    if closefig:
+        pyplot.close(fig)
+
+    return fig, axs, results
+
+
 # /def
 
 ##############################################################################
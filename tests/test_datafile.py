@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_datafile
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+from matplotlib import pyplot
+
+## Project-Specific
+from starkplot import _datafile
+from starkplot._plot import plotfile
+
+
+#############################################################################
+# DataFile
+
+
+def test_csv_columns(tmp_path):
+
+    fname = tmp_path / "data.csv"
+    rows = [f"{i * 0.5},{i % 7},{'' if i == 3 else i}" for i in range(100)]
+    fname.write_text("# a comment\nTime (s),Value A,b\n" + "\n".join(rows))
+
+    data = _datafile.DataFile(fname, chunksize=16)
+    assert data.names == ["time_s", "value_a", "b"]
+
+    t, b = data.read(["time_s", 2])
+    assert np.allclose(t, np.arange(100) * 0.5)
+    assert np.isnan(b[3]) and b[4] == 4
+    assert len(list(data.chunks([0]))) == 7
+
+
+# /def
+
+
+def test_binary_columns(tmp_path):
+
+    x = np.arange(1000.0)
+    np.save(tmp_path / "data.npy", np.c_[x, x ** 2])
+    np.savez(tmp_path / "data.npz", x=x, y=x ** 2)
+
+    data = _datafile.DataFile(tmp_path / "data.npy")
+    assert data.names == ["column0", "column1"] and data.nrows == 1000
+    assert np.array_equal(data.read([1])[0], x ** 2)
+
+    data = _datafile.DataFile(tmp_path / "data.npz", chunksize=300)
+    assert np.array_equal(data.read(["y", "x"])[1], x)
+
+
+# /def
+
+
+def test_envelope_reducer():
+
+    rng = np.random.RandomState(0)
+    y = np.cumsum(rng.randn(100000))
+    x = np.arange(len(y)) * 0.5
+
+    reducer = _datafile.EnvelopeReducer(100)  # unknown length
+    for i in range(0, len(y), 3333):
+        reducer.add(x[i : i + 3333], y[i : i + 3333])
+    xs, ys = reducer.result()
+
+    assert len(xs) <= 4 * 200
+    assert (xs[0], xs[-1]) == (x[0], x[-1])
+    assert (ys.min(), ys.max()) == (y.min(), y.max())
+    assert np.all(np.diff(xs) > 0)
+    assert np.all(np.isin(ys, y))
+
+
+# /def
+
+
+def test_plotfile_engine(tmp_path):
+
+    x = np.linspace(0, 10, 100000)
+    np.save(tmp_path / "data.npy", np.c_[x, np.sin(x), np.cos(x)])
+
+    plotfile(tmp_path / "data.npy", (0, 1, 2))
+    fig = pyplot.gcf()
+    pyplot.close("all")
+
+    assert [ax.get_ylabel() for ax in fig.axes] == ["column1", "column2"]
+    line = fig.axes[0].lines[0]
+    assert len(line.get_xdata()) < 4 * 1000
+    assert line.get_xdata()[-1] == 10
+
+
+# /def
+
+##############################################################################
+# END
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_errorbar
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+import pytest
+from matplotlib import pyplot
+from matplotlib.collections import LineCollection, PolyCollection
+
+## Project-Specific
+from starkplot import _errorbar
+from starkplot._plot import errorbar, plot
+
+
+#############################################################################
+# Errorbar
+
+
+def test_error_bounds():
+
+    y = np.arange(3.0)
+    assert np.allclose(_errorbar.error_bounds(y, 1), (y - 1, y + 1))
+    assert np.allclose(
+        _errorbar.error_bounds(y, [[1, 1, 1], [2, 2, 2]]), (y - 1, y + 2)
+    )
+    with pytest.raises(ValueError):
+        _errorbar.error_bounds(y, [1, 2])
+
+
+# /def
+
+
+def test_fast_errorbar():
+
+    rng = np.random.RandomState(0)
+    x = rng.uniform(0, 1, 5000)
+    y = rng.uniform(0, 1, 5000)
+
+    pyplot.figure(figsize=(2, 2), dpi=10)
+    container = errorbar(x, y, yerr=0.1, xerr=0.01, fmt=".", fast=True)
+    data_line, caplines, barcols = container
+
+    # merged into the 20 x 20 pixels of the figure, or fewer
+    assert len(data_line.get_xdata()) <= 400
+    assert all(isinstance(c, LineCollection) for c in barcols)
+    assert len(barcols[1].get_segments()) == len(data_line.get_xdata())
+
+    # spanning all the merged errorbars
+    segs = np.array(barcols[1].get_segments())
+    assert np.isclose(segs[:, :, 1].min(), y.min() - 0.1)
+    assert np.isclose(segs[:, :, 1].max(), y.max() + 0.1)
+
+    # the limit arguments aren't supported, so are left to matplotlib
+    container = errorbar(x[:5], y[:5], yerr=0.1, lolims=True, fast=True)
+    assert len(container[0].get_xdata()) == 5
+    pyplot.close("all")
+
+
+# /def
+
+
+def test_masked_errorbar():
+
+    x = np.linspace(0, 1, 20)
+    y = np.ma.masked_greater(np.sin(3 * x), 0.5)
+
+    fig, (ax1, ax2) = pyplot.subplots(1, 2)
+    ax1.errorbar(x, y, yerr=0.1)
+    errorbar(x, y, yerr=0.1, ax=ax2, fast=True)
+
+    # the masked points are neither drawn nor in the limits
+    assert np.allclose(ax2.get_ylim(), ax1.get_ylim())
+    assert np.nanmax(ax2.lines[0].get_ydata()) <= 0.5
+    pyplot.close(fig)
+
+
+# /def
+
+
+def test_error_bands():
+
+    x = np.linspace(0, 1, 1000)
+    y = x ** 2
+
+    pyplot.figure()
+    container = plot(
+        x, y, yerr=0.1, pltype="errorbar", bands=20, merge=False
+    )
+    (band,) = container[2]
+    assert isinstance(band, PolyCollection)
+    assert len(container[0].get_xdata()) == 1000
+    pyplot.close("all")
+
+
+# /def
+
+
+##############################################################################
+# END
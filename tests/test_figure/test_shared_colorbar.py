@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_shared_colorbar
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+from matplotlib import pyplot
+
+## Project-Specific
+import starkplot as splt
+from starkplot._figure import SharedNorm, shared_norm, shared_colorbar
+
+
+#############################################################################
+# SharedNorm
+
+
+def test_shared_norm():
+
+    norm = SharedNorm.from_data([np.arange(5.0), np.array([-3.0, np.nan])])
+    assert (norm.vmin, norm.vmax) == (-3, 4)
+    assert not norm.update(np.array([0.0, 1.0]))  # within the limits
+
+    # fixed limits stay
+    norm = SharedNorm(vmin=0)
+    norm.update(np.arange(-5.0, 5.0))
+    assert (norm.vmin, norm.vmax) == (0, 4)
+
+    # one norm per figure group
+    fig = pyplot.figure()
+    assert shared_norm("a", fig=fig) is shared_norm("a", fig=fig)
+    assert shared_norm("a", fig=fig) is not shared_norm("b", fig=fig)
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+
+def test_shared_colorbar():
+
+    fig, axs = pyplot.subplots(1, 3)
+    images = [
+        ax.imshow(np.arange(4.0).reshape(2, 2) * (i + 1))
+        for i, ax in enumerate(axs)
+    ]
+    cbars = [shared_colorbar(im, group="g", fig=fig) for im in images]
+
+    # one colorbar, spanning all the panels' data
+    assert len(fig.axes) == 4
+    assert cbars[0].ax not in fig.axes and cbars[-1].ax in fig.axes
+    assert all(im.norm is images[0].norm for im in images)
+    assert (images[0].norm.vmin, images[0].norm.vmax) == (0, 9)
+
+    # its space is taken from all the group's axes
+    widths = [ax.get_position().width for ax in axs]
+    assert np.allclose(widths, widths[0])
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+
+def test_decorator_cgroup():
+
+    fig, axs = pyplot.subplots(1, 2)
+    for i, ax in enumerate(axs):
+        splt.imshow(
+            np.arange(4.0).reshape(2, 2) + 10 * i,
+            ax=ax,
+            colorbar=True,
+            cgroup="g",
+        )
+
+    assert len(fig.axes) == 3
+    assert axs[0].images[0].norm.vmax == 13
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+###############################################################################
+### DONE
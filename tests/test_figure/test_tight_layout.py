@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_tight_layout
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+from matplotlib import pyplot
+
+## Project-Specific
+from starkplot._figure._tight_layout import (
+    cached_tight_layout,
+    layout_signature,
+    clear_layout_cache,
+    _layout_cache,
+)
+
+
+#############################################################################
+# cached_tight_layout
+
+
+def _make_figure(ylabel="y"):
+    fig, axs = pyplot.subplots(2, 2, figsize=(6, 4))
+    for ax in axs.flat:
+        ax.plot(np.arange(10))
+        ax.set_xlabel("x")
+        ax.set_ylabel(ylabel)
+    return fig
+
+
+# /def
+
+
+def test_cached_tight_layout():
+
+    clear_layout_cache()
+
+    # -----------------
+    # same as fig.tight_layout
+    fig = _make_figure()
+    fig.tight_layout()
+    expected = vars(fig.subplotpars).copy()
+    pyplot.close(fig)
+
+    fig = _make_figure()
+    cached_tight_layout(fig)
+    pyplot.close(fig)
+
+    fig = _make_figure()
+    cached_tight_layout(fig)  # from the cache
+    for k, v in expected.items():
+        assert np.allclose(getattr(fig.subplotpars, k), v)
+    assert len(_layout_cache) == 1
+
+    # -----------------
+    # a different label is a different layout
+    other = _make_figure(ylabel="a much longer label")
+    assert layout_signature(other) != layout_signature(fig)
+    cached_tight_layout(other)
+    assert len(_layout_cache) == 2
+
+    pyplot.close(fig)
+    pyplot.close(other)
+
+    # -----------------
+    # the signature doesn't change the axes' formatters
+    fig, ax = pyplot.subplots()
+    ax.plot([1e5, 2e5], [0, 1])
+    formatter = ax.xaxis.get_major_formatter()
+    locs = list(formatter.locs)
+    layout_signature(fig)
+    assert list(formatter.locs) == locs
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+###############################################################################
+### DONE
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_graph
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import threading
+
+import numpy as np
+
+# matplotlib
+from matplotlib import pyplot
+from matplotlib.collections import LineCollection
+
+## Project-Specific
+import starkplot as splt
+from starkplot import _graph
+
+
+##############################################################################
+### Tests
+
+
+def test_figure_graph():
+    x = np.linspace(0, 1, 20)
+
+    with splt.FigureGraph() as graph:
+        nodes = [
+            splt.plot(x, i * x, color="k", title="lines", xlim=(0, 1))
+            for i in range(10)
+        ]
+        splt.plot(x, x, "r--", label="red")
+        splt.plot([], [], color="b")  # hidden
+        splt.scatter(x, x, title="final", xlabel="x")
+
+    assert len(graph) == 13
+    assert not pyplot.gca().lines  # nothing plotted yet
+
+    graph.render()
+    ax = pyplot.gca()
+    assert len(graph) == 0
+
+    # the black lines are merged, the hidden line dropped
+    assert nodes[0].result is nodes[-1].result
+    assert isinstance(nodes[0].result, LineCollection)
+    assert len(nodes[0].result.get_segments()) == 10
+    assert len(ax.lines) == 1 and len(ax.collections) == 2
+
+    # the settings are merged
+    assert ax.get_title() == "final"
+    assert ax.get_xlabel() == "x"
+    assert ax.get_xlim() == (0, 1)
+    assert ax.get_ylim()[1] > 9
+
+    pyplot.close("all")
+
+
+# /def
+
+
+def test_figure_graph_int_data():
+    with splt.FigureGraph() as graph:  # integer lists
+        first = splt.plot([0, 1, 2], [1, 2, 3], color="k")
+        splt.plot([0, 1, 2], [3, 2, 1], color="k")
+
+    graph.render()
+    segments = first.result.get_segments()
+    assert len(segments) == 2
+    np.testing.assert_array_equal(segments[1], [[0, 3], [1, 2], [2, 1]])
+
+    pyplot.close("all")
+
+
+# /def
+
+
+def test_figure_graph_save(tmp_path):
+    with splt.FigureGraph():
+        splt.plot([0, 1], [0, 1], title="saved")
+
+    splt.save_figure(str(tmp_path / "plot.png"))  # renders the graph
+    assert pyplot.gca().get_title() == "saved"
+    assert splt.render() == []
+
+    pyplot.close("all")
+
+
+# /def
+
+
+def test_figure_graph_per_thread():
+    pyplot.close("all")
+    graphs = []
+
+    def record():
+        with splt.FigureGraph() as graph:
+            splt.plot([0, 1], [0, 1])
+        graphs.append(graph)
+
+    thread = threading.Thread(target=record)
+    thread.start()
+    thread.join()
+
+    # only this thread's graphs are rendered
+    assert splt.render() == []
+    assert len(graphs[0]) == 1
+
+    pyplot.close("all")
+
+
+# /def
+
+
+def test_hidden_array_alpha():
+    x = np.arange(3.0)
+    with splt.FigureGraph() as graph:
+        splt.scatter(x, x, color="k", alpha=np.zeros(3))
+        splt.scatter(x, x, color="k", alpha=np.array([0, 0.5, 1]))
+
+    assert [_graph._hidden(node) for node in graph.nodes] == [True, False]
+    graph.nodes = []
+    graph.render()  # nothing, no longer pending
+
+    pyplot.close("all")
+
+
+# /def
+
+
+##############################################################################
+# END
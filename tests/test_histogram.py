@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_histogram
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+from matplotlib import pyplot
+
+## Project-Specific
+from starkplot import _histogram
+
+
+#############################################################################
+# histogram engine
+
+_rng = np.random.RandomState(0)
+_x = _rng.randn(20000)
+_y = 2 * _rng.randn(20000) + _x
+
+
+class _ArrayLike(object):
+    def __init__(self, arr):
+        self.arr = arr
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.arr, dtype=dtype)
+
+    def __iter__(self):
+        return iter(self.arr)
+
+
+def test_hist():
+
+    fig, ax = pyplot.subplots()
+
+    n, bins, _ = ax.hist(_x, bins=25)
+    n1, bins1, _ = _histogram.hist(ax, _x, bins=25, chunksize=3000)
+    assert np.array_equal(n, n1) and np.allclose(bins, bins1)
+
+    # iterator of chunks
+    chunks = iter(np.array_split(_x, 7))
+    counts, _ = _histogram.histogram(chunks, bins=25, range=bins[[0, -1]])
+    assert np.array_equal(n, counts)
+
+    # array-likes (ex: pandas Series) aren't iterators of chunks
+    arraylike = _ArrayLike(_x)
+    assert _histogram.use_engine(iter([_x]))
+    assert not _histogram.use_engine(arraylike)
+    n1, _, _ = _histogram.hist(ax, arraylike, bins=25, chunksize=3000)
+    assert np.array_equal(n, n1)
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+
+def test_hist2d():
+
+    fig, ax = pyplot.subplots()
+
+    h = ax.hist2d(_x, _y, bins=[10, 15])[0]
+    h1 = _histogram.hist2d(ax, _x, _y, bins=[10, 15], chunksize=3000)[0]
+    assert np.array_equal(h, h1)
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+
+def test_hexbin():
+
+    fig, ax = pyplot.subplots()
+
+    for kw in ({}, {"mincnt": 2}):
+        c = ax.hexbin(_x, _y, gridsize=15, **kw)
+        c1 = _histogram.hexbin(ax, _x, _y, gridsize=15, chunksize=3000, **kw)
+        assert np.array_equal(c.get_array(), c1.get_array())
+        assert np.allclose(c.get_offsets(), c1.get_offsets())
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+###############################################################################
+### DONE
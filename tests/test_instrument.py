@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_instrument
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import json
+
+import numpy as np
+
+# matplotlib
+from matplotlib import pyplot
+
+## Project-Specific
+import starkplot as splt
+
+
+##############################################################################
+### Tests
+
+
+def test_call_stats():
+    x = np.linspace(0, 1, 1000)
+    splt.reset_call_stats()
+    pyplot.subplots()
+
+    with splt.instrumentation():
+        splt.plot(x, x)
+        splt.plot(x, x ** 2)
+        splt.scatter(x, x)
+    splt.plot(x, x)  # not measured
+
+    stats = splt.call_stats()
+    assert set(stats) == {"plot", "scatter"}
+    assert stats["plot"]["calls"] == 2
+    assert stats["plot"]["artists"] == 2
+    assert stats["plot"]["vertices"] == 2000
+    assert stats["plot"]["nbytes"] >= 2 * 2 * x.nbytes
+    assert stats["plot"]["peak_memory_max"] > 0
+    assert stats["scatter"]["artists"] == 1
+
+    text = splt.export_call_stats(format="csv")
+    assert text.splitlines()[0].startswith("name,calls,time")
+    assert json.loads(splt.export_call_stats(format="json")) == stats
+
+    splt.reset_call_stats()
+    pyplot.close("all")
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_legend
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import io
+
+import numpy as np
+from matplotlib import pyplot
+from matplotlib.legend import Legend
+
+## Project-Specific
+import starkplot as splt
+from starkplot._axes._legend import DeferredLegend, register_legend_handles
+
+
+#############################################################################
+# register_legend_handles
+
+
+def test_register_legend_handles():
+
+    fig, ax = pyplot.subplots()
+
+    ax.plot(np.arange(3), label="a")
+    register_legend_handles(ax, loc="upper left")
+    ax.scatter(np.arange(3), np.arange(3), label="b")
+    ax.plot(np.arange(3), label="_hidden")
+    legend = register_legend_handles(ax)
+
+    # -----------------
+    # deferred, with the options of earlier calls
+    assert isinstance(legend, DeferredLegend)
+    assert isinstance(legend, Legend)
+    assert ax.get_legend() is legend
+    assert [t.get_text() for t in legend.get_texts()] == ["a", "b"]
+    assert legend._loc == 2  # upper left
+
+    # -----------------
+    # removed handles are dropped, and edits kept
+    legend.set_title("title")
+    ax.lines[0].remove()
+    ax.plot(np.arange(3), label="c")
+    assert register_legend_handles(ax) is legend
+    assert [t.get_text() for t in legend.get_texts()] == ["b", "c"]
+    assert legend.get_title().get_text() == "title"
+
+    # -----------------
+    # drawn with the figure
+    fig.savefig(io.BytesIO(), format="png")
+    assert legend.get_window_extent().width > 0
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+
+def test_legend_after_cla():
+
+    fig, ax = pyplot.subplots()
+
+    splt.plot(np.arange(3), label="a", ax=ax)
+    register_legend_handles(ax)
+    ax.cla()  # the lines keep their axes
+    splt.plot(np.arange(3), label="b", legend=True, ax=ax)
+
+    legend = ax.get_legend()
+    assert [t.get_text() for t in legend.get_texts()] == ["b"]
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+###############################################################################
+### DONE
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_levels
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+import pytest
+from matplotlib import pyplot
+
+## Project-Specific
+from starkplot import _levels
+from starkplot._plot import contour, contourf
+
+
+#############################################################################
+# Levels
+
+
+def test_parse_credible_levels():
+
+    assert _levels.parse_credible_levels("sigma") == _levels.sigma_masses()
+    assert np.allclose(
+        _levels.parse_credible_levels("sigma:2,1"), (0.682689, 0.954500)
+    )
+    assert _levels.parse_credible_levels([0.9, 0.5]) == (0.5, 0.9)
+
+    with pytest.raises(ValueError):
+        _levels.parse_credible_levels("sigmas")
+    with pytest.raises(ValueError):
+        _levels.parse_credible_levels([1.5])
+
+
+# /def
+
+
+def test_credible_levels():
+
+    _levels.clear_levels_cache()
+    x, y = np.mgrid[-6:6:301j, -6:6:301j]
+    grid = np.exp(-(x ** 2 + y ** 2) / 2)
+
+    # the 2D Gaussian encloses mass m within density exp(-r^2/2) = 1 - m
+    masses = (0.5, 0.9)
+    levels = _levels.credible_levels(grid, masses)
+    assert np.all(np.diff(levels) > 0)
+    assert np.allclose(levels, [0.1, 0.5], atol=2e-3)
+
+    # the grid is sorted once
+    sorted_ = _levels._mass_cache.get(grid, "mass", None)
+    _levels.credible_levels(grid, "sigma")
+    assert _levels._mass_cache.get(grid, "mass", None) is sorted_
+
+
+# /def
+
+
+def test_credible_contours():
+
+    x, y = np.mgrid[-3:3:51j, -3:3:51j]
+    grid = np.exp(-(x ** 2 + y ** 2) / 2)
+    expected = _levels.credible_levels(grid, "sigma")
+
+    fig = pyplot.figure()
+    cs = contour(x, y, grid, levels="sigma")
+    assert np.allclose(cs.levels, expected)
+
+    cs = contourf(grid, 4, credible_levels="sigma")  # replaces 4
+    assert np.allclose(cs.levels, np.r_[expected, grid.max()])
+    pyplot.close(fig)
+
+
+# /def
+
+##############################################################################
+# END
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_lifecycle
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import pytest
+
+# matplotlib
+from matplotlib import pyplot
+
+## Project-Specific
+import starkplot as splt
+
+
+##############################################################################
+### Tests
+
+
+def test_figure_limits(tmp_path):
+    pyplot.close("all")
+    old = splt.set_figure_limits(max_figures=2)
+    try:
+        for i in range(4):  # saved, so the oldest are closed
+            splt.plot([0, 1], [0, i], fig="new", savefig=str(tmp_path / "a"))
+        assert len(pyplot.get_fignums()) == 2
+
+        # plotting on a saved figure makes it unsaved
+        splt.plot([0, 1], [1, 0], fig=pyplot.gcf())
+        assert len(splt.leaked_figures(saved=False)) == 1
+
+        pyplot.close("all")
+        with pytest.warns(RuntimeWarning, match="unsaved"):
+            for i in range(3):  # unsaved figures are kept, & reported
+                splt.plot([0, 1], [0, i], fig="new")
+        assert len(pyplot.get_fignums()) == 3
+
+        leaks = splt.leaked_figures(saved=False)
+        assert len(leaks) == 3
+        assert "test_figure_limits" in splt.report_leaks()
+    finally:
+        splt.set_figure_limits(**old)
+        pyplot.close("all")
+
+
+# /def
+
+
+##############################################################################
+# END
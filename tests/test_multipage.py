@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_multipage
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import re
+
+import numpy as np
+
+# matplotlib
+from matplotlib import pyplot
+
+## Project-Specific
+import starkplot as splt
+
+
+##############################################################################
+### Tests
+
+
+def test_multipage_pdf(tmp_path):
+    fname = str(tmp_path / "pages.pdf")
+    x = np.linspace(0, 1, 10)
+
+    with splt.MultipagePDF(fname) as pdf:
+        for i in range(3):
+            splt.plot(x, i * x, fig="new", title=str(i), savefig=pdf)
+        assert pyplot.get_fignums() == []  # closed once appended
+
+        pyplot.figure()
+        splt.save_figure(pdf)
+
+        with splt.FigureGraph():  # deferred
+            splt.plot(x, x, savefig=pdf)
+        splt.render()
+
+        assert pdf.get_pagecount() == 5
+
+    with open(fname, "rb") as file:
+        assert len(re.findall(rb"/Type /Page[^s]", file.read())) == 5
+
+    pyplot.close("all")
+
+
+# /def
+
+
+def test_multipage_pdf_and_file(tmp_path):
+    pyplot.close("all")
+    fname = tmp_path / "a.png"
+
+    with splt.MultipagePDF(str(tmp_path / "pages.pdf")) as pdf:
+        fig = pyplot.figure(figsize=(2, 2))
+        fig.gca().plot([0, 1], [0, 1], lw=10)
+        splt.savefig(pdf, str(fname))  # the page doesn't close it first
+
+    assert not pyplot.fignum_exists(fig.number)  # once both are saved
+    image = pyplot.imread(str(fname))
+    assert np.any(image[..., :3] < 1)  # not blank
+
+    # the closed figure isn't made again, as the current figure
+    with splt.MultipagePDF(str(tmp_path / "more.pdf")) as pdf:
+        fig = pyplot.figure()
+        splt.plot([0, 1], [0, 1], fig=fig, savefig=pdf)
+    assert pyplot.get_fignums() == []
+
+    pyplot.close("all")
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_preclip
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+
+# matplotlib
+from matplotlib import pyplot
+
+## Project-Specific
+import starkplot as splt
+from starkplot._preclip import clip_index
+
+
+##############################################################################
+### Tests
+
+
+def test_clip_index():
+    x = np.arange(10.0)
+    y = np.array([0, 0, 5, 5, 0, 0, 0, 5, 0, 0], dtype=float)
+
+    # one point past each boundary, and a break where points are dropped
+    index, breaks = clip_index(x, y, window=((2, 7), None))
+    np.testing.assert_array_equal(index, np.arange(1, 9))
+    assert len(breaks) == 0
+
+    index, breaks = clip_index(x, y, window=(None, (4, 6)))
+    np.testing.assert_array_equal(index, [1, 2, 3, 4, 6, 7, 8])
+    np.testing.assert_array_equal(breaks, [4])
+
+    # segments crossing the window, with both ends outside it
+    index, breaks = clip_index(
+        np.array([-2.0, -1, 2, 3]), np.zeros(4), window=((0, 1), None)
+    )
+    np.testing.assert_array_equal(index, [1, 2])
+    assert len(breaks) == 0
+
+    # points aren't kept past the boundary without lines
+    index, _ = clip_index(x, y, window=((2, 7), None), connected=False)
+    np.testing.assert_array_equal(index, np.arange(2, 8))
+
+    # errorbars reaching the window are kept
+    index, _ = clip_index(
+        x, y, window=(None, (4, 6)), yerr=np.full(10, 1.5), connected=False
+    )
+    np.testing.assert_array_equal(index, [2, 3, 7])
+
+    # nothing dropped
+    index, _ = clip_index(x, y, window=((-1, 10), None))
+    assert index is None
+
+
+# /def
+
+
+def test_preclip_plot():
+    x = np.linspace(0, 100, 10001)
+
+    splt.plot(x, np.sin(x), xlim=(10, 20), preclip=True)
+    xdata = pyplot.gca().lines[0].get_xdata()
+    assert len(xdata) == 1003
+    assert xdata[0] < 10 and xdata[-1] > 20
+    assert pyplot.gca().get_xlim() == (10, 20)
+    pyplot.close("all")
+
+    colls = splt.scatter(x, x, c=x, xlim=(10, 20), preclip=True)
+    assert len(colls.get_offsets()) == len(colls.get_array()) == 1001
+    pyplot.close("all")
+
+    splt.plot([-1, 2], [0, 0], xlim=(0, 1), preclip=True)  # sparse
+    np.testing.assert_array_equal(pyplot.gca().lines[0].get_xdata(), [-1, 2])
+    pyplot.close("all")
+
+    splt.plot(x, np.sin(x), xlim=(10, 20))  # not clipped by default
+    assert len(pyplot.gca().lines[0].get_xdata()) == len(x)
+    pyplot.close("all")
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_pyramid
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import gc
+import io
+
+import numpy as np
+import pytest
+from matplotlib import pyplot
+from matplotlib.collections import QuadMesh
+
+## Project-Specific
+import starkplot as splt
+from starkplot import _pyramid
+
+
+#############################################################################
+# ImagePyramid
+
+
+def test_block_mean_levels():
+
+    data = np.arange(7 * 10, dtype=float).reshape(7, 10)
+    pyr = _pyramid.ImagePyramid(data, factor=2, min_size=2)
+
+    assert pyr.nlevels == 4
+    assert pyr.level_shape(1) == (4, 5)
+
+    level = pyr.level(1)
+    assert np.allclose(level[0, 0], data[:2, :2].mean())
+    assert np.allclose(level[-1, -1], data[6:, 8:].mean())  # partial block
+
+    # crops of a level match the level
+    assert np.allclose(pyr.crop(1, (1, 3), (2, 5)), level[1:3, 2:5])
+
+    return
+
+
+# /def
+
+
+def test_pyramid_image_levels():
+
+    data = np.random.RandomState(0).rand(1200, 1600)
+    fig, ax = pyplot.subplots(figsize=(2, 2), dpi=100)
+    im = _pyramid.imshow(ax, data)
+
+    # -----------------
+    # zoomed out, a coarse level
+    fig.savefig(io.BytesIO(), format="png")
+    k, rows, cols = im._view
+    assert k > 0
+    assert im.get_array().shape[0] < data.shape[0]
+
+    # -----------------
+    # zoomed in, full resolution
+    ax.set_xlim(100, 150)
+    ax.set_ylim(250, 200)
+    fig.savefig(io.BytesIO(), format="png")
+    assert im._view[0] == 0
+    (r0, r1), (c0, c1) = im._view[1:]
+    assert np.allclose(im.get_array(), data[r0:r1, c0:c1])
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+
+def test_pyramid_pcolormesh_options(monkeypatch):
+
+    data = np.random.RandomState(0).rand(20, 30)
+    fig, ax = pyplot.subplots()
+
+    # options drawn as an image are dropped, others aren't drawn
+    im = _pyramid.pcolormesh(ax, data, shading="flat", edgecolors="None")
+    assert isinstance(im, _pyramid.PyramidImage)
+    for kw in ({"shading": "gouraud"}, {"edgecolors": "k"}, {"linewidth": 2}):
+        with pytest.raises(ValueError):
+            _pyramid.pcolormesh(ax, data, **kw)
+
+    # so those are left to matplotlib, for big arrays
+    monkeypatch.setattr(_pyramid, "_pyramid_threshold", 100)
+    assert isinstance(splt.pcolormesh(data, ax=ax), _pyramid.PyramidImage)
+    assert isinstance(splt.pcolormesh(data, ax=ax, edgecolors="k"), QuadMesh)
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+
+def test_pyramid_cache_release():
+
+    _pyramid._pyramid_cache.clear()
+    image = np.random.RandomState(1).rand(300, 400)
+    pyr = _pyramid.image_pyramid(image, factor=2)
+    pyr.level(1)
+
+    # the levels are shared, but the cache doesn't keep the image
+    assert _pyramid.image_pyramid(image, factor=2)._levels is pyr._levels
+    del image, pyr
+    gc.collect()
+    assert not _pyramid._pyramid_cache._cache
+
+    return
+
+
+# /def
+
+###############################################################################
+### DONE
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_quantile
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+from matplotlib import pyplot
+
+## Project-Specific
+from starkplot._quantile import (
+    QuantileSketch,
+    quantile_sketch,
+    robust_limits,
+    parse_auto_limits,
+)
+from starkplot._util import set_ylim
+
+
+#############################################################################
+# QuantileSketch
+
+
+def test_sketch_rank_error(monkeypatch):
+
+    x = np.random.RandomState(0).standard_cauchy(500_000)
+    xs = np.sort(x)
+
+    sketch = QuantileSketch().update(x)
+    assert sketch.n == x.size
+    for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+        rank = np.searchsorted(xs, sketch.quantile(q)) / x.size
+        assert abs(rank - q) < 5e-3
+
+    # -----------------
+    # merging chunks is equivalent
+    merged = quantile_sketch(np.array_split(x, 7), cache=False)
+    assert merged.n == x.size
+    rank = np.searchsorted(xs, merged.quantile(0.5)) / x.size
+    assert abs(rank - 0.5) < 5e-3
+
+    # -----------------
+    # a list of numbers is an array, not chunks
+    merges = []
+    merge = QuantileSketch.merge
+    monkeypatch.setattr(
+        QuantileSketch, "merge", lambda *a: merges.append(a) or merge(*a)
+    )
+    sketch = quantile_sketch(list(x[:5000]))
+    assert sketch.n == 5000 and not merges
+
+    return
+
+
+# /def
+
+
+def test_robust_limits():
+
+    assert parse_auto_limits("auto") == (0.0, 100.0)
+    assert parse_auto_limits("auto:99") == (0.5, 99.5)
+    assert parse_auto_limits("auto:1:98") == (1.0, 98.0)
+    try:
+        parse_auto_limits("auto:a")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("parsed an invalid limits string")
+
+    x = np.arange(1001.0)
+    x[0] = -1e10  # an outlier
+    lo, hi = robust_limits(x, (1, 100))
+    assert 0 < lo < 20 and hi == 1000
+    assert robust_limits(np.array([np.nan])) == (None, None)
+
+    # exact for small in-memory arrays
+    x = np.random.RandomState(1).randn(5000)
+    assert robust_limits(x, (1, 99)) == tuple(np.percentile(x, (1, 99)))
+
+    return
+
+
+# /def
+
+
+def test_set_ylim_auto():
+
+    fig, ax = pyplot.subplots()
+    y = np.linspace(0, 1, 1001)
+    y[-1] = 1e6  # an outlier
+    ax.plot(y)
+
+    set_ylim(ax=ax, y="auto:98")
+    lo, hi = ax.get_ylim()
+    assert 0 <= lo < 0.05 and 0.95 < hi < 1.05
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+###############################################################################
+### DONE
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_rasterize
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+
+# matplotlib
+from matplotlib import pyplot
+
+## Project-Specific
+import starkplot as splt
+from starkplot._figure._rasterize import artist_size, raster_savefig_kw
+
+
+##############################################################################
+### Tests
+
+
+def test_artist_size():
+    fig, ax = pyplot.subplots()
+    (line,) = ax.plot(np.arange(50))
+    scat = ax.scatter(np.arange(20), np.arange(20))
+    mesh = ax.pcolormesh(np.zeros((4, 6)))
+    fill = ax.fill_between(np.arange(30), 0, 1)
+    text = ax.text(0, 0, "text")
+
+    assert artist_size(line) == 50
+    assert artist_size(scat) == 20
+    assert artist_size(mesh) == 24
+    assert artist_size(fill) >= 60  # one path, many vertices
+    assert artist_size(text) == 0
+
+    pyplot.close("all")
+
+
+# /def
+
+
+def test_rasterize_heavy():
+    fig, ax = pyplot.subplots()
+    (small,) = ax.plot(np.arange(10))
+    big = ax.scatter(np.arange(1000), np.arange(1000))
+
+    assert splt.rasterize_heavy(fig) == []  # policy off by default
+    assert splt.rasterize_heavy(fig, True) == []  # the default threshold
+    assert splt.rasterize_heavy(fig, 100) == [big]
+    assert big.get_rasterized() and not small.get_rasterized()
+
+    kw = raster_savefig_kw("plot.pdf", fig, 100)
+    assert kw["dpi"] == splt.get_rasterize_policy()["dpi"]
+    assert raster_savefig_kw("plot.png", fig, 100) == {}
+    assert raster_savefig_kw("plot.pdf", fig, 100, dpi=72) == {"dpi": 72}
+    assert raster_savefig_kw("plot.pdf", fig, False) == {}
+
+    old = splt.set_rasterize_policy(100, dpi=150)
+    try:
+        assert raster_savefig_kw("plot.svg", fig)["dpi"] == 150
+        assert splt.rasterize_heavy(fig, True) == [big]
+    finally:
+        splt.set_rasterize_policy(**old)
+
+    pyplot.close("all")
+
+
+# /def
+
+
+def test_decorator_rasterize_above(tmp_path):
+    fname = str(tmp_path / "plot.svg")
+    splt.scatter(
+        np.arange(1000), np.arange(1000), rasterize_above=100, savefig=fname
+    )
+    assert splt.gca().collections[0].get_rasterized()
+    with open(fname) as file:
+        assert "<image" in file.read()
+
+    pyplot.close("all")
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_spectral
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+from matplotlib import mlab, pyplot
+
+## Project-Specific
+from starkplot import _spectral
+from starkplot._plot import psd
+
+
+#############################################################################
+# Engine
+
+
+def _chunked(x, n):
+    return (x[i : i + n] for i in range(0, len(x), n))
+
+
+# /def
+
+
+class _ArrayLike(object):
+    def __init__(self, arr):
+        self.arr = arr
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.arr, dtype=dtype)
+
+    def __iter__(self):
+        return iter(self.arr)
+
+    def __len__(self):
+        return len(self.arr)
+
+
+# /class
+
+
+def test_welch_matches_mlab():
+
+    rng = np.random.RandomState(0)
+    x = rng.randn(20011)
+    y = np.roll(x, 5) + rng.randn(len(x))
+
+    kw = dict(NFFT=128, noverlap=32, Fs=10, detrend="mean")
+    pxx, freqs = mlab.psd(x, **kw)
+    got, gfreqs = _spectral.welch(_chunked(x, 999), batchsize=7, **kw)
+    assert np.allclose(got, pxx)
+    assert np.allclose(gfreqs, freqs)
+
+    kw = dict(NFFT=255, pad_to=300, sides="twosided", scale_by_freq=False)
+    pxy, freqs = mlab.csd(x, y, **kw)
+    assert np.allclose(_spectral.welch(x, y, chunksize=1000, **kw)[0], pxy)
+
+    cxy, freqs = mlab.cohere(x, y, NFFT=256)
+    assert np.allclose(_spectral.coherence(x, y, NFFT=256)[0], cxy)
+
+
+# /def
+
+
+def test_spectrogram():
+
+    x = np.random.RandomState(1).randn(30000)
+
+    for mode in (None, "magnitude", "phase"):
+        spec, freqs, t = mlab.specgram(x, mode=mode)
+        got, gfreqs, gt = _spectral.spectrogram(x, mode=mode, chunksize=4000)
+        assert np.allclose(got, spec)
+        assert np.allclose(gt, t)
+
+    # averaged down to the width
+    spec, freqs, t = mlab.specgram(x)
+    got, _, gt = _spectral.spectrogram(x, width=50)
+    group = int(np.ceil(spec.shape[1] / 50))
+    assert got.shape[1] <= 50
+    assert np.allclose(got[:, 0], spec[:, :group].mean(axis=1))
+
+    # iterators of unknown length stay within twice the width
+    got, _, gt = _spectral.spectrogram(_chunked(x, 1000), width=50)
+    assert 25 < got.shape[1] <= 100
+    group = int(round((gt[1] - gt[0]) / (t[1] - t[0])))
+    assert np.allclose(got[:, 0], spec[:, :group].mean(axis=1))
+
+
+# /def
+
+
+def test_psd_wrapper_engine():
+
+    x = np.random.RandomState(2).randn(10000)
+
+    fig = pyplot.figure()
+    pxx, freqs = psd(x, NFFT=256, engine=False)
+    got, gfreqs = psd(x, NFFT=256, engine=True)
+    pyplot.close(fig)
+
+    assert np.allclose(got, pxx)
+    assert len(fig.axes[0].lines) == 2
+
+    # array-likes (ex: pandas Series) aren't iterators of chunks
+    arraylike = _ArrayLike(x)
+    assert _spectral.use_engine(_chunked(x, 1000))
+    assert not _spectral.use_engine(arraylike)
+    got, _ = _spectral.welch(arraylike, NFFT=256, chunksize=3000)
+    assert np.allclose(got, pxx)
+
+
+# /def
+
+##############################################################################
+# END
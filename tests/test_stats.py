@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_stats
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+import pytest
+from matplotlib import pyplot, cbook, mlab
+
+## Project-Specific
+from starkplot import _stats
+from starkplot._quantile import QuantileSketch
+from starkplot._plot import boxplot, violinplot
+
+
+#############################################################################
+# Statistics
+
+
+def _datasets():
+    rng = np.random.RandomState(1)
+    X = [rng.normal(i % 3, 1 + i % 2, size=50 * (i + 1)) for i in range(8)]
+    X[2] = np.array([])
+    X[3] = np.ones(4)
+    return X
+
+
+# /def
+
+
+@pytest.mark.parametrize("whis", [1.5, "range", (5, 95)])
+def test_boxplot_stats(whis):
+
+    X = _datasets()
+    expected = cbook.boxplot_stats(X, whis=whis, autorange=True)
+    stats = _stats.boxplot_stats(X, whis=whis, autorange=True)
+
+    for exp, res in zip(expected, stats):
+        assert exp.keys() == res.keys()
+        for key in exp:
+            if key == "fliers":
+                assert np.allclose(np.sort(exp[key]), res[key])
+            else:
+                assert np.allclose(exp[key], res[key], equal_nan=True)
+
+
+# /def
+
+
+def test_group_labels():
+
+    rng = np.random.RandomState(2)
+    values = rng.normal(size=1000)
+    labels = rng.choice(["b", "a"], size=1000)
+    values[:3] = np.nan  # ignored
+
+    stats = _stats.boxplot_stats(values, groups=labels)
+    assert [s["label"] for s in stats] == ["a", "b"]
+
+    a = values[(labels == "a") & ~np.isnan(values)]
+    assert np.isclose(stats[0]["med"], np.median(a))
+    assert np.isclose(stats[0]["mean"], np.mean(a))
+
+
+# /def
+
+
+def test_violin_stats():
+
+    X = _datasets()[3:]
+
+    def method(x, coords):
+        if np.all(x[0] == x):
+            return (x[0] == coords).astype(float)
+        return mlab.GaussianKDE(x).evaluate(coords)
+
+    expected = cbook.violin_stats(X, method)
+    stats = _stats.violin_stats(X)
+
+    for exp, res in zip(expected, stats):
+        for key in ("coords", "mean", "median", "min", "max"):
+            assert np.allclose(exp[key], res[key])
+        atol = 1e-3 * exp["vals"].max()
+        assert np.allclose(exp["vals"], res["vals"], atol=atol)
+
+    with pytest.raises(ValueError):
+        _stats.violin_stats([[1.0, 2.0], []])
+
+
+# /def
+
+
+def test_sketch_stats():
+
+    rng = np.random.RandomState(3)
+    data = [rng.normal(i, 1, size=20000) for i in range(3)]
+    sketches = [QuantileSketch(k=512).update(x) for x in data]
+
+    for exp, res in zip(
+        cbook.boxplot_stats(data), _stats.boxplot_stats(sketches)
+    ):
+        for key in ("mean", "q1", "med", "q3", "whislo", "whishi"):
+            assert np.isclose(exp[key], res[key], atol=0.1)
+        assert len(res["fliers"]) == 0
+
+    for exp, res in zip(
+        _stats.violin_stats(data), _stats.violin_stats(sketches)
+    ):
+        assert np.allclose(exp["coords"], res["coords"])
+        assert np.allclose(exp["vals"], res["vals"], atol=0.02)
+
+
+# /def
+
+
+#############################################################################
+# Plotting
+
+
+def test_plots():
+
+    rng = np.random.RandomState(4)
+    values = rng.normal(size=2000)
+    labels = rng.randint(0, 40, size=2000)
+
+    pyplot.figure()
+    artists = boxplot(values, groups=labels, sym="r+")
+    assert len(artists["boxes"]) == 40
+    assert artists["fliers"][0].get_marker() == "+"
+
+    stats = _stats.boxplot_stats(values, groups=labels)
+    artists = boxplot(stats[:5])
+    assert len(artists["boxes"]) == 5
+
+    artists = violinplot(values, groups=labels, showmedians=True)
+    assert len(artists["bodies"]) == 40
+    pyplot.close("all")
+
+
+# /def
+
+
+##############################################################################
+# END
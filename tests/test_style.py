@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_style
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import os
+from matplotlib import rcParams
+
+## Project-Specific
+from starkplot._style import style_context, compile_style
+
+
+#############################################################################
+# style_context
+
+
+def test_style_context_restores():
+
+    old = rcParams["lines.linewidth"]
+    rcParams["lines.linewidth"] = 3.0
+
+    with style_context("default"):
+        assert rcParams["lines.linewidth"] == 1.5
+    assert rcParams["lines.linewidth"] == 3.0
+
+    with style_context(["ggplot", {"lines.color": "r"}]):
+        assert rcParams["lines.color"] == "r"
+    assert rcParams["lines.color"] != "r"
+
+    rcParams["lines.linewidth"] = old
+
+    return
+
+
+# /def
+
+
+def test_compile_style_mtime(tmp_path):
+
+    fname = str(tmp_path / "test.mplstyle")
+    with open(fname, "w") as f:
+        f.write("lines.linewidth: 7\n")
+
+    rc = compile_style(fname)
+    assert rc["lines.linewidth"] == 7
+    assert compile_style(fname) is rc  # cached
+
+    with open(fname, "w") as f:
+        f.write("lines.linewidth: 8\n")
+    os.utime(fname, ns=(0, os.stat(fname).st_mtime_ns + 10 ** 9))
+
+    with style_context(fname):
+        assert rcParams["lines.linewidth"] == 8
+
+    return
+
+
+# /def
+
+###############################################################################
+### DONE
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_triangulation
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import pickle
+
+import numpy as np
+from matplotlib import pyplot
+
+## Project-Specific
+from starkplot import _triangulation
+from starkplot._plot import tricontourf, tripcolor
+
+
+#############################################################################
+# Triangulation
+
+
+def test_triangulation_cache():
+
+    _triangulation.clear_triangulation_cache()
+    rng = np.random.RandomState(0)
+    x, y = rng.rand(2, 200)
+
+    tri = _triangulation.triangulation(x, y)
+    assert tri.is_delaunay
+    assert _triangulation.triangulation(x.copy(), list(y)) is tri
+
+    # masks reuse the Delaunay triangles
+    mask = np.zeros(len(tri.triangles), dtype=bool)
+    mask[:5] = True
+    masked = _triangulation.triangulation(x, y, mask=mask)
+    assert masked is not tri
+    assert masked.triangles is tri.triangles
+    assert np.array_equal(masked.mask, mask)
+    assert tri.mask is None
+
+    # in-place changes are a different triangulation
+    x[0] += 1
+    assert _triangulation.triangulation(x, y) is not tri
+
+
+# /def
+
+
+def test_wrappers_share_triangulation():
+
+    _triangulation.clear_triangulation_cache()
+    rng = np.random.RandomState(1)
+    x, y = rng.rand(2, 100)
+
+    fig = pyplot.figure()
+    tricontourf(x, y, x * y, 5)
+    pc = tripcolor(x, y, x + y, shading="gouraud")
+    pyplot.close(fig)
+
+    tri = _triangulation.triangulation(x, y)
+    assert len(_triangulation._triangulation_cache) == 1
+    assert pc._triangulation is tri
+
+
+# /def
+
+
+def test_register_pickled_triangulation():
+
+    _triangulation.clear_triangulation_cache()
+    rng = np.random.RandomState(2)
+    x, y = rng.rand(2, 50)
+
+    tri = _triangulation.triangulation(x, y)
+    tri.get_cpp_triangulation()  # made when used
+    shared = pickle.loads(pickle.dumps(tri))
+
+    _triangulation.clear_triangulation_cache()
+    assert _triangulation.register_triangulation(shared) is shared
+    assert _triangulation.triangulation(x, y) is shared
+
+
+# /def
+
+##############################################################################
+# END
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_units
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+from matplotlib import pyplot
+from astropy import units as u
+from astropy.visualization import quantity_support
+
+## Project-Specific
+from starkplot._units import to_axis_value, strip_plot_args, strip_args
+
+
+#############################################################################
+# Quantity fast path
+
+
+def test_strip_plot_args():
+
+    with quantity_support():
+        fig, ax = pyplot.subplots()
+
+        x = np.arange(5.0) * u.s
+        y = np.arange(5.0) * u.km
+
+        # -----------------
+        # sets the axis units from the first Quantities, no copy
+        args = strip_plot_args(ax, (x, y, "k-"))
+        assert ax.xaxis.units == u.s and ax.yaxis.units == u.km
+        assert isinstance(args[0], np.ndarray)
+        assert not isinstance(args[0], u.Quantity)
+        assert np.shares_memory(args[0], x)
+        assert args[2] == "k-"
+
+        # -----------------
+        # converts to the axis units
+        args = strip_plot_args(ax, (y.to(u.m),))
+        assert np.allclose(args[0], y.value)
+
+        args, kw = strip_args(
+            ax, (x,), {"y": y, "yerr": 1 * u.m}, ("x", "y", "yerr"), "xyy"
+        )
+        assert np.allclose(kw["yerr"], 1e-3)
+
+        # -----------------
+        # anything else is unchanged
+        assert to_axis_value(ax.xaxis, "a") == "a"
+
+        pyplot.close(fig)
+
+    return
+
+
+# /def
+
+###############################################################################
+### DONE
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_util
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+from matplotlib import pyplot
+
+## Project-Specific
+import starkplot as splt
+from starkplot._util import _cbark, _option_plan, _resolve_options
+
+
+#############################################################################
+# Options
+
+
+def test_option_plan():
+
+    plan = _option_plan(("color", "title_size", "x"), ("color",), "title_")
+
+    # compatible options, then the prefixed overrides, un-prefixed
+    assert plan == (("color", "color"), ("title_size", "size"))
+
+    return
+
+
+# /def
+
+
+def test_resolve_options():
+
+    kw = {"fontsize": 8, "title_fontsize": 12, "other": 0, "title_pad": 1}
+    options = _resolve_options(kw, ("fontsize", "pad"), "title_")
+
+    # the prefixed overrides take precedence, other keys are dropped
+    assert options == {"fontsize": 12, "pad": 1}
+
+    # the key order doesn't matter, so the plan is reused
+    _option_plan.cache_clear()
+    _resolve_options(kw, ("fontsize", "pad"), "title_")
+    reordered = dict(reversed(list(kw.items())))
+    assert _resolve_options(reordered, ("fontsize", "pad"), "title_") == {
+        "fontsize": 12,
+        "pad": 1,
+    }
+    info = _option_plan.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    return
+
+
+# /def
+
+
+def test_colorbar_prefix():
+
+    options = _resolve_options(
+        {"pad": 0.1, "colorbar_orientation": "horizontal"}, _cbark, "colorbar_"
+    )
+    assert options == {"pad": 0.1, "orientation": "horizontal"}
+
+    # the override reaches the colorbar
+    fig = pyplot.figure()
+    splt.imshow(
+        np.arange(4.0).reshape(2, 2),
+        colorbar=True,
+        xkw={"colorbar_orientation": "horizontal"},
+    )
+    cax = fig.axes[-1].get_position()
+    assert cax.width > cax.height
+
+    pyplot.close(fig)
+
+    return
+
+
+# /def
+
+###############################################################################
+### DONE
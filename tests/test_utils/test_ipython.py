@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_ipython
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+
+# matplotlib
+from matplotlib import pyplot
+
+## Project-Specific
+import starkplot as splt
+from starkplot.utils import ipython
+
+
+##############################################################################
+### Tests
+
+
+def _figure(k=1):
+    fig = pyplot.figure()
+    x = np.linspace(0, 1, 50)
+    splt.plot(x, np.sin(k * x), title="t", xlabel="x")
+    return fig
+
+
+def test_render_throttle():
+    pyplot.close("all")
+    old = ipython.get_notebook_config()
+    try:
+        ipython.configure_notebook(format="png", max_pixels=1e5)
+        ipython.clear_figure_cache()
+
+        a, b = _figure(), _figure()
+        assert ipython.figure_signature(a) == ipython.figure_signature(b)
+        assert ipython.figure_signature(a) != ipython.figure_signature(
+            _figure(2)
+        )
+
+        # the re-made figure isn't re-rendered
+        data = ipython.render_figure(a)
+        assert ipython.render_figure(b) is data
+        assert ipython.figure_cache_info()["misses"] == 1
+
+        # at most max_pixels, displayed at the nominal size
+        png, metadata = data
+        width, height = np.frombuffer(png[16:24], dtype=">i4")
+        assert width * height <= 1e5
+        assert metadata["width"] > width
+    finally:
+        ipython.configure_notebook(**old)
+        ipython.clear_figure_cache()
+        pyplot.close("all")
+
+
+# /def
+
+
+def test_figure_signature_state():
+    pyplot.close("all")
+
+    def figure(clim=(0, 1), marker="o", fontsize=10):
+        fig = pyplot.figure()
+        x = np.linspace(0, 1, 10)
+        pyplot.scatter(x, x, c=x, vmin=clim[0], vmax=clim[1], marker=marker)
+        pyplot.xlabel("x", fontsize=fontsize)
+        return fig
+
+    # the norm's limits, the marker & the font are in the signature
+    signature = ipython.figure_signature(figure())
+    assert signature is not None
+    assert signature == ipython.figure_signature(figure())
+    assert signature != ipython.figure_signature(figure(clim=(0, 2)))
+    assert signature != ipython.figure_signature(figure(marker="s"))
+    assert signature != ipython.figure_signature(figure(fontsize=12))
+
+    pyplot.close("all")
+
+
+# /def
+
+##############################################################################
+# END
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_objrecord
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import pickle
+
+import numpy as np
+
+## Project-Specific
+from starkplot.utils import ObjDict, ObjRecord, ObjRecordArray
+
+
+#############################################################################
+# ObjRecord
+
+
+def test_objrecord_from_objdict():
+
+    od = ObjDict("panel", x=1, y=2.0, label="a")
+    rec = ObjRecord.from_objdict(od)
+
+    # -----------------
+    # ObjDict API
+    assert rec.name == "panel"
+    assert rec.x == 1
+    assert rec["y"] == 2.0
+    assert rec[["x", "label"]] == [1, "a"]
+    assert rec.values("x", "y") == [1, 2.0]
+    assert dict(rec.items("label")) == {"label": "a"}
+    assert rec.subset("x") == {"x": 1}
+    assert rec.keyslist() == ["x", "y", "label"]
+
+    # -----------------
+    # frozen schema
+    rec.x = 5
+    assert rec.x == 5
+    try:
+        rec.z = 3
+    except AttributeError:  # as __slots__ classes
+        pass
+    else:
+        raise AssertionError("set an attribute outside the schema")
+    try:
+        rec["z"] = 3
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("set a key outside the schema")
+    assert getattr(rec, "z", None) is None
+
+    # -----------------
+    # same keys, same class, no instance dict
+    other = ObjRecord.from_objdict(ObjDict("other", x=0, y=0, label=""))
+    assert type(rec) is type(other)
+    assert not hasattr(rec, "__dict__")
+
+    return
+
+
+# /def
+
+
+def test_objrecord_pickle():
+
+    rec = ObjRecord.schema("a", "b")("name", 1, [2, 3])
+    new = pickle.loads(pickle.dumps(rec))
+
+    assert new == rec
+    assert new.name == "name"
+
+    return
+
+
+# /def
+
+
+#############################################################################
+# ObjRecordArray
+
+
+def test_objrecordarray_columns():
+
+    recs = [ObjDict(f"p{i}", x=i, y=2.0 * i, tag=f"t{i}") for i in range(5)]
+    arr = ObjRecordArray.from_records(recs)
+
+    # -----------------
+    # vectorized columns
+    assert np.all(arr.x == np.arange(5))
+    assert np.all(arr["y"] == 2.0 * np.arange(5))
+    assert arr.keyslist() == ["x", "y", "tag"]
+
+    # -----------------
+    # rows & slices
+    row = arr[2]
+    assert isinstance(row, ObjRecord)
+    assert row.name == "p2" and row.tag == "t2"
+    assert len(arr[arr.x > 2]) == 2
+
+    # -----------------
+    # frozen schema
+    arr.x = np.arange(5) + 1
+    assert np.all(arr.x == np.arange(1, 6))
+    try:
+        arr.z = 3
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("set an attribute outside the schema")
+
+    # -----------------
+    # pickling
+    new = pickle.loads(pickle.dumps(arr))
+    assert np.all(new.y == arr.y)
+    assert list(new.names) == list(arr.names)
+
+    return
+
+
+# /def
+
+###############################################################################
+### DONE
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_subplots
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+
+# matplotlib
+from matplotlib import pyplot
+
+## Project-Specific
+import starkplot as splt
+from starkplot.utils import small_multiples
+
+
+##############################################################################
+### Tests
+
+
+def test_small_multiples(tmp_path):
+    pyplot.close("all")
+    x = np.linspace(0, 1, 10)
+    datasets = [(x * i, x + i) for i in range(1, 6)]
+
+    fname = tmp_path / "grid.png"
+    fig, axs, results = small_multiples(
+        splt.plot, datasets, savefig=str(fname), closefig=True
+    )
+
+    # 5 panels on a 2x3 grid, the last cell unused
+    assert len(axs) == 6 and len(results) == 5
+    assert all(len(ax.lines) == 1 for ax in axs[:5])
+    assert not axs[5].axison
+
+    # the limits span all the datasets
+    for ax in axs[:5]:
+        assert ax.get_xlim() == (0, 5)
+        assert ax.get_ylim() == (1, 6)
+
+    assert fname.exists()
+    assert not pyplot.fignum_exists(fig.number)
+
+
+# /def
+
+
+def test_small_multiples_implicit_x():
+    pyplot.close("all")
+    datasets = [(np.arange(10.0) + 100 * i,) for i in range(4)]
+
+    fig, axs, _ = small_multiples(splt.plot, datasets)
+
+    # x isn't the y values, but shared across the panels
+    assert axs[0].get_xlim() == axs[-1].get_xlim()
+    assert axs[0].get_xlim()[1] < 100
+    assert axs[0].get_ylim()[1] > 300
+
+    pyplot.close("all")
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------------------
+#
+# TITLE   : test_vectorfield
+# AUTHOR  : Nathaniel Starkman
+# PROJECT : starkplot
+#
+# ----------------------------------------------------------------------------
+
+### Docstring and Metadata
+"""**DOCSTRING**
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+### IMPORTS
+
+## General
+import numpy as np
+from matplotlib import pyplot
+
+## Project-Specific
+from starkplot import _vectorfield
+from starkplot._plot import quiver, streamplot
+
+
+#############################################################################
+# Vector Fields
+
+
+def test_pool_blocks():
+
+    arr = np.arange(20.0).reshape(4, 5)
+    arr[0, 0] = np.nan
+
+    pooled = _vectorfield.pool_blocks(arr, (2, 2))
+    assert pooled.shape == (2, 3)
+    assert np.isclose(pooled[0, 0], np.mean([1, 5, 6]))  # NaN ignored
+    assert np.isclose(pooled[1, 2], np.mean([14, 19]))  # partial block
+
+    assert _vectorfield.pool_blocks(arr, (2, 2), trim=True).shape == (2, 2)
+
+
+# /def
+
+
+def test_quiver_subsample():
+
+    y, x = np.mgrid[0:1:300j, 0:2:600j]
+    u, v = -y, x
+
+    pyplot.figure(figsize=(4, 2), dpi=72)
+    q = quiver(x, y, u, v, subsample=True, spacing=10)
+    # the axes are ~ 250 x 100 points, so ~ 25 x 10 arrows
+    assert 100 <= q.N <= 600
+
+    q = quiver(x, y, u, v, subsample=(100, 200), pool=True)
+    assert q.N == 9
+    assert np.allclose(q.U[:3], -y[:100].mean())
+
+    q = quiver(x[::30, ::30], y[::30, ::30], u[::30, ::30], v[::30, ::30])
+    assert q.N == 200  # small fields are left alone
+    pyplot.close("all")
+
+
+# /def
+
+
+def test_streamplot_subsample():
+
+    y, x = np.mgrid[-1:1:500j, -1:1:500j]
+    u, v = -y, x
+
+    pyplot.figure(figsize=(2, 2), dpi=72)
+    kw = _vectorfield.subsample_stream(pyplot.gca(), x, y, u, v, density=10)
+    assert len(kw["x"]) < 500 and kw["u"].shape == (len(kw["y"]), len(kw["x"]))
+    assert np.all(np.asarray(kw["density"]) < 10)
+
+    streamplot(x, y, u, v, subsample=True)
+    pyplot.close("all")
+
+
+# /def
+
+
+##############################################################################
+# END